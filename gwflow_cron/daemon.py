@@ -0,0 +1,145 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("gwflow_ingest.daemon")
+
+
+def _isoformat(ts: float | None) -> str | None:
+    return datetime.fromtimestamp(ts, UTC).isoformat() if ts is not None else None
+
+
+class PhaseStatus:
+    """Run counters and timings for one ingest phase."""
+
+    def __init__(self, name: str, interval: float):
+        self.name = name
+        self.interval = interval
+        self.runs = 0
+        self.failures = 0
+        self.last_started: float | None = None
+        self.last_finished: float | None = None
+        self.last_duration: float | None = None
+        self.last_error: str | None = None
+        self.next_due = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "interval": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_started": _isoformat(self.last_started),
+            "last_finished": _isoformat(self.last_finished),
+            "last_duration": self.last_duration,
+            "last_error": self.last_error,
+        }
+
+
+class TransferBudget:
+    """Caps the files and bytes transferred by a phase over a rolling window of seconds.
+
+    Used in place of the per-run caps in daemon mode, where a phase runs many times an hour.
+    """
+
+    def __init__(self, max_files: int, max_bytes: int, window: float = 3600):
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.window = window
+        self._transfers: deque[tuple[float, int]] = deque()
+
+    def _expire(self, now: float) -> None:
+        while self._transfers and self._transfers[0][0] <= now - self.window:
+            self._transfers.popleft()
+
+    def exhausted(self, now: float | None = None) -> bool:
+        self._expire(time.monotonic() if now is None else now)
+        return len(self._transfers) >= self.max_files or sum(size for _, size in self._transfers) >= self.max_bytes
+
+    def spend(self, size: int, now: float | None = None) -> None:
+        """Record the transfer of one file of *size* bytes."""
+        self._transfers.append((time.monotonic() if now is None else now, size))
+
+
+class DaemonStatus:
+    """Thread-safe view of the daemon's phases, shared with the status endpoint."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.phases: dict[str, PhaseStatus] = {}
+        self._lock = threading.Lock()
+
+    def add_phase(self, name: str, interval: float) -> PhaseStatus:
+        with self._lock:
+            self.phases[name] = PhaseStatus(name, interval)
+            return self.phases[name]
+
+    def is_due(self, name: str, now: float) -> bool:
+        return now >= self.phases[name].next_due
+
+    def seconds_until_next(self, now: float) -> float:
+        with self._lock:
+            return max(0.0, min(p.next_due for p in self.phases.values()) - now)
+
+    def run_phase(self, name: str, func, *args, **kwargs) -> bool:
+        """Run func as the named phase, recording timings and any exception.
+
+        Exceptions are logged and recorded rather than raised so a failing phase
+        cannot take the daemon down. Returns True if the phase completed.
+        """
+        phase = self.phases[name]
+        started = time.time()
+        with self._lock:
+            phase.last_started = started
+        error = None
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            logger.exception("%s failed", name)
+            error = repr(e)
+        finished = time.time()
+        with self._lock:
+            phase.runs += 1
+            phase.last_finished = finished
+            phase.last_duration = finished - started
+            phase.last_error = error
+            if error is not None:
+                phase.failures += 1
+            phase.next_due = time.monotonic() + phase.interval
+        return error is None
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "started": _isoformat(self.started),
+                "uptime": time.time() - self.started,
+                "phases": {name: phase.as_dict() for name, phase in self.phases.items()},
+            }
+
+
+def start_status_server(status: DaemonStatus, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve the daemon status as JSON on GET /status from a background thread."""
+
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/status":
+                self.send_error(404)
+                return
+            body = json.dumps(status.as_dict()).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("status server: " + format, *args)
+
+    server = ThreadingHTTPServer((host, port), StatusHandler)
+    thread = threading.Thread(target=server.serve_forever, name="gwflow-status", daemon=True)
+    thread.start()
+    logger.info("Status endpoint listening on %s:%s", host, server.server_address[1])
+    return server
@@ -0,0 +1,214 @@
+import hashlib
+import logging
+import os
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+
+import settings
+
+logger = logging.getLogger("gwflow_ingest.download")
+
+_CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+@dataclass
+class TransferStats:
+    """Summary of a single completed transfer."""
+
+    dest: Path
+    total_bytes: int
+    resumed_from: int
+    elapsed: float
+    md5: str
+
+    @property
+    def transferred_bytes(self) -> int:
+        return self.total_bytes - self.resumed_from
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.transferred_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def part_path(dest: Path) -> Path:
+    """Return the in-progress path used while *dest* is being downloaded."""
+    return Path(str(dest) + ".part")
+
+
+def validator_path(dest: Path) -> Path:
+    """Return the path storing the ETag/Last-Modified of the response the ``.part`` of *dest* came from."""
+    return Path(str(dest) + ".part.validator")
+
+
+def _response_validator(resp) -> str | None:
+    # Weak ETags can't be used with If-Range, so fall back to Last-Modified for those
+    etag = resp.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return resp.headers.get("Last-Modified")
+
+
+def discard_part(dest: Path) -> None:
+    """Remove the ``.part`` file of *dest* and its stored validator, so the next download starts afresh."""
+    part_path(dest).unlink(missing_ok=True)
+    validator_path(dest).unlink(missing_ok=True)
+
+
+def _hash_existing(path: Path, chunk_size: int):
+    digest = hashlib.md5()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest
+
+
+def _resume_offset(resp, offset: int) -> int | None:
+    """Work out where the response body starts relative to the existing .part file.
+
+    A 206 whose Content-Range starts at *offset* continues the part file, and one that
+    covers the whole file is treated like a 200. Anything else that isn't a 206
+    (typically a 200 from a server that ignores Range, or a changed file with If-Range)
+    means the body is the whole file. Returns None for a 206 of any other range, whose
+    body can't be used.
+    """
+    if resp.status_code != 206:
+        return 0
+
+    match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+    if match is None:
+        return None
+
+    start, end, total = match.groups()
+    if offset and int(start) == offset:
+        return offset
+    if int(start) == 0 and total != "*" and int(end) + 1 == int(total):
+        return 0
+    return None
+
+
+class DownloadManager:
+    """Streams HTTP downloads to disk via a ``.part`` file that survives interrupted runs.
+
+    If a ``.part`` file is left behind by an earlier run, the download resumes from its
+    size with an HTTP ``Range`` request. The ETag (or Last-Modified) of the response the
+    part file came from is kept next to it and sent as ``If-Range``, so a file that has
+    changed since is sent whole rather than appended to the stale part. Servers that
+    ignore the range (plain 200), reject it (416) or answer with a different range cause
+    the part file to be discarded and the transfer restarted. The
+    md5 of the file is computed while streaming, and the transfer can be throttled to
+    ``max_bytes_per_second`` (0 disables the cap).
+    """
+
+    def __init__(
+        self,
+        chunk_size: int | None = None,
+        max_bytes_per_second: int | None = None,
+        timeout=(10, 300),
+        session: requests.Session | None = None,
+    ):
+        self.session = session or requests.Session()
+        self.chunk_size = chunk_size or settings.DOWNLOAD_CHUNK_SIZE
+        self.max_bytes_per_second = (
+            settings.DOWNLOAD_MAX_BYTES_PER_SECOND if max_bytes_per_second is None else max_bytes_per_second
+        )
+        self.timeout = timeout
+
+    def download(
+        self,
+        url: str,
+        dest: Path,
+        params: dict | None = None,
+        headers: dict | None = None,
+        check_response: Callable[[requests.Response], None] | None = None,
+    ) -> TransferStats:
+        """Download *url* to *dest*, resuming any existing ``.part`` file.
+
+        *check_response* is called with the response before any body is read and should
+        raise for unusable responses; by default ``raise_for_status`` is used. A 416 is
+        handled here and never reaches *check_response*. The ``.part`` file is left in
+        place when an exception escapes so that the next attempt can resume it.
+        """
+        dest = Path(dest)
+        part = part_path(dest)
+        offset = part.stat().st_size if part.exists() else 0
+
+        request_headers = dict(headers or {})
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+            if validator_path(dest).exists():
+                request_headers["If-Range"] = validator_path(dest).read_text()
+
+        start = time.monotonic()
+        with self.session.get(url, params=params, headers=request_headers, stream=True, timeout=self.timeout) as resp:
+            if offset and resp.status_code == 416:
+                logger.info("Server rejected resume of %s at byte %d, restarting", dest, offset)
+                discard_part(dest)
+                return self.download(url, dest, params=params, headers=headers, check_response=check_response)
+
+            if check_response is not None:
+                check_response(resp)
+            else:
+                resp.raise_for_status()
+
+            resumed_from = _resume_offset(resp, offset)
+            if resumed_from is None:
+                if not offset:
+                    raise requests.HTTPError(
+                        f"Partial response for {url} without a range request "
+                        f"(Content-Range: {resp.headers.get('Content-Range')})",
+                        response=resp,
+                    )
+                logger.info("Server answered resume of %s at byte %d with another range, restarting", dest, offset)
+                discard_part(dest)
+                return self.download(url, dest, params=params, headers=headers, check_response=check_response)
+
+            if offset and not resumed_from:
+                logger.info("Server ignored resume of %s at byte %d, restarting", dest, offset)
+
+            if not resumed_from:
+                validator = _response_validator(resp)
+                if validator:
+                    validator_path(dest).write_text(validator)
+                else:
+                    validator_path(dest).unlink(missing_ok=True)
+
+            digest = _hash_existing(part, self.chunk_size) if resumed_from else hashlib.md5()
+            written = 0
+            with part.open("ab" if resumed_from else "wb") as f:
+                for chunk in resp.iter_content(chunk_size=self.chunk_size):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    written += len(chunk)
+                    self._throttle(written, start)
+
+        os.replace(part, dest)
+        validator_path(dest).unlink(missing_ok=True)
+
+        stats = TransferStats(
+            dest=dest,
+            total_bytes=resumed_from + written,
+            resumed_from=resumed_from,
+            elapsed=time.monotonic() - start,
+            md5=digest.hexdigest(),
+        )
+        logger.info(
+            "Downloaded %s: %d bytes in %.1fs (%.2f MiB/s, resumed from byte %d)",
+            dest,
+            stats.transferred_bytes,
+            stats.elapsed,
+            stats.bytes_per_second / (1024 * 1024),
+            stats.resumed_from,
+        )
+        return stats
+
+    def _throttle(self, written: int, start: float) -> None:
+        if not self.max_bytes_per_second:
+            return
+        ahead = written / self.max_bytes_per_second - (time.monotonic() - start)
+        if ahead > 0:
+            time.sleep(ahead)
@@ -1,4 +1,3 @@
-import hashlib
 import logging
 from pathlib import Path
 
@@ -34,8 +33,8 @@ def fetch_to_staging(jc, rec, staging_dir=None) -> Path:
     streamed into staging_dir/<sname>/<analysis_uid>/<path sans leading '/'>.
     The sname/analysis_uid components are validated to be single path segments
     and the destination is containment-checked against the staging dir so a
-    crafted path cannot escape it. The md5 is verified when the record carries
-    a truthy md5_sum. ClusterOffline and FetchError raised by the controller
+    crafted path cannot escape it. The md5 computed while downloading is
+    verified when the record carries a truthy md5_sum. ClusterOffline and FetchError raised by the controller
     propagate untouched. On MD5Mismatch the staged file is removed so no bad
     file lingers.
     """
@@ -55,16 +54,11 @@ def fetch_to_staging(jc, rec, staging_dir=None) -> Path:
         raise FetchError(f"staged path escapes staging dir: {dest}")
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    jc.download(file_id, dest)
+    stats = jc.download(file_id, dest)
 
     md5_sum = _get(rec, "md5_sum")
-    if md5_sum:
-        digest = hashlib.md5()
-        with dest.open("rb") as f:
-            for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                digest.update(chunk)
-        if digest.hexdigest() != md5_sum:
-            dest.unlink(missing_ok=True)
-            raise MD5Mismatch(f"md5 mismatch for {remote}: expected {md5_sum}, got {digest.hexdigest()}")
+    if md5_sum and stats.md5 != md5_sum:
+        dest.unlink(missing_ok=True)
+        raise MD5Mismatch(f"md5 mismatch for {remote}: expected {md5_sum}, got {stats.md5}")
 
     return dest
@@ -4,8 +4,11 @@ import copy
 import fcntl
 import logging
 import shutil
+import signal
 import sqlite3
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +18,7 @@ import manifest
 import settings
 import state
 from bilby_children import find_bilby_pe_analyses, make_archive, resolve_event_id_for, synthesize_job_tree
+from daemon import DaemonStatus, TransferBudget, start_status_server
 from fetch import fetch_to_staging
 from job_controller import ClusterOffline, JobControllerClient
 from portal import PortalClient
@@ -75,6 +79,18 @@ def gwc_known_unpruned_snames(gwc_client: Any) -> set[str]:
     return snames
 
 
+def _cap_reached(files_done: int, bytes_done: int, budget: TransferBudget | None) -> bool:
+    if settings.BACKFILL:
+        return False
+    if budget is not None:
+        return budget.exhausted()
+    return files_done >= settings.MAX_FILES_PER_RUN or bytes_done >= settings.MAX_BYTES_PER_RUN
+
+
+def _backing_off(cur, retry_interval: float) -> set[str]:
+    return set(state.failures_since(cur, retry_interval)) if retry_interval else set()
+
+
 def phase_metadata(portal_client: Any = None, gwc_client: Any = None, con: sqlite3.Connection | None = None):
     logger.info("Starting phase_metadata")
 
@@ -183,7 +199,14 @@ def phase_bilby_children(
     gwc_client: Any = None,
     jc: Any = None,
     con: sqlite3.Connection | None = None,
+    budget: TransferBudget | None = None,
+    retry_interval: float = 0,
 ):
+    """Upload and link a bilby job for each bilby PE analysis of a changed or retried superevent.
+
+    Uploads are capped per run by MAX_FILES_PER_RUN/MAX_BYTES_PER_RUN, or by *budget* when
+    given. Keys that failed less than *retry_interval* seconds ago are left for a later run.
+    """
     if gwc_client is None or jc is None:
         logger.info("phase_bilby_children: clients not wired - skipping")
         return
@@ -203,13 +226,14 @@ def phase_bilby_children(
             portal_client = PortalClient(settings.CBCFLOW_PORTAL_URL, settings.CBCFLOW_PORTAL_TOKEN)
 
         over_retry = set(state.failures_over(cur, settings.MAX_RETRY_ATTEMPTS))
+        backing_off = _backing_off(cur, retry_interval)
         bytes_done = files_done = 0
 
         changed = set(state.get_changed_snames(cur))
         retry_snames = {
             key.split(":", 1)[1].split("/", 1)[0]
             for key in state.failures_under(cur, settings.MAX_RETRY_ATTEMPTS)
-            if key.startswith("bilby:")
+            if key.startswith("bilby:") and key not in backing_off
         }
         processing = sorted(changed | retry_snames)
 
@@ -245,7 +269,7 @@ def phase_bilby_children(
                 if uid in linked:
                     state.clear_failure(con, cur, fail_key)
                     continue
-                if fail_key in over_retry:
+                if fail_key in over_retry or fail_key in backing_off:
                     continue
 
                 state.ensure_pending(con, cur, fail_key)
@@ -266,9 +290,7 @@ def phase_bilby_children(
                             if f:
                                 results.append(fetch_to_staging(jc, rec_for(f, sname, uid)))
 
-                        if not settings.BACKFILL and (
-                            files_done >= settings.MAX_FILES_PER_RUN or bytes_done >= settings.MAX_BYTES_PER_RUN
-                        ):
+                        if _cap_reached(files_done, bytes_done, budget):
                             cap_reached = True
                             break
 
@@ -292,8 +314,11 @@ def phase_bilby_children(
                         except Exception:
                             logger.warning("event id link failed for %s", key)
 
-                        bytes_done += ini_path.stat().st_size + sum(r.stat().st_size for r in results)
+                        size = ini_path.stat().st_size + sum(r.stat().st_size for r in results)
+                        bytes_done += size
                         files_done += 1
+                        if budget is not None:
+                            budget.spend(size)
                         state.clear_failure(con, cur, fail_key)
                 except ClusterOffline:
                     logger.warning("cluster offline - deferring remaining analyses")
@@ -321,7 +346,18 @@ def phase_bilby_children(
             con.close()
 
 
-def phase_file_mirror(jc: Any = None, gwc_client: Any = None, con: sqlite3.Connection | None = None):
+def phase_file_mirror(
+    jc: Any = None,
+    gwc_client: Any = None,
+    con: sqlite3.Connection | None = None,
+    budget: TransferBudget | None = None,
+    retry_interval: float = 0,
+):
+    """Mirror the pending gwflow files from the cluster to GWCloud.
+
+    Transfers are capped per run by MAX_FILES_PER_RUN/MAX_BYTES_PER_RUN, or by *budget* when
+    given. Files that failed less than *retry_interval* seconds ago are left for a later run.
+    """
     if jc is None or gwc_client is None:
         logger.info("phase_file_mirror: clients not wired (B1) - skipping")
         return
@@ -339,15 +375,14 @@ def phase_file_mirror(jc: Any = None, gwc_client: Any = None, con: sqlite3.Conne
 
         queue = list(gwc_client.get_gwflow_pending_files())
         over_retry = set(state.failures_over(cur, settings.MAX_RETRY_ATTEMPTS))
+        backing_off = _backing_off(cur, retry_interval)
         bytes_done = files_done = 0
         for rec in queue:
-            if not settings.BACKFILL and (
-                files_done >= settings.MAX_FILES_PER_RUN or bytes_done >= settings.MAX_BYTES_PER_RUN
-            ):
+            if _cap_reached(files_done, bytes_done, budget):
                 break
             analysis_uid = _get(rec, "analysis_uid") or ""
             key = f"{_get(rec, 'sname')}/{analysis_uid}/{_get(rec, 'path')}"
-            if key in over_retry:
+            if key in over_retry or key in backing_off:
                 continue
             staged = None
             try:
@@ -357,6 +392,8 @@ def phase_file_mirror(jc: Any = None, gwc_client: Any = None, con: sqlite3.Conne
                 gwc_client.upload_gwflow_file(_get(rec, "id"), staged)
                 bytes_done += size
                 files_done += 1
+                if budget is not None:
+                    budget.spend(size)
                 state.clear_failure(con, cur, key)
             except ClusterOffline:
                 logger.warning("cluster offline - deferring remaining files")
@@ -373,9 +410,92 @@ def phase_file_mirror(jc: Any = None, gwc_client: Any = None, con: sqlite3.Conne
     logger.info("Completed phase_file_mirror")
 
 
+def run_daemon(
+    gwc_client: Any,
+    jc: Any,
+    con: sqlite3.Connection,
+    portal_client: Any = None,
+    stop_event: threading.Event | None = None,
+) -> DaemonStatus:
+    """Run the ingest phases on independent schedules until stop_event is set.
+
+    The clients and sqlite connection are created once and reused for every phase run.
+    phase_metadata runs every DAEMON_METADATA_INTERVAL seconds and phase_file_mirror
+    every DAEMON_MIRROR_INTERVAL seconds. phase_bilby_children runs straight after a
+    metadata run that recorded changed superevents, and otherwise every
+    DAEMON_CHILDREN_INTERVAL seconds to pick up retries. A failing phase is logged and
+    retried on its next slot rather than stopping the daemon.
+
+    Since the phases run far more often than an hourly cron run, failed keys are retried
+    every DAEMON_RETRY_INTERVAL seconds rather than on every run, and each transferring
+    phase is capped by DAEMON_MAX_FILES_PER_HOUR/DAEMON_MAX_BYTES_PER_HOUR over a rolling
+    hour rather than by the per-run caps.
+    """
+    if portal_client is None:
+        portal_client = PortalClient(settings.CBCFLOW_PORTAL_URL, settings.CBCFLOW_PORTAL_TOKEN)
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    status = DaemonStatus()
+    status.add_phase("metadata", settings.DAEMON_METADATA_INTERVAL)
+    status.add_phase("file_mirror", settings.DAEMON_MIRROR_INTERVAL)
+    status.add_phase("bilby_children", settings.DAEMON_CHILDREN_INTERVAL)
+
+    children_budget = TransferBudget(settings.DAEMON_MAX_FILES_PER_HOUR, settings.DAEMON_MAX_BYTES_PER_HOUR)
+    mirror_budget = TransferBudget(settings.DAEMON_MAX_FILES_PER_HOUR, settings.DAEMON_MAX_BYTES_PER_HOUR)
+
+    server = None
+    if settings.DAEMON_STATUS_PORT:
+        server = start_status_server(status, settings.DAEMON_STATUS_PORT, host=settings.DAEMON_STATUS_HOST)
+    try:
+        while not stop_event.is_set():
+            run_children = status.is_due("bilby_children", time.monotonic())
+
+            if status.is_due("metadata", time.monotonic()):
+                status.run_phase(
+                    "metadata", phase_metadata, portal_client=portal_client, gwc_client=gwc_client, con=con
+                )
+                run_children = run_children or bool(state.get_changed_snames(con.cursor()))
+
+            if run_children:
+                status.run_phase(
+                    "bilby_children",
+                    phase_bilby_children,
+                    portal_client=portal_client,
+                    gwc_client=gwc_client,
+                    jc=jc,
+                    con=con,
+                    budget=children_budget,
+                    retry_interval=settings.DAEMON_RETRY_INTERVAL,
+                )
+
+            if status.is_due("file_mirror", time.monotonic()):
+                status.run_phase(
+                    "file_mirror",
+                    phase_file_mirror,
+                    jc=jc,
+                    gwc_client=gwc_client,
+                    con=con,
+                    budget=mirror_budget,
+                    retry_interval=settings.DAEMON_RETRY_INTERVAL,
+                )
+
+            stop_event.wait(status.seconds_until_next(time.monotonic()))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    logger.info("gwflow_ingest daemon stopped")
+    return status
+
+
 def parse_args(args=None):
     parser = argparse.ArgumentParser(description="GWFlow ingest cron job")
     parser.add_argument("--backfill", action="store_true", help="Lift per-run caps for backfill mode")
+    parser.add_argument(
+        "--daemon", action="store_true", help="Keep running and schedule each phase independently instead of once"
+    )
     return parser.parse_args(args)
 
 
@@ -411,6 +531,15 @@ def run(args=None):
         con.row_factory = sqlite3.Row
         state.init_db(con)
 
+        if parsed.daemon:
+            logger.info("Running gwflow_ingest as a daemon")
+            stop_event = threading.Event()
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: stop_event.set())
+            run_daemon(gwc, jc, con, stop_event=stop_event)
+            con.close()
+            return 0
+
         phase_metadata(gwc_client=gwc, con=con)
         phase_file_mirror(jc=jc, gwc_client=gwc, con=con)
         phase_bilby_children(gwc_client=gwc, jc=jc, con=con)
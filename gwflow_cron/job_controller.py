@@ -1,11 +1,12 @@
 import logging
-import os
 from pathlib import Path
 from urllib.parse import urljoin
 
 import jwt
 import requests
 
+from download import DownloadManager, TransferStats, discard_part
+
 logger = logging.getLogger("gwflow_ingest.job_controller")
 
 
@@ -19,7 +20,13 @@ class FetchError(Exception):
 
 class JobControllerClient:
     def __init__(
-        self, api_url: str, jwt_secret: str, user_id: int = 0, cluster: str | None = None, bundle: str | None = None
+        self,
+        api_url: str,
+        jwt_secret: str,
+        user_id: int = 0,
+        cluster: str | None = None,
+        bundle: str | None = None,
+        downloader: DownloadManager | None = None,
     ):
         if not api_url or "://" not in api_url:
             raise ValueError("api_url must be a non-empty absolute URL")
@@ -30,6 +37,9 @@ class JobControllerClient:
         self.user_id = user_id
         self.cluster = cluster
         self.bundle = bundle
+        # A single session keeps connections to the controller alive between requests
+        self.session = requests.Session()
+        self.downloader = downloader or DownloadManager(session=self.session)
 
     def _mint_jwt(self) -> str:
         return jwt.encode({"userId": self.user_id}, self.jwt_secret, algorithm="HS256")
@@ -38,7 +48,7 @@ class JobControllerClient:
         url = urljoin(self.api_url, "file/")
         headers = {"Authorization": f"Bearer {self._mint_jwt()}"}
         body = {"cluster": self.cluster, "bundle": self.bundle, "paths": paths}
-        resp = requests.post(url, json=body, headers=headers, timeout=10)
+        resp = self.session.post(url, json=body, headers=headers, timeout=10)
         if resp.status_code != 200:
             raise FetchError(f"create_file_downloads failed with status {resp.status_code}: {resp.text}")
         try:
@@ -49,25 +59,29 @@ class JobControllerClient:
             raise FetchError(f"create_file_downloads returned malformed response: {resp.text}")
         return data["fileIds"]
 
-    def download(self, file_id: str, dest: Path) -> None:
+    def download(self, file_id: str, dest: Path) -> TransferStats:
+        """Download a file to dest, resuming a .part file left by an interrupted earlier attempt.
+
+        The .part file is kept when the cluster is offline or the connection drops so the
+        next run can resume it, and removed when the controller rejects the download.
+        """
         url = urljoin(self.api_url, "file/")
         headers = {"Authorization": f"Bearer {self._mint_jwt()}"}
-        part = str(dest) + ".part"
         try:
-            with requests.get(url, params={"fileId": file_id}, headers=headers, stream=True, timeout=(10, 300)) as resp:
-                if resp.status_code == 503:
-                    raise ClusterOffline(f"cluster offline (HTTP {resp.status_code}): {resp.text}")
-                if resp.status_code != 200:
-                    raise FetchError(f"download failed with status {resp.status_code}: {resp.text}")
-                with open(part, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                        f.write(chunk)
-            os.replace(part, dest)
-        except Exception:
-            if os.path.exists(part):
-                os.remove(part)
+            return self.downloader.download(
+                url, dest, params={"fileId": file_id}, headers=headers, check_response=self._check_download_response
+            )
+        except FetchError:
+            discard_part(dest)
             raise
 
+    @staticmethod
+    def _check_download_response(resp) -> None:
+        if resp.status_code == 503:
+            raise ClusterOffline(f"cluster offline (HTTP {resp.status_code}): {resp.text}")
+        if resp.status_code not in (200, 206):
+            raise FetchError(f"download failed with status {resp.status_code}: {resp.text}")
+
     def map_remote_path(self, path: str) -> str:
         if not isinstance(path, str):
             raise FetchError(f"unsafe remote path {path!r}: not a string")
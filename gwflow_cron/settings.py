@@ -44,6 +44,25 @@ except ImportError:
 
 BACKFILL = False
 
+# Download tuning for job controller transfers. A cap of 0 means unlimited bandwidth.
+DOWNLOAD_CHUNK_SIZE = int(os.getenv("DOWNLOAD_CHUNK_SIZE", str(1024 * 1024)))
+DOWNLOAD_MAX_BYTES_PER_SECOND = int(os.getenv("DOWNLOAD_MAX_BYTES_PER_SECOND", "0"))
+
+# Schedules (in seconds) for --daemon mode, and the address of its status endpoint. The endpoint is disabled unless
+# a port is set, and only listens on localhost unless a host is set
+DAEMON_METADATA_INTERVAL = float(os.getenv("DAEMON_METADATA_INTERVAL", "60"))
+DAEMON_MIRROR_INTERVAL = float(os.getenv("DAEMON_MIRROR_INTERVAL", "30"))
+DAEMON_CHILDREN_INTERVAL = float(os.getenv("DAEMON_CHILDREN_INTERVAL", "600"))
+DAEMON_STATUS_HOST = os.getenv("DAEMON_STATUS_HOST", "127.0.0.1")
+DAEMON_STATUS_PORT = int(os.getenv("DAEMON_STATUS_PORT", "0"))
+
+# The per-run caps above assume an hourly cron run. In --daemon mode the phases run every few seconds, so failed keys
+# are only retried once DAEMON_RETRY_INTERVAL seconds have passed since their last failure (MAX_RETRY_ATTEMPTS still
+# applies), and transfers are capped per rolling hour instead of per run
+DAEMON_RETRY_INTERVAL = float(os.getenv("DAEMON_RETRY_INTERVAL", "3600"))
+DAEMON_MAX_FILES_PER_HOUR = int(os.getenv("DAEMON_MAX_FILES_PER_HOUR", str(MAX_FILES_PER_RUN)))
+DAEMON_MAX_BYTES_PER_HOUR = int(os.getenv("DAEMON_MAX_BYTES_PER_HOUR", str(MAX_BYTES_PER_RUN)))
+
 
 def validate_settings():
     """Verify essential settings and exit if any required setting is unset."""
@@ -104,6 +104,14 @@ def failures_under(cur, cap: int) -> list[str]:
     return [row["job_id"] for row in rows]
 
 
+def failures_since(cur, seconds: float) -> list[str]:
+    """Return the keys whose last failure was less than *seconds* ago."""
+    rows = cur.execute(
+        "SELECT job_id FROM job_errors WHERE last_failure > datetime('now', ?)", (f"-{int(seconds)} seconds",)
+    ).fetchall()
+    return [row["job_id"] for row in rows]
+
+
 def ensure_pending(con, cur, job_id: str):
     """Create a pending marker row without touching an existing row's failure_count."""
     cur.execute(
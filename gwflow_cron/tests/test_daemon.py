@@ -0,0 +1,188 @@
+import json
+import tempfile
+import threading
+import unittest
+import urllib.request
+from unittest.mock import ANY, MagicMock, patch
+
+import gwflow_ingest
+import settings
+import state
+from daemon import DaemonStatus, TransferBudget, start_status_server
+from tests.base import GWFlowTestBase
+
+
+class TestDaemonStatus(unittest.TestCase):
+    def test_run_phase_records_success(self):
+        status = DaemonStatus()
+        status.add_phase("metadata", 60)
+        func = MagicMock()
+
+        self.assertTrue(status.run_phase("metadata", func, 1, con="c"))
+
+        func.assert_called_once_with(1, con="c")
+        phase = status.as_dict()["phases"]["metadata"]
+        self.assertEqual(phase["runs"], 1)
+        self.assertEqual(phase["failures"], 0)
+        self.assertIsNone(phase["last_error"])
+        self.assertIsNotNone(phase["last_finished"])
+
+    def test_run_phase_records_failure_without_raising(self):
+        status = DaemonStatus()
+        status.add_phase("metadata", 60)
+
+        with self.assertLogs("gwflow_ingest.daemon", level="ERROR"):
+            ok = status.run_phase("metadata", MagicMock(side_effect=RuntimeError("portal down")))
+
+        self.assertFalse(ok)
+        phase = status.as_dict()["phases"]["metadata"]
+        self.assertEqual(phase["runs"], 1)
+        self.assertEqual(phase["failures"], 1)
+        self.assertIn("portal down", phase["last_error"])
+
+    def test_phase_is_not_due_again_until_interval_elapses(self):
+        status = DaemonStatus()
+        status.add_phase("metadata", 60)
+        self.assertTrue(status.is_due("metadata", 0))
+
+        status.run_phase("metadata", MagicMock())
+
+        next_due = status.phases["metadata"].next_due
+        self.assertFalse(status.is_due("metadata", next_due - 1))
+        self.assertTrue(status.is_due("metadata", next_due))
+
+    def test_status_server_listens_on_localhost_by_default(self):
+        server = start_status_server(DaemonStatus(), 0)
+        try:
+            self.assertEqual(server.server_address[0], "127.0.0.1")
+        finally:
+            server.server_close()
+
+    def test_status_server_serves_json(self):
+        status = DaemonStatus()
+        status.add_phase("file_mirror", 30)
+        server = start_status_server(status, 0, host="127.0.0.1")
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/status") as resp:
+                body = json.loads(resp.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertIn("uptime", body)
+        self.assertEqual(body["phases"]["file_mirror"]["interval"], 30)
+
+
+class TestTransferBudget(unittest.TestCase):
+    def test_caps_files_over_window(self):
+        budget = TransferBudget(max_files=2, max_bytes=100, window=60)
+        budget.spend(1, now=0)
+        self.assertFalse(budget.exhausted(now=1))
+        budget.spend(1, now=10)
+        self.assertTrue(budget.exhausted(now=11))
+
+        # The first transfer drops out of the window
+        self.assertFalse(budget.exhausted(now=60))
+
+    def test_caps_bytes_over_window(self):
+        budget = TransferBudget(max_files=10, max_bytes=100, window=60)
+        budget.spend(100, now=0)
+        self.assertTrue(budget.exhausted(now=59))
+        self.assertFalse(budget.exhausted(now=60))
+
+
+class TestRunDaemon(GWFlowTestBase):
+    def setUp(self):
+        super().setUp()
+        self.settings_patch = patch.multiple(
+            settings,
+            DAEMON_STATUS_PORT=0,
+            DAEMON_METADATA_INTERVAL=60,
+            DAEMON_MIRROR_INTERVAL=30,
+            DAEMON_CHILDREN_INTERVAL=600,
+            DAEMON_RETRY_INTERVAL=3600,
+        )
+        self.settings_patch.start()
+        self.addCleanup(self.settings_patch.stop)
+
+    def test_runs_each_phase_once_with_shared_clients(self):
+        stop_event = threading.Event()
+        gwc, jc, portal = MagicMock(), MagicMock(), MagicMock()
+
+        with (
+            patch("gwflow_ingest.phase_metadata") as meta,
+            patch("gwflow_ingest.phase_bilby_children") as children,
+            patch("gwflow_ingest.phase_file_mirror", side_effect=lambda **kw: stop_event.set()) as mirror,
+        ):
+            status = gwflow_ingest.run_daemon(gwc, jc, self.con, portal_client=portal, stop_event=stop_event)
+
+        meta.assert_called_once_with(portal_client=portal, gwc_client=gwc, con=self.con)
+        children.assert_called_once_with(
+            portal_client=portal, gwc_client=gwc, jc=jc, con=self.con, budget=ANY, retry_interval=3600
+        )
+        mirror.assert_called_once_with(jc=jc, gwc_client=gwc, con=self.con, budget=ANY, retry_interval=3600)
+        self.assertIsInstance(mirror.call_args.kwargs["budget"], TransferBudget)
+        self.assertIsNot(mirror.call_args.kwargs["budget"], children.call_args.kwargs["budget"])
+        self.assertEqual(status.as_dict()["phases"]["metadata"]["runs"], 1)
+
+    def test_children_run_on_change_before_their_interval(self):
+        stop_event = threading.Event()
+        runs = []
+
+        def fake_metadata(**kwargs):
+            runs.append("metadata")
+            state.record_changed_sname(self.con, self.con.cursor(), "S260101a")
+
+        def fake_mirror(**kwargs):
+            runs.append("file_mirror")
+            if runs.count("file_mirror") == 2:
+                stop_event.set()
+
+        with (
+            patch("gwflow_ingest.phase_metadata", side_effect=fake_metadata),
+            patch("gwflow_ingest.phase_bilby_children", side_effect=lambda **kw: runs.append("children")),
+            patch("gwflow_ingest.phase_file_mirror", side_effect=fake_mirror),
+            patch.multiple(settings, DAEMON_METADATA_INTERVAL=0, DAEMON_MIRROR_INTERVAL=0),
+        ):
+            gwflow_ingest.run_daemon(
+                MagicMock(), MagicMock(), self.con, portal_client=MagicMock(), stop_event=stop_event
+            )
+
+        # On the second pass metadata is due again and records a change, so children run
+        # even though the 600s children interval has not elapsed.
+        self.assertEqual(runs, ["metadata", "children", "file_mirror", "metadata", "children", "file_mirror"])
+
+    def test_failing_phase_does_not_stop_daemon(self):
+        stop_event = threading.Event()
+
+        with (
+            patch("gwflow_ingest.phase_metadata", side_effect=RuntimeError("portal down")),
+            patch("gwflow_ingest.phase_bilby_children"),
+            patch("gwflow_ingest.phase_file_mirror", side_effect=lambda **kw: stop_event.set()) as mirror,
+            self.assertLogs("gwflow_ingest.daemon", level="ERROR"),
+        ):
+            status = gwflow_ingest.run_daemon(
+                MagicMock(), MagicMock(), self.con, portal_client=MagicMock(), stop_event=stop_event
+            )
+
+        mirror.assert_called_once()
+        self.assertEqual(status.as_dict()["phases"]["metadata"]["failures"], 1)
+
+    @patch("gwflow_ingest.run_daemon")
+    @patch("gwflow_ingest.phase_metadata")
+    @patch("gwflow_ingest.JobControllerClient")
+    @patch("gwflow_ingest.GWCloud")
+    def test_run_with_daemon_flag_hands_clients_to_daemon(self, mock_gwc_cls, mock_jc_cls, mock_meta, mock_daemon):
+        with (
+            tempfile.NamedTemporaryFile(suffix=".db") as tmp,
+            patch.object(settings, "DB_PATH", tmp.name),
+            patch("gwflow_ingest.signal.signal"),
+        ):
+            self.assertEqual(gwflow_ingest.run(["--daemon"]), 0)
+
+        mock_meta.assert_not_called()
+        mock_daemon.assert_called_once()
+        self.assertIs(mock_daemon.call_args.args[0], mock_gwc_cls.return_value)
+        self.assertIs(mock_daemon.call_args.args[1], mock_jc_cls.return_value)
+        self.assertIsInstance(mock_daemon.call_args.kwargs["stop_event"], threading.Event)
@@ -0,0 +1,168 @@
+import hashlib
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import requests
+import responses
+
+from download import DownloadManager, part_path, validator_path
+
+URL = "https://files.example.com/result.hdf5"
+
+
+class TestDownloadManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dest = Path(self.tmp.name) / "result.hdf5"
+        self.manager = DownloadManager(chunk_size=4, max_bytes_per_second=0)
+
+    @responses.activate
+    def test_fresh_download_computes_md5_and_stats(self):
+        content = b"0123456789"
+        responses.add(responses.GET, URL, body=content, status=200)
+
+        stats = self.manager.download(URL, self.dest)
+
+        self.assertEqual(self.dest.read_bytes(), content)
+        self.assertFalse(part_path(self.dest).exists())
+        self.assertEqual(stats.md5, hashlib.md5(content).hexdigest())
+        self.assertEqual(stats.total_bytes, 10)
+        self.assertEqual(stats.resumed_from, 0)
+        self.assertEqual(stats.transferred_bytes, 10)
+        self.assertNotIn("Range", responses.calls[0].request.headers)
+
+    @responses.activate
+    def test_resume_appends_to_part_and_hashes_whole_file(self):
+        part_path(self.dest).write_bytes(b"01234")
+        responses.add(responses.GET, URL, body=b"56789", status=206, headers={"Content-Range": "bytes 5-9/10"})
+
+        stats = self.manager.download(URL, self.dest)
+
+        self.assertEqual(responses.calls[0].request.headers["Range"], "bytes=5-")
+        self.assertEqual(self.dest.read_bytes(), b"0123456789")
+        self.assertEqual(stats.md5, hashlib.md5(b"0123456789").hexdigest())
+        self.assertEqual(stats.resumed_from, 5)
+        self.assertEqual(stats.transferred_bytes, 5)
+
+    @responses.activate
+    def test_server_ignoring_range_restarts_from_zero(self):
+        part_path(self.dest).write_bytes(b"stale")
+        responses.add(responses.GET, URL, body=b"0123456789", status=200)
+
+        stats = self.manager.download(URL, self.dest)
+
+        self.assertEqual(self.dest.read_bytes(), b"0123456789")
+        self.assertEqual(stats.resumed_from, 0)
+
+    @responses.activate
+    def test_mismatched_content_range_restarts_from_zero(self):
+        part_path(self.dest).write_bytes(b"01234")
+        responses.add(responses.GET, URL, body=b"0123456789", status=206, headers={"Content-Range": "bytes 0-9/10"})
+
+        stats = self.manager.download(URL, self.dest)
+
+        self.assertEqual(self.dest.read_bytes(), b"0123456789")
+        self.assertEqual(stats.resumed_from, 0)
+
+    @responses.activate
+    def test_partial_content_at_another_offset_retries_without_range(self):
+        part_path(self.dest).write_bytes(b"01234")
+        responses.add(responses.GET, URL, body=b"3456789", status=206, headers={"Content-Range": "bytes 3-9/10"})
+        responses.add(responses.GET, URL, body=b"0123456789", status=200)
+
+        stats = self.manager.download(URL, self.dest)
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertNotIn("Range", responses.calls[1].request.headers)
+        self.assertEqual(self.dest.read_bytes(), b"0123456789")
+        self.assertEqual(stats.resumed_from, 0)
+
+    @responses.activate
+    def test_partial_content_without_range_request_raises(self):
+        responses.add(responses.GET, URL, body=b"01234", status=206, headers={"Content-Range": "bytes 0-4/10"})
+
+        with self.assertRaises(requests.HTTPError):
+            self.manager.download(URL, self.dest)
+
+        self.assertFalse(self.dest.exists())
+
+    @responses.activate
+    def test_validator_is_stored_and_sent_as_if_range(self):
+        responses.add(responses.GET, URL, body=b"0123456789", status=200, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, URL, body=b"56789", status=206, headers={"Content-Range": "bytes 5-9/10"})
+
+        with patch.object(self.manager, "_throttle", side_effect=[None, ConnectionError("dropped")]):
+            with self.assertRaises(ConnectionError):
+                self.manager.download(URL, self.dest)
+
+        self.assertEqual(validator_path(self.dest).read_text(), '"v1"')
+
+        part_path(self.dest).write_bytes(b"01234")
+        self.manager.download(URL, self.dest)
+
+        self.assertEqual(responses.calls[1].request.headers["If-Range"], '"v1"')
+        self.assertEqual(self.dest.read_bytes(), b"0123456789")
+        self.assertFalse(validator_path(self.dest).exists())
+
+    @responses.activate
+    def test_weak_etag_falls_back_to_last_modified(self):
+        part_path(self.dest).write_bytes(b"stale")
+        responses.add(
+            responses.GET,
+            URL,
+            body=b"0123456789",
+            status=200,
+            headers={"ETag": 'W/"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+
+        with patch.object(self.manager, "_throttle", side_effect=ConnectionError("dropped")):
+            with self.assertRaises(ConnectionError):
+                self.manager.download(URL, self.dest)
+
+        self.assertEqual(validator_path(self.dest).read_text(), "Wed, 01 Jan 2025 00:00:00 GMT")
+
+    @responses.activate
+    def test_unsatisfiable_range_discards_part_and_retries(self):
+        part_path(self.dest).write_bytes(b"0123456789extra")
+        responses.add(responses.GET, URL, status=416)
+        responses.add(responses.GET, URL, body=b"0123456789", status=200)
+
+        self.manager.download(URL, self.dest)
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertNotIn("Range", responses.calls[1].request.headers)
+        self.assertEqual(self.dest.read_bytes(), b"0123456789")
+
+    @responses.activate
+    def test_http_error_leaves_part_untouched(self):
+        part_path(self.dest).write_bytes(b"01234")
+        responses.add(responses.GET, URL, status=500)
+
+        with self.assertRaises(requests.HTTPError):
+            self.manager.download(URL, self.dest)
+
+        self.assertEqual(part_path(self.dest).read_bytes(), b"01234")
+        self.assertFalse(self.dest.exists())
+
+    @responses.activate
+    def test_bandwidth_cap_sleeps(self):
+        responses.add(responses.GET, URL, body=b"0" * 16, status=200)
+        manager = DownloadManager(chunk_size=4, max_bytes_per_second=4)
+
+        with patch("download.time.sleep") as sleep:
+            manager.download(URL, self.dest)
+
+        self.assertTrue(sleep.called)
+        self.assertTrue(all(c.args[0] > 0 for c in sleep.call_args_list))
+
+    @responses.activate
+    def test_no_sleep_without_bandwidth_cap(self):
+        responses.add(responses.GET, URL, body=b"0" * 16, status=200)
+
+        with patch("download.time.sleep") as sleep:
+            self.manager.download(URL, self.dest)
+
+        sleep.assert_not_called()
@@ -11,6 +11,7 @@ except ImportError:
 
 import settings
 import state
+from daemon import TransferBudget
 from fetch import MD5Mismatch
 from gwflow_ingest import phase_file_mirror
 from job_controller import ClusterOffline, FetchError
@@ -187,6 +188,45 @@ class TestFileMirrorPhase(GWFlowTestBase):
         mock_fetch.assert_not_called()
         gwc.upload_gwflow_file.assert_not_called()
 
+    def test_recent_failures_skipped_within_retry_interval(self):
+        gwc = MagicMock()
+        gwc.get_gwflow_pending_files.return_value = [make_rec()]
+        jc = MagicMock()
+        cur = self.con.cursor()
+        state.record_failure(self.con, cur, key_for(), "earlier failure")
+
+        with patch("gwflow_ingest.fetch_to_staging") as mock_fetch:
+            phase_file_mirror(jc=jc, gwc_client=gwc, con=self.con, retry_interval=3600)
+
+        mock_fetch.assert_not_called()
+
+        cur.execute("UPDATE job_errors SET last_failure = datetime('now', '-2 hours')")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            staged = make_staged(tmpdir)
+            with patch("gwflow_ingest.fetch_to_staging", return_value=staged):
+                phase_file_mirror(jc=jc, gwc_client=gwc, con=self.con, retry_interval=3600)
+
+        gwc.upload_gwflow_file.assert_called_once_with("f1", staged)
+
+    def test_budget_caps_across_runs(self):
+        gwc = MagicMock()
+        gwc.get_gwflow_pending_files.return_value = [make_rec(file_id=f"f{i}") for i in range(3)]
+        jc = MagicMock()
+        budget = TransferBudget(max_files=2, max_bytes=10**9)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            staged_files = [make_staged(tmpdir, f"s{i}.h5") for i in range(3)]
+            with (
+                patch.object(settings, "MAX_FILES_PER_RUN", 1),
+                patch("gwflow_ingest.fetch_to_staging", side_effect=staged_files),
+            ):
+                phase_file_mirror(jc=jc, gwc_client=gwc, con=self.con, budget=budget)
+                phase_file_mirror(jc=jc, gwc_client=gwc, con=self.con, budget=budget)
+
+        # The budget replaces the per-run cap, and is still spent on the second run
+        self.assertEqual(gwc.upload_gwflow_file.call_count, 2)
+
     def test_analysis_uid_none_uses_empty_key_and_uploads(self):
         rec = make_rec(analysis_uid=None)
         gwc = MagicMock()
@@ -132,13 +132,43 @@ class TestJobControllerClient(unittest.TestCase):
             self.assertFalse(Path(str(dest) + ".part").exists())
 
     @responses.activate
-    def test_download_removes_part_on_streaming_exception(self):
+    def test_download_keeps_part_on_streaming_exception_for_resume(self):
         responses.add(responses.GET, self._file_url("abc"), body=ExplodingReader(), status=200)
 
         with TemporaryDirectory() as tmp:
             dest = Path(tmp) / "result.hdf5"
             with self.assertRaises(requests.exceptions.RequestException):
                 self.client.download("abc", dest)
+            self.assertTrue(Path(str(dest) + ".part").exists())
+            self.assertFalse(dest.exists())
+
+    @responses.activate
+    def test_download_resumes_existing_part_file(self):
+        responses.add(
+            responses.GET,
+            self._file_url("abc"),
+            body=b"world",
+            status=206,
+            headers={"Content-Range": "bytes 6-10/11"},
+        )
+
+        with TemporaryDirectory() as tmp:
+            dest = Path(tmp) / "result.hdf5"
+            Path(str(dest) + ".part").write_bytes(b"hello ")
+            stats = self.client.download("abc", dest)
+            self.assertEqual(dest.read_bytes(), b"hello world")
+            self.assertEqual(stats.resumed_from, 6)
+        self.assertEqual(responses.calls[0].request.headers["Range"], "bytes=6-")
+
+    @responses.activate
+    def test_download_removes_stale_part_when_controller_rejects_download(self):
+        responses.add(responses.GET, self._file_url("abc"), status=404, body="file not found on controller")
+
+        with TemporaryDirectory() as tmp:
+            dest = Path(tmp) / "result.hdf5"
+            Path(str(dest) + ".part").write_bytes(b"stale")
+            with self.assertRaises(FetchError):
+                self.client.download("abc", dest)
             self.assertFalse(Path(str(dest) + ".part").exists())
 
     def test_map_remote_path_strips_cit_prefix_and_passes_others_through(self):
@@ -54,6 +54,18 @@ class TestFailuresUnder(GWFlowTestBase):
         self.assertEqual(sorted(state.failures_under(cur, cap=3)), ["one", "two", "zero"])
 
 
+class TestFailuresSince(GWFlowTestBase):
+    def test_returns_only_keys_that_failed_recently(self):
+        cur = self.con.cursor()
+        state.ensure_pending(self.con, cur, "pending")
+        state.record_failure(self.con, cur, "recent", "x")
+        state.record_failure(self.con, cur, "old", "x")
+        cur.execute("UPDATE job_errors SET last_failure = datetime('now', '-2 hours') WHERE job_id = 'old'")
+
+        self.assertEqual(state.failures_since(cur, 3600), ["recent"])
+        self.assertEqual(sorted(state.failures_since(cur, 3 * 3600)), ["old", "recent"])
+
+
 class TestEnsurePending(GWFlowTestBase):
     def test_creates_row_with_zero_failure_count(self):
         cur = self.con.cursor()
@@ -1,4 +1,6 @@
 import fcntl
+import hashlib
+import json
 import logging
 import os
 import re
@@ -35,6 +37,7 @@ except ImportError:
     ENDPOINT = os.getenv("ENDPOINT")
     DB_PATH = os.getenv("DB_PATH")
 
+ALLEVENTS_URL = "https://gwosc.org/eventapi/json/allevents"
 EVENTNAME_SEPARATOR = "--"
 LOCK_FILE_PATH = str(Path(DB_PATH).with_suffix(".lock")) if DB_PATH else None
 MAX_RETRY_ATTEMPTS = 24
@@ -83,6 +86,59 @@ def build_bilbyjob_name(event_name, config_name):
     return fix_job_name(f"{event_name}{EVENTNAME_SEPARATOR}{config_name}")
 
 
+def build_common_name_index(all_events):
+    """Group the event names in an allevents payload by their ``commonName``.
+
+    Returns a dict mapping each common name to the list of event names that
+    share it, in payload order.  Entries whose value is not a dict are skipped,
+    matching how the rest of the ingester treats malformed catalogue entries.
+    """
+    index = {}
+    for name, data in all_events.items():
+        if isinstance(data, dict):
+            index.setdefault(data.get("commonName"), []).append(name)
+    return index
+
+
+UPLOAD_EXTERNAL_JOBS_MUTATION = """
+    mutation UploadExternalBilbyJobs($input: UploadExternalBilbyJobsMutationInput!) {
+        uploadExternalBilbyJobs(input: $input) {
+            result {
+                jobId
+                error
+            }
+        }
+    }
+"""
+
+
+def upload_external_jobs(gwc, jobs):
+    """Upload several public external BilbyJobs to GWCloud in a single request.
+
+    *jobs* is a list of ``(name, description, ini_string, url, event_id)`` tuples, where
+    *event_id* is an event id string or ``None``.  Returns a list of dicts with ``job_id``
+    and ``error`` keys, one per input job and in the same order; exactly one of the two
+    is set for each job.
+
+    Raises :class:`GWDCUnknownException` if the request as a whole fails.
+    """
+    variables = {
+        "input": {
+            "jobs": [
+                {
+                    "details": {"name": name, "description": description, "private": False},
+                    "ini_file": ini_string,
+                    "result_url": url,
+                    "event_id": event_id,
+                }
+                for name, description, ini_string, url, event_id in jobs
+            ]
+        }
+    }
+    data = gwc.request(query=UPLOAD_EXTERNAL_JOBS_MUTATION, variables=variables)
+    return data["upload_external_bilby_jobs"]["result"]
+
+
 def create_table(cursor):
     cursor.execute(
         "CREATE TABLE IF NOT EXISTS completed_jobs (job_id TEXT PRIMARY KEY, success BOOLEAN, timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP, reason TEXT, reason_data TEXT, catalog_shortname TEXT, common_name TEXT, all_succeeded INT, none_succeeded INT, is_latest_version BOOLEAN)"
@@ -95,6 +151,17 @@ def create_job_errors_table(cursor):
     )
 
 
+def create_catalogue_cache_table(cursor):
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS catalogue_cache (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_hash TEXT, payload TEXT, fetched TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+
+
+def create_indexes(cursor):
+    cursor.execute("CREATE INDEX IF NOT EXISTS completed_jobs_common_name ON completed_jobs (common_name)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS job_errors_failure_count ON job_errors (failure_count)")
+
+
 def record_job_failure(con, cursor, job_id, error_msg):
     cursor.execute(
         "INSERT INTO job_errors (job_id, failure_count, last_failure, last_error) VALUES (?, 1, CURRENT_TIMESTAMP, ?) "
@@ -111,6 +178,59 @@ def get_job_failure_count(cursor, job_id):
     return row["failure_count"]
 
 
+def fetch_allevents(con, cursor):
+    """Fetch the GWOSC allevents catalogue, reusing the copy cached in sqlite when unchanged.
+
+    The request is made conditional on the ``ETag``/``Last-Modified`` values stored from
+    the previous run, so an unchanged catalogue costs a single ``304 Not Modified``
+    response. Any 200 response replaces the cached row, so that the latest validators
+    are sent next time. The sha256 of the body is stored alongside it, and only used to
+    log when a server that ignores the conditional headers sends an unchanged catalogue.
+
+    Returns the ``events`` dict of the catalogue (empty if the payload is malformed).
+    Exits with code 1 if the catalogue cannot be fetched.
+    """
+    cached = cursor.execute("SELECT * FROM catalogue_cache WHERE url = ?", (ALLEVENTS_URL,)).fetchone()
+
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        r = requests.get(ALLEVENTS_URL, headers=headers, timeout=30)
+    except requests.RequestException:
+        logger.critical("Unable to fetch allevents json (network error)")
+        sys.exit(1)
+
+    if r.status_code == 304 and cached is not None:
+        logger.info("allevents json not modified since last run, using cached copy")
+        payload = cached["payload"]
+    elif r.status_code != 200:
+        logger.critical(f"Unable to fetch allevents json (status: {r.status_code})")
+        sys.exit(1)
+    else:
+        payload = r.text
+        content_hash = hashlib.sha256(r.content).hexdigest()
+        if cached is not None and cached["content_hash"] == content_hash:
+            logger.info("allevents json unchanged since last run")
+        cursor.execute(
+            "INSERT INTO catalogue_cache (url, etag, last_modified, content_hash, payload, fetched) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP) "
+            "ON CONFLICT(url) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified, "
+            "content_hash = excluded.content_hash, payload = excluded.payload, fetched = excluded.fetched",
+            (ALLEVENTS_URL, r.headers.get("ETag"), r.headers.get("Last-Modified"), content_hash, payload),
+        )
+        con.commit()
+
+    allevents_payload = json.loads(payload)
+    if not isinstance(allevents_payload, dict):
+        return {}
+    events = allevents_payload.get("events")
+    return events if isinstance(events, dict) else {}
+
+
 def check_and_download():
     logger.info("==== gwosc_ingest cronjob %s ====", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     con = sqlite3.connect(DB_PATH)
@@ -118,6 +238,8 @@ def check_and_download():
     cur = con.cursor()
     create_table(cur)
     create_job_errors_table(cur)
+    create_catalogue_cache_table(cur)
+    create_indexes(cur)
 
     try:
         _check_and_download_inner(con, cur)
@@ -153,27 +275,28 @@ def _check_and_download_inner(con, cur):
         )
         con.commit()
 
-    gwc = GWCloud(GWCLOUD_TOKEN, endpoint=ENDPOINT)
-
     # Collect list of events from GWOSC
-    try:
-        r = requests.get("https://gwosc.org/eventapi/json/allevents", timeout=30)
-    except requests.RequestException:
-        logger.critical("Unable to fetch allevents json (network error)")
-        sys.exit(1)
-    if r.status_code != 200:
-        logger.critical(f"Unable to fetch allevents json (status: {r.status_code})")
-        sys.exit(1)
-
-    allevents_payload = r.json()
-    if not isinstance(allevents_payload, dict):
-        all_events = {}
-    else:
-        events = allevents_payload.get("events")
-        all_events = events if isinstance(events, dict) else {}
+    all_events = fetch_allevents(con, cur)
     gwosc_events = list(all_events)
+    common_name_index = build_common_name_index(all_events)
     logger.info("GWOSC events found: %s", len(gwosc_events))
 
+    # collect list of events from sqlite db
+    sqlite_rows = cur.execute("SELECT job_id FROM completed_jobs")
+    sqlite_events = {j["job_id"] for j in sqlite_rows.fetchall()}
+    logger.info("sqlite events found: %s", len(sqlite_events))
+
+    # Find non-matching dataset names
+    jobs_delta = [j for j in gwosc_events if j not in sqlite_events]
+    logger.info("Not matching events: %s", len(jobs_delta))
+
+    # Most runs have nothing new to ingest, so bail out before touching GWCloud at all
+    if not jobs_delta:
+        logger.info("Nothing to do 😊")
+        sys.exit(0)
+
+    gwc = GWCloud(GWCLOUD_TOKEN, endpoint=ENDPOINT)
+
     # Collect list of events from GWCloud
     full_gwcloud_events = [n.name for n in gwc.get_official_job_list()]
     # Only those which follow the format EVENT_NAME--RUN_TYPE are considered to have a valid EVENT_NAME
@@ -181,26 +304,12 @@ def _check_and_download_inner(con, cur):
         fix_job_name(n.split(EVENTNAME_SEPARATOR)[0]) for n in full_gwcloud_events if EVENTNAME_SEPARATOR in n
     }
     logger.info("GWCloud events found: %s", len(gwcloud_events))
+    logger.info("Potential bad runs found: %s", len(sqlite_events) - len(gwcloud_events))
 
     # fetch event_ids from gwcloud and turn them into a dict
     full_gwcloud_event_ids = gwc.get_all_event_ids()
     gwcloud_event_ids = {z.event_id: z for z in full_gwcloud_event_ids}
 
-    # collect list of events from sqlite db
-    sqlite_rows = cur.execute("SELECT * FROM completed_jobs")
-    sqlite_events = [j["job_id"] for j in sqlite_rows.fetchall()]
-
-    logger.info("sqlite events found: %s", len(sqlite_events))
-    logger.info("Potential bad runs found: %s", len(sqlite_events) - len(gwcloud_events))
-
-    # Find non-matching dataset names
-    jobs_delta = [j for j in gwosc_events if j not in sqlite_events]
-    logger.info("Not matching events: %s", len(jobs_delta))
-
-    if not jobs_delta:
-        logger.info("Nothing to do 😊")
-        sys.exit(0)
-
     for event_name in jobs_delta:
         event_data = all_events[event_name]
         # Check if this event has exceeded the maximum retry attempts
@@ -211,9 +320,7 @@ def _check_and_download_inner(con, cur):
             last_error = err_row["last_error"] if err_row else ""
             logger.error("%s has failed %s times, marking as permanently failed", event_name, failure_count)
             common_name = event_data.get("commonName", "") if isinstance(event_data, dict) else ""
-            shared_common_names = [
-                k for k, v in all_events.items() if isinstance(v, dict) and v.get("commonName") == common_name
-            ]
+            shared_common_names = common_name_index.get(common_name, [])
             is_latest_version = compute_is_latest_version(event_name, shared_common_names)
             save_sqlite_job(
                 event_name,
@@ -275,9 +382,7 @@ def _check_and_download_inner(con, cur):
             record_job_failure(con, cur, event_name, error_msg)
             continue
 
-        shared_common_names = [
-            k for k, v in all_events.items() if isinstance(v, dict) and v.get("commonName") == common_name
-        ]
+        shared_common_names = common_name_index.get(common_name, [])
         is_latest_version = compute_is_latest_version(event_name, shared_common_names)
 
         # Check if this should be skipped for being in the wrong type of catalog
@@ -375,6 +480,7 @@ def _check_and_download_inner(con, cur):
                 record_job_failure(con, cur, event_name, error_msg)
                 continue
             h5_iteration_error = False
+            jobs = []
             with h5_handle as h5:
                 logger.info("Found keys: %s", list(h5.keys()))
                 for toplevel_key in h5:
@@ -399,29 +505,42 @@ def _check_and_download_inner(con, cur):
                         h5_iteration_error = True
                         break
 
-                    try:
-                        job = gwc.upload_external_job(
+                    jobs.append(
+                        (
                             build_bilbyjob_name(event_name, toplevel_key),
                             toplevel_key,
-                            False,
                             ini_str,
                             h5url,
+                            event_id.event_id if event_id is not None else None,
                         )
-                        logger.info("BilbyJob %s created 😊", job.id)
-                        if event_id is not None:
-                            job.set_event_id(event_id)
-                            logger.info(" and set event_id to %s", event_id.event_id)
-                        else:
-                            logger.info(" and has no event_id")
-                        none_succeeded = False
-                    except GWDCUnknownException:
-                        all_succeeded = False
-                        # we don't just raise here as we want to potentially upload other jobs
-                        logger.exception("Failed to create BilbyJob 😠")
+                    )
 
             if h5_iteration_error:
                 continue
 
+            # Upload every config found in the h5 file in a single request
+            if jobs:
+                try:
+                    results = upload_external_jobs(gwc, jobs)
+                except GWDCUnknownException:
+                    all_succeeded = False
+                    logger.exception("Failed to create BilbyJobs 😠")
+                    results = []
+
+                for (job_name, *_), result in zip(jobs, results):
+                    if result["job_id"] is None:
+                        all_succeeded = False
+                        # we don't just stop here as the other jobs may have been uploaded
+                        logger.error("Failed to create BilbyJob %s 😠: %s", job_name, result["error"])
+                        continue
+
+                    logger.info("BilbyJob %s created 😊", result["job_id"])
+                    if event_id is not None:
+                        logger.info(" and set event_id to %s", event_id.event_id)
+                    else:
+                        logger.info(" and has no event_id")
+                    none_succeeded = False
+
         # If we've iterated all the potential BilbyJobs, save the info to the sqlite database
         #
         # The job is considered successful if _all_ of the bilby configs found were able
@@ -2,7 +2,7 @@ import logging
 import sqlite3
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import responses
 
@@ -47,6 +47,22 @@ class GWOSCTestBase(unittest.TestCase):
         self.con = sqlite3.connect(":memory:")
         self.con_patch = patch("sqlite3.connect", lambda x: _NonClosingConnection(self.con))
 
+        # Every batch upload succeeds unless a test overrides the side effect/return value
+        upload_patch = patch("gwosc_ingest.upload_external_jobs", side_effect=self._upload_success)
+        self.upload_external_jobs = upload_patch.start()
+        self.addCleanup(upload_patch.stop)
+
+    @staticmethod
+    def _upload_success(gwc, jobs):
+        return [{"job_id": f"QmlsYnlKb2JOb2RlOj{i}", "error": None} for i, _ in enumerate(jobs)]
+
+    # ---- upload assertion helpers -------------------------------------------
+
+    def assert_jobs_uploaded(self, jobs):
+        """Assert a single batch upload was made with *jobs* (a list of
+        ``(name, description, ini_string, url, event_id)`` tuples)."""
+        self.upload_external_jobs.assert_called_once_with(ANY, jobs)
+
     # ---- single-event helpers ------------------------------------------------
 
     def add_allevents_response(self, events=None):
@@ -0,0 +1,124 @@
+import logging
+import unittest
+
+import responses
+
+import gwosc_ingest
+from tests.base import GWOSCTestBase
+
+
+@unittest.mock.patch("gwosc_ingest.GWCloud", autospec=True)
+class TestCatalogueCache(GWOSCTestBase):
+    """Tests for the conditional allevents fetch and the sqlite catalogue cache."""
+
+    def add_allevents_with_etag(self, etag='"abc"'):
+        responses.add(
+            responses.GET,
+            gwosc_ingest.ALLEVENTS_URL,
+            json={
+                "events": {
+                    "GW000001_123456": {
+                        "commonName": "GW000001_123456",
+                        "catalog.shortName": "GWTC-3-confident",
+                        "jsonurl": "https://test.org/GW000001_123456.json",
+                    }
+                }
+            },
+            headers={"ETag": etag, "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+
+    def get_catalogue_cache(self):
+        return self.con.cursor().execute("SELECT * FROM catalogue_cache").fetchall()
+
+    @responses.activate
+    def test_first_fetch_stores_catalogue(self, gwc):
+        """A 200 response stores the ETag, Last-Modified, hash and payload for the next run."""
+        self.add_allevents_with_etag()
+        self.add_event_response()
+        self.add_file_response()
+
+        with self.con_patch:
+            gwosc_ingest.check_and_download()
+
+        rows = self.get_catalogue_cache()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["url"], gwosc_ingest.ALLEVENTS_URL)
+        self.assertEqual(rows[0]["etag"], '"abc"')
+        self.assertEqual(rows[0]["last_modified"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertIn("GW000001_123456", rows[0]["payload"])
+        self.assertEqual(len(rows[0]["content_hash"]), 64)
+        self.assertNotIn("If-None-Match", responses.calls[0].request.headers)
+
+    @responses.activate
+    def test_not_modified_is_a_no_op_without_gwcloud(self, gwc):
+        """When the catalogue is unchanged and fully ingested, only the conditional
+        request is made and GWCloud is never contacted."""
+        self.add_allevents_with_etag()
+        self.add_event_response()
+        self.add_file_response()
+
+        with self.con_patch:
+            gwosc_ingest.check_and_download()
+
+        responses.reset()
+        gwc.reset_mock()
+        responses.add(responses.GET, gwosc_ingest.ALLEVENTS_URL, status=304)
+
+        with (
+            self.con_patch,
+            self.assertRaises(SystemExit) as exit_ctx,
+            self.assertLogs(level=logging.INFO) as logs,
+        ):
+            gwosc_ingest.check_and_download()
+
+        self.assertEqual(exit_ctx.exception.code, 0)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(responses.calls[0].request.headers["If-None-Match"], '"abc"')
+        self.assertEqual(responses.calls[0].request.headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        gwc.assert_not_called()
+        self.assertIn("Nothing to do 😊", logs.output[-1])
+
+    @responses.activate
+    def test_not_modified_uses_cached_events(self, gwc):
+        """A 304 with events still pending processes them from the cached payload."""
+        self.add_allevents_with_etag()
+        self.add_event_response()
+        responses.add(responses.GET, "https://test.org/GW000001.h5", status=404)
+
+        with self.con_patch, self.assertLogs(level=logging.ERROR):
+            gwosc_ingest.check_and_download()
+
+        self.assertEqual(len(self.get_completed_jobs()), 0)
+
+        responses.reset()
+        responses.add(responses.GET, gwosc_ingest.ALLEVENTS_URL, status=304)
+        self.add_event_response()
+        self.add_file_response()
+
+        with self.con_patch:
+            gwosc_ingest.check_and_download()
+
+        rows = self.get_completed_jobs()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["job_id"], "GW000001_123456")
+        self.assertEqual(rows[0]["success"], 1)
+
+    @responses.activate
+    def test_changed_catalogue_replaces_cache(self, gwc):
+        """A new 200 response overwrites the cached ETag."""
+        self.add_allevents_with_etag('"abc"')
+        self.add_event_response()
+        self.add_file_response()
+
+        with self.con_patch:
+            gwosc_ingest.check_and_download()
+
+        responses.reset()
+        self.add_allevents_with_etag('"def"')
+
+        with self.con_patch, self.assertRaises(SystemExit):
+            gwosc_ingest.check_and_download()
+
+        rows = self.get_catalogue_cache()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["etag"], '"def"')
@@ -2,7 +2,7 @@ import logging
 import sqlite3
 import unittest
 from collections import namedtuple
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import h5py
 import requests
@@ -40,6 +40,78 @@ class TestComputeIsLatestVersion(unittest.TestCase):
         self.assertTrue(gwosc_ingest.compute_is_latest_version("GW150914_alt", names))
 
 
+class TestBuildCommonNameIndex(unittest.TestCase):
+    """Unit tests for build_common_name_index."""
+
+    def test_groups_versioned_names(self):
+        all_events = {
+            "GW150914-v1": {"commonName": "GW150914"},
+            "GW150914-v2": {"commonName": "GW150914"},
+            "GW151226-v1": {"commonName": "GW151226"},
+        }
+        self.assertEqual(
+            gwosc_ingest.build_common_name_index(all_events),
+            {"GW150914": ["GW150914-v1", "GW150914-v2"], "GW151226": ["GW151226-v1"]},
+        )
+
+    def test_skips_non_dict_entries(self):
+        all_events = {"GW150914-v1": {"commonName": "GW150914"}, "broken": None}
+        self.assertEqual(gwosc_ingest.build_common_name_index(all_events), {"GW150914": ["GW150914-v1"]})
+
+
+class TestUploadExternalJobs(unittest.TestCase):
+    """Unit tests for the batched upload_external_jobs request."""
+
+    def test_single_request_for_all_jobs(self):
+        gwc = MagicMock()
+        gwc.request.return_value = {
+            "upload_external_bilby_jobs": {
+                "result": [
+                    {"job_id": "QmlsYnlKb2JOb2RlOjE=", "error": None},
+                    {"job_id": None, "error": "Job name must not contain any spaces or special characters."},
+                ]
+            }
+        }
+
+        result = gwosc_ingest.upload_external_jobs(
+            gwc,
+            [
+                ("GW1--A", "A", "VALID=good", "https://test.org/1.h5", "GW000001_123456"),
+                ("GW1--B", "B", "VALID=good", "https://test.org/1.h5", None),
+            ],
+        )
+
+        gwc.request.assert_called_once()
+        jobs = gwc.request.call_args.kwargs["variables"]["input"]["jobs"]
+        self.assertEqual(
+            jobs[0],
+            {
+                "details": {"name": "GW1--A", "description": "A", "private": False},
+                "ini_file": "VALID=good",
+                "result_url": "https://test.org/1.h5",
+                "event_id": "GW000001_123456",
+            },
+        )
+        self.assertIsNone(jobs[1]["event_id"])
+        self.assertEqual(result[0]["job_id"], "QmlsYnlKb2JOb2RlOjE=")
+        self.assertIsNone(result[1]["job_id"])
+
+
+class TestCreateIndexes(unittest.TestCase):
+    def test_indexes_created_idempotently(self):
+        con = sqlite3.connect(":memory:")
+        cur = con.cursor()
+        gwosc_ingest.create_table(cur)
+        gwosc_ingest.create_job_errors_table(cur)
+        gwosc_ingest.create_indexes(cur)
+        gwosc_ingest.create_indexes(cur)
+
+        names = {row[0] for row in cur.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn("completed_jobs_common_name", names)
+        self.assertIn("job_errors_failure_count", names)
+        con.close()
+
+
 @unittest.mock.patch("gwosc_ingest.GWCloud", autospec=True)
 class TestGWOSCCron(GWOSCTestBase):
     @responses.activate
@@ -52,12 +124,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -80,7 +148,7 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -127,7 +195,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -175,7 +243,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -205,7 +273,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 0)
@@ -222,7 +290,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 0)
@@ -245,7 +313,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         # No completed_jobs row — transient failure
         sqlite_rows = self.get_completed_jobs()
@@ -276,7 +344,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         # No completed_jobs row — transient failure
         sqlite_rows = self.get_completed_jobs()
@@ -303,7 +371,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         # No completed_jobs row — transient failure
         sqlite_rows = self.get_completed_jobs()
@@ -324,20 +392,22 @@ class TestGWOSCCron(GWOSCTestBase):
         self.add_event_response()
         self.add_file_response()
 
+        gwc.return_value.create_event_id.return_value.event_id = "GW000001_123456"
+
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
-        )
-
         gwc.return_value.create_event_id.assert_called_once_with("GW000001_123456", 1729400000, "S123456z")
-        gwc.return_value.upload_external_job.return_value.set_event_id.assert_called_once_with(
-            gwc.return_value.create_event_id.return_value
+        self.assert_jobs_uploaded(
+            [
+                (
+                    "GW000001_123456--IMRPhenom",
+                    "IMRPhenom",
+                    "VALID=good",
+                    "https://test.org/GW000001.h5",
+                    "GW000001_123456",
+                )
+            ]
         )
 
     @responses.activate
@@ -354,16 +424,18 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
-        )
-
         gwc.return_value.create_event_id.assert_not_called()
-        gwc.return_value.upload_external_job.return_value.set_event_id.assert_called_once_with(specific_event_id)
+        self.assert_jobs_uploaded(
+            [
+                (
+                    "GW000001_123456--IMRPhenom",
+                    "IMRPhenom",
+                    "VALID=good",
+                    "https://test.org/GW000001.h5",
+                    "GW000001_123456",
+                )
+            ]
+        )
 
     @responses.activate
     def test_invalid_event_id(self, gwc):
@@ -408,16 +480,11 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", None)]
         )
 
         gwc.return_value.create_event_id.assert_not_called()
-        gwc.return_value.upload_external_job.return_value.set_event_id.assert_not_called()
 
     @responses.activate
     def test_dont_duplicate_jobs(self, gwc):
@@ -430,17 +497,14 @@ class TestGWOSCCron(GWOSCTestBase):
         self.add_event_response()
         self.add_file_response()
 
-        gwc.return_value.upload_external_job.side_effect = GWDCUnknownException("Duplicate job")
+        self.upload_external_jobs.side_effect = None
+        self.upload_external_jobs.return_value = [{"job_id": None, "error": "Duplicate job"}]
 
         with self.con_patch, self.assertLogs(level=logging.ERROR) as logs:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         # Event is NOT permanently closed — it should be retried
@@ -464,18 +528,18 @@ class TestGWOSCCron(GWOSCTestBase):
         self.add_event_response()
         self.add_file_response("multiple_configs.h5")
 
-        # First call succeeds, second raises
-        first_job = MagicMock()
-        first_job.id = 99
-        gwc.return_value.upload_external_job.side_effect = [
-            first_job,
-            GWDCUnknownException("second upload failed"),
+        # First job succeeds, second fails
+        self.upload_external_jobs.side_effect = None
+        self.upload_external_jobs.return_value = [
+            {"job_id": "QmlsYnlKb2JOb2RlOjk5", "error": None},
+            {"job_id": None, "error": "second upload failed"},
         ]
 
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        self.assertEqual(gwc.return_value.upload_external_job.call_count, 2)
+        self.upload_external_jobs.assert_called_once()
+        self.assertEqual(len(self.upload_external_jobs.call_args.args[1]), 2)
 
         # Partial success → permanently written to completed_jobs
         sqlite_rows = self.get_completed_jobs()
@@ -525,7 +589,7 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR), patch("h5py.File", return_value=mock_h5):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
         self.assertEqual(len(self.get_completed_jobs()), 0)
 
         error_rows = self.get_job_errors()
@@ -579,7 +643,7 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR), patch("h5py.File", return_value=mock_h5):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
         self.assertEqual(len(self.get_completed_jobs()), 0)
 
         error_rows = self.get_job_errors()
@@ -598,23 +662,24 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        calls = [
-            call(
-                "GW000001_123456--IMRPhenom",
-                "IMRPhenom",
-                False,
-                "VALID=good",
-                "https://test.org/GW000001.h5",
-            ),
-            call(
-                "GW000001_123456--IMRPhenom2ElectricBoogaloo",
-                "IMRPhenom2ElectricBoogaloo",
-                False,
-                "VALID=good",
-                "https://test.org/GW000001.h5",
-            ),
-        ]
-        gwc.return_value.upload_external_job.assert_has_calls(calls, any_order=True)
+        self.assert_jobs_uploaded(
+            [
+                (
+                    "GW000001_123456--IMRPhenom",
+                    "IMRPhenom",
+                    "VALID=good",
+                    "https://test.org/GW000001.h5",
+                    ANY,
+                ),
+                (
+                    "GW000001_123456--IMRPhenom2ElectricBoogaloo",
+                    "IMRPhenom2ElectricBoogaloo",
+                    "VALID=good",
+                    "https://test.org/GW000001.h5",
+                    ANY,
+                ),
+            ]
+        )
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -696,7 +761,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -725,12 +790,16 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom-Test-3",
-            "IMRPhenom:Test~3",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [
+                (
+                    "GW000001_123456--IMRPhenom-Test-3",
+                    "IMRPhenom:Test~3",
+                    "VALID=good",
+                    "https://test.org/GW000001.h5",
+                    ANY,
+                )
+            ]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -753,7 +822,7 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -805,12 +874,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001-123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001-123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -868,7 +933,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -949,7 +1014,7 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -965,12 +1030,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456-v2--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000002.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456-v2--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000002.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1047,35 +1108,27 @@ class TestGWOSCCron(GWOSCTestBase):
         self.add_file_response("good.h5", "GW000001.h5")
         self.add_file_response("good.h5", "GW000002.h5")
 
-        # First upload fails, second succeeds.
-        first_job = MagicMock()
-        first_job.id = 100
-        gwc.return_value.upload_external_job.side_effect = [
+        # First upload request fails, second succeeds.
+        self.upload_external_jobs.side_effect = [
             GWDCUnknownException("Duplicate job"),
-            first_job,
+            [{"job_id": "QmlsYnlKb2JOb2RlOjEwMA==", "error": None}],
         ]
 
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        # Both jobs should have been attempted
+        # Both events should have been attempted, one request each
         calls = [
             call(
-                "GW000001_123456--IMRPhenom",
-                "IMRPhenom",
-                False,
-                "VALID=good",
-                "https://test.org/GW000001.h5",
+                ANY,
+                [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)],
             ),
             call(
-                "GW000002_123456--IMRPhenom",
-                "IMRPhenom",
-                False,
-                "VALID=good",
-                "https://test.org/GW000002.h5",
+                ANY,
+                [("GW000002_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000002.h5", ANY)],
             ),
         ]
-        gwc.return_value.upload_external_job.assert_has_calls(calls, any_order=False)
+        self.upload_external_jobs.assert_has_calls(calls, any_order=False)
 
         # First event shouldn't be completed, it should be in job_errors
         sqlite_rows = self.get_completed_jobs()
@@ -1123,12 +1176,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1164,12 +1213,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1205,12 +1250,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1265,12 +1306,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1332,12 +1369,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1390,12 +1423,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000002_654321--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000002.h5",
+        self.assert_jobs_uploaded(
+            [("GW000002_654321--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000002.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1438,12 +1467,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         sqlite_rows = self.get_completed_jobs()
@@ -1476,7 +1501,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         self.assertEqual(cm.exception.code, 0)
         self.assertIn("Nothing to do 😊", logs.output[-1])
@@ -1505,12 +1530,8 @@ class TestGWOSCCron(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000001_123456--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000001.h5",
+        self.assert_jobs_uploaded(
+            [("GW000001_123456--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000001.h5", ANY)]
         )
 
         # The main-flow non-dict event is recorded for retry, the max_retries
@@ -1552,7 +1573,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         self.assertEqual(cm.exception.code, 0)
         self.assertIn("Nothing to do 😊", logs.output[-1])
@@ -1576,7 +1597,7 @@ class TestGWOSCCron(GWOSCTestBase):
         ):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         self.assertEqual(cm.exception.code, 0)
         self.assertIn("Nothing to do 😊", logs.output[-1])
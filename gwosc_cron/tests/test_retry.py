@@ -1,5 +1,6 @@
 import logging
 import unittest
+from unittest.mock import ANY
 
 import responses
 
@@ -23,7 +24,7 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         self.assertEqual(len(self.get_completed_jobs()), 0)
 
@@ -47,7 +48,7 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
         self.assertEqual(len(self.get_completed_jobs()), 0)
 
         error_rows = self.get_job_errors()
@@ -73,7 +74,7 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
         self.assertEqual(len(self.get_completed_jobs()), 0)
 
         error_rows = self.get_job_errors()
@@ -124,7 +125,7 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once()
+        self.upload_external_jobs.assert_called_once()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -142,7 +143,7 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -169,12 +170,8 @@ class TestRetryLogic(GWOSCTestBase):
             gwosc_ingest.check_and_download()
 
         # Second event should have been uploaded
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000002_654321--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000002.h5",
+        self.assert_jobs_uploaded(
+            [("GW000002_654321--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000002.h5", ANY)]
         )
 
         # First event: job_errors row, no completed_jobs
@@ -208,12 +205,8 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000002_654321--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000002.h5",
+        self.assert_jobs_uploaded(
+            [("GW000002_654321--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000002.h5", ANY)]
         )
 
         # First event: job_errors row
@@ -239,12 +232,8 @@ class TestRetryLogic(GWOSCTestBase):
             gwosc_ingest.check_and_download()
 
         # Second event uploaded
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000002_654321--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000002.h5",
+        self.assert_jobs_uploaded(
+            [("GW000002_654321--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000002.h5", ANY)]
         )
 
         # Both in completed_jobs
@@ -273,7 +262,7 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch:
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_called_once()
+        self.upload_external_jobs.assert_called_once()
 
         sqlite_rows = self.get_completed_jobs()
         self.assertEqual(len(sqlite_rows), 1)
@@ -297,7 +286,7 @@ class TestRetryLogic(GWOSCTestBase):
         with self.con_patch, self.assertLogs(level=logging.ERROR):
             gwosc_ingest.check_and_download()
 
-        gwc.return_value.upload_external_job.assert_not_called()
+        self.upload_external_jobs.assert_not_called()
 
         # No completed jobs
         self.assertEqual(len(self.get_completed_jobs()), 0)
@@ -349,12 +338,8 @@ class TestRetryLogic(GWOSCTestBase):
             gwosc_ingest.check_and_download()
 
         # Third event uploaded
-        gwc.return_value.upload_external_job.assert_called_once_with(
-            "GW000003_111111--IMRPhenom",
-            "IMRPhenom",
-            False,
-            "VALID=good",
-            "https://test.org/GW000003.h5",
+        self.assert_jobs_uploaded(
+            [("GW000003_111111--IMRPhenom", "IMRPhenom", "VALID=good", "https://test.org/GW000003.h5", ANY)]
         )
 
         # Completed jobs: first (broken) and third (success)
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from bilbyui.constants import BilbyJobType
+from bilbyui.models import BilbyJob
+from bilbyui.utils.job_archive import JOB_ARCHIVE_NAME
+
+
+class Command(BaseCommand):
+    help = "Delete the archive.tar.gz stored with each uploaded job, which is now generated when it is downloaded"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            default=False,
+            help="Report the archives that would be deleted without deleting them",
+        )
+
+    def handle(self, *_args, **options):
+        count = 0
+        size = 0
+        for job in BilbyJob.objects.filter(job_type=BilbyJobType.UPLOADED).only("id").iterator():
+            archive = Path(job.get_upload_directory()) / JOB_ARCHIVE_NAME
+            if not archive.is_file():
+                continue
+
+            count += 1
+            size += archive.stat().st_size
+
+            if not options["dry_run"]:
+                archive.unlink()
+
+        action = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(f"{action} {count} job archives ({size} bytes)"))
@@ -1,17 +1,25 @@
 import logging
 import urllib.parse
 
+import elasticsearch
 import requests
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from elasticsearch import helpers
 
-from bilbyui.models import BilbyJob, GWFlowJob
+from bilbyui.models import BilbyJob, ElasticSearchOutbox, GWFlowJob
+from bilbyui.utils.es_client import get_es_client, record_es_latency
+from bilbyui.utils.es_outbox import build_bilby_job_documents, enqueue_es_delete, enqueue_es_index_many
 from bilbyui.utils.gwflow_es import gwflow_elastic_search_update
 
 logger = logging.getLogger(__name__)
 
 HTTP_OK = 200
 
+# Bulk requests during a reindex are much larger than the searches the shared client's timeout is tuned for
+REINDEX_REQUEST_TIMEOUT = 120
+
 
 class Command(BaseCommand):
     help = "Ingest job details into Elasticsearch"
@@ -23,10 +31,50 @@ class Command(BaseCommand):
             default=False,
             help="Ingest gwflow superevent records from cbcflow portal",
         )
+        parser.add_argument(
+            "--reindex",
+            action="store_true",
+            default=False,
+            help="Rebuild the bilby job index from the stored ini key/values into a new index, then swap the alias",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Number of jobs to build documents for (with a single user lookup) at a time when reindexing",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of documents per bulk request when reindexing",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="Number of bulk requests to send in parallel when reindexing",
+        )
+        parser.add_argument(
+            "--delete-old",
+            action="store_true",
+            default=False,
+            help="Delete the indices the alias pointed to once a reindex has swapped it",
+        )
 
     def handle(self, *_args, **options):
+        if options.get("gwflow") and options.get("reindex"):
+            raise CommandError("--reindex can't be used with --gwflow")
+
         if options.get("gwflow"):
             self.handle_gwflow()
+        elif options.get("reindex"):
+            self.handle_reindex(
+                batch_size=options["batch_size"],
+                chunk_size=options["chunk_size"],
+                thread_count=options["threads"],
+                delete_old=options["delete_old"],
+            )
         else:
             self.handle_bilby()
 
@@ -50,6 +98,157 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS(f"\nIngestion complete: {success_count} succeeded, {error_count} failed"))
 
+    def handle_reindex(self, batch_size, chunk_size, thread_count, delete_old):
+        """
+        Rebuilds the bilby job index without saving any jobs
+
+        Documents are built from the existing IniKeyValue rows with one user lookup per batch of jobs, and sent with
+        parallel bulk requests to a new index named after ELASTIC_SEARCH_INDEX. Searches keep using the old index until
+        the ELASTIC_SEARCH_INDEX alias is swapped over to the new one in a single atomic request at the end. If anything
+        fails the alias is left alone, so the old index keeps serving searches and the new one can be inspected.
+
+        :param batch_size: The number of jobs to build documents for at a time
+        :param chunk_size: The number of documents per bulk request
+        :param thread_count: The number of bulk requests to send in parallel
+        :param delete_old: Whether to delete the indices the alias pointed to after swapping it
+        :return: Nothing
+        """
+        alias = settings.ELASTIC_SEARCH_INDEX
+        es = get_es_client().options(request_timeout=REINDEX_REQUEST_TIMEOUT)
+        started = timezone.now()
+        new_index = f"{alias}-{started:%Y%m%d%H%M%S}"
+
+        job_ids = list(BilbyJob.objects.order_by("id").values_list("id", flat=True))
+        self.stdout.write(f"Reindexing {len(job_ids)} bilby jobs into {new_index}...")
+
+        # Refreshing while bulk loading only slows the load down, the index is refreshed once before it goes live
+        es.indices.create(
+            index=new_index, mappings=self._get_mappings(es, alias), settings={"index": {"refresh_interval": "-1"}}
+        )
+
+        success_count = 0
+        skip_count = 0
+        error_count = 0
+
+        # Documents are built here rather than in a generator consumed by parallel_bulk's worker threads, so that the
+        # database is only used from this thread
+        for start in range(0, len(job_ids), batch_size):
+            batch = job_ids[start : start + batch_size]
+            success, documents = build_bilby_job_documents(batch)
+            if not success:
+                error_count += len(batch)
+                self.stdout.write(self.style.ERROR(f"✗ Jobs {batch[0]}-{batch[-1]}: error looking up users"))
+                continue
+
+            skip_count += len(batch) - len(documents)
+            actions = (
+                {"_op_type": "index", "_index": new_index, "_id": job_id, "_source": document}
+                for job_id, document in documents.items()
+            )
+
+            with record_es_latency("bulk", new_index):
+                for ok, item in helpers.parallel_bulk(
+                    es,
+                    actions,
+                    thread_count=thread_count,
+                    chunk_size=chunk_size,
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                ):
+                    if ok:
+                        success_count += 1
+                    else:
+                        error_count += 1
+                        result = next(iter(item.values()))
+                        logger.error("Job %s could not be indexed: %s", result.get("_id"), result.get("error"))
+                        self.stdout.write(self.style.ERROR(f"✗ Job {result.get('_id')}: {result.get('error')}"))
+
+            self.stdout.write(f"Indexed {start + len(batch)}/{len(job_ids)} jobs")
+
+        self.stdout.write(f"\nReindex complete: {success_count} succeeded, {skip_count} skipped, {error_count} failed")
+
+        if error_count:
+            raise CommandError(f"Not swapping the {alias} alias, {new_index} has been left in place for inspection")
+
+        es.indices.put_settings(index=new_index, settings={"index": {"refresh_interval": None}})
+        es.indices.refresh(index=new_index)
+
+        old_indices = self._swap_alias(es, alias, new_index)
+        self.stdout.write(self.style.SUCCESS(f"{alias} now points to {new_index}"))
+
+        self._catch_up(alias, started, set(job_ids))
+
+        if delete_old and old_indices:
+            es.indices.delete(index=",".join(old_indices))
+            self.stdout.write(f"Deleted {', '.join(old_indices)}")
+
+    def _get_mappings(self, es, alias):
+        """
+        Fetches the mappings of the index currently behind the alias, so the new index is created the same way
+
+        :param es: The elasticsearch client
+        :param alias: The alias (or, before the first reindex, the index) to copy the mappings of
+        :return: The mappings, or None if there is no existing index
+        """
+        try:
+            mappings = es.indices.get_mapping(index=alias)
+        except elasticsearch.NotFoundError:
+            return None
+
+        return next(iter(mappings.values()), {}).get("mappings")
+
+    def _swap_alias(self, es, alias, new_index):
+        """
+        Atomically points the alias at the new index
+
+        :param es: The elasticsearch client
+        :param alias: The name of the alias
+        :param new_index: The index the alias should point to
+        :return: The indices the alias pointed to before
+        """
+        actions = []
+        old_indices = []
+        if es.indices.exists_alias(name=alias):
+            old_indices = list(es.indices.get_alias(name=alias))
+            actions += [{"remove": {"index": index, "alias": alias}} for index in old_indices]
+        elif es.indices.exists(index=alias):
+            # Before the first reindex ELASTIC_SEARCH_INDEX is a concrete index, which has to be removed in the same
+            # request for the alias to take its name
+            self.stdout.write(self.style.WARNING(f"Replacing the {alias} index with an alias"))
+            actions.append({"remove_index": {"index": alias}})
+
+        actions.append({"add": {"index": new_index, "alias": alias}})
+        es.indices.update_aliases(actions=actions)
+
+        return old_indices
+
+    def _catch_up(self, alias, started, indexed_ids):
+        """
+        Queues writes for jobs changed while the reindex was running
+
+        Writes made during the reindex went to the old index through the alias, so jobs with writes queued in the
+        outbox since the reindex started are queued for reindexing and jobs deleted since are queued for removal. The
+        outbox keeps applied writes for ELASTIC_SEARCH_OUTBOX_RETENTION seconds, so these are found even if the
+        process_es_outbox worker has already applied them to the old index.
+
+        :param alias: The name of the alias
+        :param started: When the reindex started
+        :param indexed_ids: The ids of the jobs the reindex read
+        :return: Nothing
+        """
+        changed = ElasticSearchOutbox.objects.filter(index=alias, created__gte=started).values("doc_id")
+        updated_ids = list(BilbyJob.objects.filter(id__in=changed).order_by("id").values_list("id", flat=True))
+        enqueue_es_index_many(alias, updated_ids)
+
+        deleted_ids = indexed_ids - set(BilbyJob.objects.values_list("id", flat=True))
+        for job_id in sorted(deleted_ids):
+            enqueue_es_delete(alias, job_id)
+
+        if updated_ids or deleted_ids:
+            self.stdout.write(
+                f"Queued {len(updated_ids)} updates and {len(deleted_ids)} deletes for jobs changed during the reindex"
+            )
+
     def handle_gwflow(self):
         portal_url = getattr(settings, "CBCFLOW_PORTAL_URL", None)
         portal_token = getattr(settings, "CBCFLOW_PORTAL_TOKEN", None)
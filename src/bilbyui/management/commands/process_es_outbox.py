@@ -0,0 +1,94 @@
+import logging
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from bilbyui.models import ElasticSearchOutbox
+from bilbyui.utils.es_client import get_es_client
+from bilbyui.utils.es_outbox import drain_es_outbox
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Apply queued Elasticsearch writes from the ElasticSearchOutbox table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            default=False,
+            help="Drain the outbox once and exit instead of polling for new writes",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Maximum number of queued writes per bulk request (defaults to ELASTIC_SEARCH_OUTBOX_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=None,
+            help="Seconds to wait when the outbox is empty (defaults to ELASTIC_SEARCH_OUTBOX_POLL_INTERVAL)",
+        )
+        parser.add_argument(
+            "--replay-dead",
+            action="store_true",
+            default=False,
+            help="Queue the writes that were given up on after ELASTIC_SEARCH_OUTBOX_MAX_ATTEMPTS attempts again",
+        )
+
+    def handle(self, *_args, **options):
+        batch_size = options["batch_size"] or settings.ELASTIC_SEARCH_OUTBOX_BATCH_SIZE
+        poll_interval = (
+            options["poll_interval"]
+            if options["poll_interval"] is not None
+            else settings.ELASTIC_SEARCH_OUTBOX_POLL_INTERVAL
+        )
+
+        if options["replay_dead"]:
+            replayed = ElasticSearchOutbox.objects.filter(dead=True).update(dead=False, attempts=0)
+            self.stdout.write(f"Replaying {replayed} dead writes")
+
+        es = get_es_client()
+
+        self.stopping = False
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        total_processed = 0
+        total_failed = 0
+        backoff = poll_interval
+        while not self.stopping:
+            processed, failed = drain_es_outbox(es, batch_size)
+            total_processed += processed
+            total_failed += failed
+
+            if processed or failed:
+                logger.info("Applied %d queued elasticsearch writes, %d failed", processed, failed)
+
+            if options["once"]:
+                # Keep going while there is a full batch of work that is making progress
+                if processed + failed < batch_size or not processed:
+                    break
+            elif failed and not processed:
+                # Nothing could be applied, most likely because elasticsearch can't be reached, so back off
+                # exponentially rather than retrying every poll interval
+                time.sleep(backoff)
+                backoff = min(max(backoff * 2, 1), settings.ELASTIC_SEARCH_OUTBOX_MAX_BACKOFF)
+            else:
+                backoff = poll_interval
+                if processed + failed < batch_size or failed:
+                    # Wait for more writes when the outbox is drained, or before retrying the writes that failed
+                    time.sleep(poll_interval)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Outbox processing complete: {total_processed} applied, {total_failed} failed")
+        )
+
+    def stop(self, *_args):
+        self.stopping = True
@@ -0,0 +1,56 @@
+import logging
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from bilbyui.models import FileDownloadToken
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Delete expired FileDownloadTokens, which are otherwise ignored when looking up tokens"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            default=False,
+            help="Prune the expired tokens once and exit instead of pruning periodically",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Seconds between prunes (defaults to FILE_DOWNLOAD_TOKEN_PRUNE_INTERVAL)",
+        )
+
+    def handle(self, *_args, **options):
+        interval = (
+            options["interval"] if options["interval"] is not None else settings.FILE_DOWNLOAD_TOKEN_PRUNE_INTERVAL
+        )
+
+        self.stopping = False
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        total_pruned = 0
+        while not self.stopping:
+            pruned = FileDownloadToken.prune()
+            total_pruned += pruned
+            logger.info("Pruned %d expired file download tokens", pruned)
+
+            if options["once"]:
+                break
+
+            deadline = time.monotonic() + interval
+            while not self.stopping and time.monotonic() < deadline:
+                time.sleep(min(1, interval))
+
+        self.stdout.write(self.style.SUCCESS(f"File download token prune complete: {total_pruned} pruned"))
+
+    def stop(self, *_args):
+        self.stopping = True
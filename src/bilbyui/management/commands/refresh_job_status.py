@@ -0,0 +1,65 @@
+import logging
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from bilbyui.utils.jobs.refresh_job_status import refresh_job_statuses
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Update the status stored on each unfinished BilbyJob from the job controller"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            default=False,
+            help="Refresh the job statuses once and exit instead of sweeping periodically",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Number of jobs per job controller request (defaults to JOB_STATUS_REFRESH_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Seconds between sweeps (defaults to JOB_STATUS_REFRESH_INTERVAL)",
+        )
+
+    def handle(self, *_args, **options):
+        batch_size = options["batch_size"] or settings.JOB_STATUS_REFRESH_BATCH_SIZE
+        interval = options["interval"] if options["interval"] is not None else settings.JOB_STATUS_REFRESH_INTERVAL
+
+        self.stopping = False
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        total_checked = 0
+        total_updated = 0
+        while not self.stopping:
+            checked, updated = refresh_job_statuses(batch_size)
+            total_checked += checked
+            total_updated += updated
+            logger.info("Checked the status of %d jobs, %d changed", checked, updated)
+
+            if options["once"]:
+                break
+
+            deadline = time.monotonic() + interval
+            while not self.stopping and time.monotonic() < deadline:
+                time.sleep(min(1, interval))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Job status refresh complete: {total_checked} checked, {total_updated} updated")
+        )
+
+    def stop(self, *_args):
+        self.stopping = True
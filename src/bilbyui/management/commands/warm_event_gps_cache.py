@@ -0,0 +1,17 @@
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+from bilbyui.utils.event_gps import warm_event_gps_cache
+
+
+class Command(BaseCommand):
+    help = "Cache the GPS time of every event in the GWOSC allevents catalogue"
+
+    def handle(self, *_args, **options):
+        try:
+            count = warm_event_gps_cache()
+        except requests.RequestException as e:
+            msg = f"Unable to fetch the GWOSC allevents catalogue: {e}"
+            raise CommandError(msg) from e
+
+        self.stdout.write(self.style.SUCCESS(f"Cached the GPS times of {count} events"))
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+
+from bilbyui.utils.embargo import embargo_fields_from_ini_values
+
+
+def forward_populate_embargo_fields(apps, schema_editor):
+    BilbyJob = apps.get_model("bilbyui", "BilbyJob")
+    IniKeyValue = apps.get_model("bilbyui", "IniKeyValue")
+
+    trigger_times = dict(
+        IniKeyValue.objects.filter(key="trigger_time", processed=True).values_list("job_id", "value").iterator()
+    )
+    n_simulations = dict(
+        IniKeyValue.objects.filter(key="n_simulation", processed=False).values_list("job_id", "value").iterator()
+    )
+
+    jobs = []
+    for job in BilbyJob.objects.only("id").iterator():
+        job.trigger_time, job.is_simulated = embargo_fields_from_ini_values(
+            trigger_times.get(job.id), n_simulations.get(job.id)
+        )
+        jobs.append(job)
+
+    BilbyJob.objects.bulk_update(jobs, ["trigger_time", "is_simulated"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bilbyui", "0044_gwflow_portal_cache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bilbyjob",
+            name="trigger_time",
+            field=models.FloatField(blank=True, db_index=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="bilbyjob",
+            name="is_simulated",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(forward_populate_embargo_fields, reverse_code=migrations.RunPython.noop),
+    ]
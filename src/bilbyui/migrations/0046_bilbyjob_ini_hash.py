@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bilbyui", "0045_bilbyjob_trigger_time_is_simulated"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bilbyjob",
+            name="ini_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
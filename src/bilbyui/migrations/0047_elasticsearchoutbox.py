@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bilbyui", "0046_bilbyjob_ini_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ElasticSearchOutbox",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("index", models.CharField(max_length=255)),
+                ("doc_id", models.IntegerField()),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[("index", "Index"), ("update", "Update"), ("delete", "Delete")], max_length=10
+                    ),
+                ),
+                ("document", models.JSONField(blank=True, default=None, null=True)),
+                ("attempts", models.IntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [models.Index(fields=["index", "doc_id"], name="bilbyui_ela_index_6305ea_idx")],
+            },
+        ),
+    ]
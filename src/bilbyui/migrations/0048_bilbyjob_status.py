@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+from bilbyui.constants import BilbyJobType
+from bilbyui.status import JobStatus
+
+
+def forward_populate_uploaded_status(apps, schema_editor):
+    BilbyJob = apps.get_model("bilbyui", "BilbyJob")
+
+    # Uploaded and external jobs are always complete. Submitted jobs are filled in by the refresh_job_status command
+    BilbyJob.objects.filter(job_type__in=[BilbyJobType.UPLOADED, BilbyJobType.EXTERNAL]).update(
+        status=JobStatus.COMPLETED,
+        status_name=JobStatus.display_name(JobStatus.COMPLETED),
+        status_time=models.F("creation_time"),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bilbyui", "0047_elasticsearchoutbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bilbyjob",
+            name="status",
+            field=models.IntegerField(blank=True, db_index=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="bilbyjob",
+            name="status_name",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="bilbyjob",
+            name="status_time",
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.RunPython(forward_populate_uploaded_status, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bilbyui", "0048_bilbyjob_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="elasticsearchoutbox",
+            name="applied",
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="elasticsearchoutbox",
+            index=models.Index(fields=["applied", "id"], name="bilbyui_ela_applied_62a641_idx"),
+        ),
+    ]
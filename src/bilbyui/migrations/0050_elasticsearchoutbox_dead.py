@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bilbyui", "0049_elasticsearchoutbox_applied"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="elasticsearchoutbox",
+            name="dead",
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -1,13 +1,12 @@
-import contextlib
 import datetime
+import hashlib
 import json
 import uuid
 from pathlib import Path
 
-import elasticsearch
 from django.conf import settings
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_save, pre_delete
 from django.dispatch import receiver
@@ -16,6 +15,7 @@ from django.utils import timezone
 from bilbyui.utils.jobs.request_file_list import request_file_list
 
 from .constants import BILBY_JOB_TYPE_CHOICES, BilbyJobType
+from .status import JobStatus
 
 
 def _safe_json_loads(value):
@@ -36,8 +36,8 @@ class BilbyPermissionError(PermissionError):
         return self.message
 
 
-from .utils.auth.lookup_users import request_lookup_users
 from .utils.embargo import embargo_filter
+from .utils.es_outbox import enqueue_es_delete, enqueue_es_index, enqueue_es_index_many
 from .utils.gwflow_es import gwflow_elastic_search_remove
 from .utils.jobs.submit_job import submit_job
 from .utils.misc import is_ligo_user
@@ -96,8 +96,10 @@ class Label(models.Model):
 
 @receiver(post_save, sender=Label, dispatch_uid="label_save")
 def label_save(sender, instance, **kwargs):
-    for job in instance.bilbyjob_set.all():
-        job.elastic_search_update()
+    if getattr(settings, "IGNORE_ELASTIC_SEARCH", False):
+        return
+
+    enqueue_es_index_many(settings.ELASTIC_SEARCH_INDEX, instance.bilbyjob_set.values_list("id", flat=True))
 
 
 class EventID(models.Model):
@@ -165,8 +167,10 @@ class EventID(models.Model):
 
 @receiver(post_save, sender=EventID, dispatch_uid="event_id_save")
 def event_id_save(sender, instance, **kwargs):
-    for job in instance.bilbyjob_set.all():
-        job.elastic_search_update()
+    if getattr(settings, "IGNORE_ELASTIC_SEARCH", False):
+        return
+
+    enqueue_es_index_many(settings.ELASTIC_SEARCH_INDEX, instance.bilbyjob_set.values_list("id", flat=True))
 
 
 class BilbyJob(models.Model):
@@ -216,6 +220,22 @@ class BilbyJob(models.Model):
     # The type of job
     job_type = models.IntegerField(default=BilbyJobType.NORMAL, choices=BILBY_JOB_TYPE_CHOICES)
 
+    # sha256 of the ini_string the job's IniKeyValue rows were last generated from. Used by save to skip re-parsing the
+    # ini file when it hasn't changed
+    ini_hash = models.CharField(max_length=64, blank=True, default="")
+
+    # Denormalised from the job's IniKeyValue rows by parse_ini_file so that embargo_filter can filter on plain
+    # indexed columns. trigger_time is the processed GPS trigger time, is_simulated is set when n_simulation > 0
+    trigger_time = models.FloatField(default=None, blank=True, null=True, db_index=True)
+    is_simulated = models.BooleanField(default=False)
+
+    # The most recent status of the job, as derived from the job controller history by derive_job_status. Kept up to date
+    # by the refresh_job_status command so that listings don't need to ask the job controller about jobs that have
+    # finished. status is None until the job has been seen by the refresher
+    status = models.IntegerField(default=None, blank=True, null=True, db_index=True)
+    status_name = models.CharField(max_length=64, blank=True, default="")
+    status_time = models.DateTimeField(default=None, blank=True, null=True)
+
     # The cluster (as a string) that this job was submitted to. This is mainly used to track the cluster that the job
     # should be uploaded to once the supporting files are uploaded
     cluster = models.TextField(null=True)
@@ -345,17 +365,48 @@ class BilbyJob(models.Model):
         # Legacy or interrupted jobs may have NULL/empty ini_string; allow save but skip dependent updates
         has_ini = bool(self.ini_string and self.ini_string.strip())
 
-        super().save(*args, **kwargs)
+        # Only regenerate the ini k/v pairs if the ini_string has changed since they were last generated. Edits that
+        # don't touch the ini (name, privacy, labels etc) are then just a single UPDATE
+        ini_hash = hashlib.sha256(self.ini_string.encode("utf-8")).hexdigest() if has_ini else ""
+        update_fields = kwargs.get("update_fields")
+        ini_changed = ini_hash != self.ini_hash and (update_fields is None or "ini_string" in update_fields)
 
-        if not has_ini:
-            return
+        # Uploaded and external jobs are always complete
+        if self.job_type in (BilbyJobType.UPLOADED, BilbyJobType.EXTERNAL) and self.status is None:
+            self.status = JobStatus.COMPLETED
+            self.status_name = JobStatus.display_name(JobStatus.COMPLETED)
+            self.status_time = self.creation_time or timezone.now()
 
-        # Whenever a job is saved, we need to regenerate the ini k/v pairs
-        parse_ini_file(self)
+        # The job, its ini k/v pairs and the queued elastic search update are written in one transaction, so that the
+        # outbox never misses a saved change
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
-        # We also need to update our record in elastic search to keep the mysql database and elastic search database
-        # in sync
-        self.elastic_search_update()
+            if not has_ini:
+                return
+
+            if ini_changed:
+                parse_ini_file(self)
+
+                # Only record the hash once the k/v pairs have been successfully regenerated
+                self.ini_hash = ini_hash
+                BilbyJob.objects.filter(pk=self.pk).update(ini_hash=ini_hash)
+
+            # We also need to update our record in elastic search to keep the mysql database and elastic search
+            # database in sync
+            self.elastic_search_update()
+
+    def delete(self, *args, **kwargs):
+        # Queue the elastic search removal (from the pre_delete signal) in the same transaction as the delete
+        with transaction.atomic():
+            return super().delete(*args, **kwargs)
+
+    @property
+    def has_terminal_status(self):
+        """
+        If the persisted status is one the job will never leave, so that it doesn't need to be fetched again
+        """
+        return self.status is not None and JobStatus.is_terminal(self.status)
 
     def get_file_list(self, path="", recursive=True):
         return request_file_list(self, path, recursive)
@@ -384,7 +435,8 @@ class BilbyJob(models.Model):
 
     def elastic_search_update(self):
         """
-        Updates this bilby job entry in elastic search
+        Queues an update of this bilby job entry in elastic search. The document itself is built by the outbox worker
+        (see elastic_search_document) so that the user lookup and elastic search request happen off the request thread
         """
         if getattr(settings, "IGNORE_ELASTIC_SEARCH", False):
             return
@@ -392,22 +444,19 @@ class BilbyJob(models.Model):
         if not (self.ini_string and self.ini_string.strip()):
             return
 
-        es = elasticsearch.Elasticsearch(
-            hosts=[settings.ELASTIC_SEARCH_HOST],
-            api_key=settings.ELASTIC_SEARCH_API_KEY,
-            verify_certs=False,
-        )
+        enqueue_es_index(settings.ELASTIC_SEARCH_INDEX, self.id)
 
-        # Get the user details for this job
-        success, users = request_lookup_users([self.user.id])
-        if not success or not users:
-            return
-        user = users[0]
+    def elastic_search_document(self, user):
+        """
+        Generates the document for insertion or update in elastic search
 
-        # Generate the document for insertion or update in elastic search
+        :param user: The user details for this job's owner as returned by get_users
+        :return: The elastic search document for this job
+        """
         doc = {
             "user": {"name": user["name"]},
             "job": {
+                "id": self.id,
                 "name": self.name,
                 "description": self.description,
                 "creationTime": self.creation_time,
@@ -415,9 +464,9 @@ class BilbyJob(models.Model):
             },
             "labels": [{"name": label.name, "description": label.description} for label in self.labels.all()],
             "eventId": None,
-            "ini": {kv.key: _safe_json_loads(kv.value) for kv in self.inikeyvalue_set.filter(processed=False)},
-            "params": {kv.key: _safe_json_loads(kv.value) for kv in self.inikeyvalue_set.filter(processed=True)},
-            "_private_info_": {"userId": self.user.id, "private": self.private},
+            "ini": {kv.key: _safe_json_loads(kv.value) for kv in self.inikeyvalue_set.all() if not kv.processed},
+            "params": {kv.key: _safe_json_loads(kv.value) for kv in self.inikeyvalue_set.all() if kv.processed},
+            "_private_info_": {"userId": self.user_id, "private": self.private},
         }
 
         # Set the event id if one is set on the job
@@ -429,29 +478,16 @@ class BilbyJob(models.Model):
                 "gpsTime": self.event_id.gps_time,
             }
 
-        # First try to update the document in elastic search if it exists, otherwise insert the new document
-        try:
-            es.update(index=settings.ELASTIC_SEARCH_INDEX, id=self.id, doc=doc)
-        except elasticsearch.NotFoundError:
-            es.index(index=settings.ELASTIC_SEARCH_INDEX, id=self.id, document=doc)
+        return doc
 
     def elastic_search_remove(self):
         """
-        Deletes the elastic search record for this job
+        Queues deletion of the elastic search record for this job
         """
         if getattr(settings, "IGNORE_ELASTIC_SEARCH", False):
             return
 
-        es = elasticsearch.Elasticsearch(
-            hosts=[settings.ELASTIC_SEARCH_HOST],
-            api_key=settings.ELASTIC_SEARCH_API_KEY,
-            verify_certs=False,
-        )
-
-        # Swallow NotFoundError so deleting a job whose ES document is missing
-        # (e.g. a legacy job that was never indexed) doesn't abort the DB delete
-        with contextlib.suppress(elasticsearch.NotFoundError):
-            es.delete(index=settings.ELASTIC_SEARCH_INDEX, id=self.id)
+        enqueue_es_delete(settings.ELASTIC_SEARCH_INDEX, self.id)
 
 
 def on_bilby_job_label_add_rem(sender, instance, action, pk_set, **kwargs):
@@ -699,16 +735,22 @@ class FileDownloadToken(models.Model):
     # When the token was created
     created = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    @classmethod
+    def unexpired(cls):
+        """
+        Returns a queryset of the tokens which haven't expired. Expired tokens are removed periodically by the
+        prune_file_download_tokens command rather than before each lookup
+        """
+        return cls.objects.filter(
+            created__gte=timezone.now() - datetime.timedelta(seconds=settings.FILE_DOWNLOAD_TOKEN_EXPIRY)
+        )
+
     @classmethod
     def get_by_token(cls, token):
         """
         Returns the instance matching the specified token, or None if expired or not found
         """
-        # First prune any old tokens which may have expired
-        cls.prune()
-
-        # Next try to find the instance matching the specified token
-        return cls.objects.filter(token=token).first()
+        return cls.unexpired().filter(token=token).first()
 
     @classmethod
     def create(cls, job, paths):
@@ -724,23 +766,24 @@ class FileDownloadToken(models.Model):
     def prune(cls):
         """
         Removes any expired tokens from the database
+
+        :return: The number of tokens removed
         """
-        cls.objects.filter(
+        count, _ = cls.objects.filter(
             created__lt=timezone.now() - datetime.timedelta(seconds=settings.FILE_DOWNLOAD_TOKEN_EXPIRY)
         ).delete()
+        return count
 
     @classmethod
     def get_paths(cls, job, tokens):
         """
-        Returns a list of paths from a list of tokens, any token that isn't found will have a path of None
+        Returns a list of paths from a list of tokens, any token that isn't found or has expired will have a path of
+        None
 
         The resulting list, will have identical size and ordering to the provided list of tokens
         """
-        # First prune any old tokens which may have expired
-        cls.prune()
-
         # Get all objects matching the list of tokens
-        objects = {str(rec.token): rec.path for rec in cls.objects.filter(job=job, token__in=tokens)}
+        objects = {str(rec.token): rec.path for rec in cls.unexpired().filter(job=job, token__in=tokens)}
 
         # Generate the list and return
         return [objects.get(str(tok)) for tok in tokens]
@@ -812,3 +855,48 @@ class AnonymousMetrics(models.Model):
     request = models.TextField()
     # The graphql parameters if any (as json)
     params = models.TextField()
+
+
+class ElasticSearchOutbox(models.Model):
+    """
+    Pending Elasticsearch writes. Rows for BilbyJob saves and deletes are written in the same database transaction as
+    the change that caused them, and are drained in bulk by the process_es_outbox management command, so saves never
+    wait on (or fail because of) Elasticsearch.
+    """
+
+    # Upsert the whole document. If document is None the document is a BilbyJob that is built from the database when
+    # the row is drained
+    ACTION_INDEX = "index"
+    # Merge document into an existing Elasticsearch document, ignoring documents that don't exist yet
+    ACTION_UPDATE = "update"
+    # Delete the document, ignoring documents that don't exist
+    ACTION_DELETE = "delete"
+
+    ACTION_CHOICES = (
+        (ACTION_INDEX, "Index"),
+        (ACTION_UPDATE, "Update"),
+        (ACTION_DELETE, "Delete"),
+    )
+
+    class Meta:
+        indexes = [models.Index(fields=["index", "doc_id"]), models.Index(fields=["applied", "id"])]
+
+    # The Elasticsearch index and document id this write is for
+    index = models.CharField(max_length=255)
+    doc_id = models.IntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    # The document (or partial document) to write, if not built at drain time
+    document = models.JSONField(default=None, blank=True, null=True)
+    # The number of failed attempts to apply this write and the most recent error. Writes that fail
+    # ELASTIC_SEARCH_OUTBOX_MAX_ATTEMPTS times are marked as dead and kept, to be inspected and replayed with
+    # process_es_outbox --replay-dead
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    dead = models.BooleanField(default=False)
+    # When the write was queued, and when it was applied. Applied rows are kept for ELASTIC_SEARCH_OUTBOX_RETENTION
+    # seconds so that es_ingest --reindex can catch up on writes that went to the old index while it was running
+    created = models.DateTimeField(auto_now_add=True)
+    applied = models.DateTimeField(blank=True, null=True, default=None)
+
+    def __str__(self):
+        return f"Elasticsearch {self.action}: {self.index}/{self.doc_id}"
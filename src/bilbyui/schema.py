@@ -26,13 +26,15 @@ from .models import (
     SupportingFile,
 )
 from .services.event_ids import get_event_id, list_event_ids_for_user
-from .services.gwflow import list_gwflow_jobs
-from .services.jobs import get_job, list_public_jobs, update_job
+from .services.gwflow import GWFLOW_JOBS_SORT, list_gwflow_jobs
+from .services.jobs import PUBLIC_JOBS_SORT, get_job, list_public_jobs, update_job
 from .services.labels import list_labels
 from .status import JobStatus
 from .types import (
     BilbyJobCreationResult,
     BilbyJobSupportingFile,
+    ExternalBilbyJobUploadInput,
+    ExternalBilbyJobUploadResult,
     GWFlowFileType,
     GWFlowPendingFile,
     GWFlowUpsertInput,
@@ -48,8 +50,9 @@ from .types import (
 from .utils.derive_job_status import derive_job_status
 from .utils.gen_parameter_output import generate_parameter_output
 from .utils.jobs.request_file_download_id import request_file_download_ids
-from .utils.jobs.request_job_filter import request_job_filter
+from .utils.jobs.request_job_filter import request_cached_job_filter
 from .utils.misc import es_section_dict, is_ligo_user
+from .utils.search_cursor import decode_search_cursor, encode_search_cursor
 from .views import (
     create_bilby_job,
     create_bilby_job_from_ini_string,
@@ -60,6 +63,7 @@ from .views import (
     update_event_id,
     upload_bilby_job,
     upload_external_bilby_job,
+    upload_external_bilby_jobs,
     upload_gwflow_file,
     upload_hdf5_bilby_job,
     upload_supporting_files,
@@ -77,25 +81,33 @@ def _normalize_time_range(time_range):
     return time_range
 
 
-def _parse_after_cursor(kwargs):
-    if kwargs.get("after") is None:
-        kwargs["after"] = None
-    else:
-        try:
-            kwargs["after"] = int(from_global_id(kwargs["after"])[1])
-        except (ValueError, TypeError):
-            # A malformed cursor (e.g. invalid base64 or a non-numeric id) should
-            # fall back to the first page instead of raising and returning a 500.
-            kwargs["after"] = None
-
-
-def _pad_result_for_cursor(after, nodes):
-    after_value = int((after or -1) + 1)
-    if after == 0:
-        after_value = 1
-    real_result = [None] * after_value
-    real_result.extend(nodes)
-    return real_result
+def _record_cursor(record):
+    return encode_search_cursor(record.get("sort") or [])
+
+
+def _search_connection(connection_type, edges, records, has_next, has_previous):
+    """
+    Builds a relay connection for a page of elastic search results
+
+    Each edge's cursor holds the sort values of its hit, so the next page is fetched with search_after rather than by
+    offset and costs the same however deep it is.
+
+    :param connection_type: The relay.Connection class to build
+    :param edges: A list of (cursor, node) tuples for the hits on the page that are visible to the user
+    :param records: All elastic search hits on the page, the last of which the next page follows on from
+    :param has_next: If there is another page after this one
+    :param has_previous: If this page was fetched with a cursor
+    :return: An instance of connection_type
+    """
+    return connection_type(
+        edges=[connection_type.Edge(node=node, cursor=cursor) for cursor, node in edges],
+        page_info=relay.PageInfo(
+            start_cursor=edges[0][0] if edges else None,
+            end_cursor=_record_cursor(records[-1]) if records else None,
+            has_previous_page=has_previous,
+            has_next_page=has_next,
+        ),
+    )
 
 
 class LabelType(DjangoObjectType):
@@ -119,6 +131,8 @@ class UserBilbyJobFilter(FilterSet):
         fields=(
             ("last_updated", "lastUpdated"),
             ("name", "name"),
+            ("status", "status"),
+            ("status_time", "statusTime"),
         )
     )
 
@@ -198,11 +212,16 @@ class GWFlowJobNode(DjangoObjectType):
 
         jobs = BilbyJob.bilby_job_filter(self.bilby_jobs.all(), user)
 
-        # Query any job controller information in one go - exclude any job controller ids that are not set
-        job_controller_ids = set(jobs.exclude(job_controller_id=None).values_list("job_controller_id", flat=True))
+        # Query any job controller information in one go - exclude any job controller ids that are not set, and jobs
+        # that have finished since their final status is stored on the job
+        job_controller_ids = set(
+            jobs.exclude(job_controller_id=None)
+            .exclude(status__in=JobStatus.TERMINAL_STATES)
+            .values_list("job_controller_id", flat=True)
+        )
         job_controller_jobs = {}
         if job_controller_ids:
-            _, jc_jobs = request_job_filter(user_id, ids=list(job_controller_ids))
+            _, jc_jobs = request_cached_job_filter(user_id, ids=list(job_controller_ids))
             job_controller_jobs = {job["id"]: job for job in jc_jobs if isinstance(job, dict) and "id" in job}
         info.context.job_controller_jobs = job_controller_jobs
 
@@ -248,11 +267,16 @@ class BilbyJobNode(DjangoObjectType):
         qs = BilbyJob.bilby_job_filter(queryset, user)
         qs = qs.select_related("event_id", "gwflow_job").prefetch_related("labels").select_related("user")
 
-        # Query any job controller information in one go - exclude any job controller ids that are not set
-        job_controller_ids = set(qs.exclude(job_controller_id=None).values_list("job_controller_id", flat=True))
+        # Query any job controller information in one go - exclude any job controller ids that are not set, and jobs
+        # that have finished since their final status is stored on the job
+        job_controller_ids = set(
+            qs.exclude(job_controller_id=None)
+            .exclude(status__in=JobStatus.TERMINAL_STATES)
+            .values_list("job_controller_id", flat=True)
+        )
         job_controller_jobs = {}
         if job_controller_ids:
-            _, jc_jobs = request_job_filter(user_id, ids=list(job_controller_ids))
+            _, jc_jobs = request_cached_job_filter(user_id, ids=list(job_controller_ids))
             job_controller_jobs = {job["id"]: job for job in jc_jobs if isinstance(job, dict) and "id" in job}
         info.context.job_controller_jobs = job_controller_jobs
 
@@ -301,6 +325,15 @@ class BilbyJobNode(DjangoObjectType):
                 "date": self.creation_time,
             }
 
+        if self.has_terminal_status:
+            return {
+                "name": self.status_name,
+                "number": self.status,
+                "date": self.status_time.strftime("%Y-%m-%d %H:%M:%S UTC")
+                if self.status_time is not None
+                else self.creation_time,
+            }
+
         try:
             status_number, status_name, status_date = derive_job_status(
                 info.context.job_controller_jobs.get(self.job_controller_id)["history"]
@@ -418,33 +451,31 @@ class Query:
             include_pruned,
         )
 
-        _parse_after_cursor(kwargs)
-
+        # A missing or malformed cursor falls back to the first page
+        search_after = decode_search_cursor(kwargs.get("after"), len(GWFLOW_JOBS_SORT))
         page_size = kwargs.get("first") or 20
-        offset = kwargs.get("after") or 0
 
         res_dict = list_gwflow_jobs(
             user,
             search=search_term,
             time_range=time_range,
             page_size=page_size,
-            offset=offset,
+            search_after=search_after,
             include_pruned=include_pruned,
         )
 
         jobs = res_dict.get("jobs", {})
-        records = res_dict.get("records", [])
+        records = res_dict.get("records", [])[:page_size]
 
-        if not records:
-            return []
-
-        nodes = []
+        edges = []
         for record in records:
             job_id = int(record["_id"])
             if job_id in jobs:
-                nodes.append(jobs[job_id])
+                edges.append((_record_cursor(record), jobs[job_id]))
 
-        return _pad_result_for_cursor(kwargs.get("after"), nodes)
+        return _search_connection(
+            GWFlowJobConnection, edges, records, res_dict.get("has_next", False), search_after is not None
+        )
 
     @login_required
     def resolve_gwflow_pending_files(self, info, **kwargs):
@@ -483,26 +514,21 @@ class Query:
             "User %s searching public jobs: search='%s', time_range=%s", user_id, search_term, kwargs.get("time_range")
         )
 
-        # Parse the cursor if it was provided and set the first offset to be used by the database search
-        # Sometimes the relay resolver fills out all kwarg parameters, but sometimes
-        # it doesn't, most likely becuase it hates happiness and all that is good
-        # This ensures that "after" is either an int (from a b64 string) or None
-        _parse_after_cursor(kwargs)
-
+        # The cursor holds the sort values of the last hit on the previous page. A missing or malformed cursor falls back
+        # to the first page
+        search_after = decode_search_cursor(kwargs.get("after"), len(PUBLIC_JOBS_SORT))
         page_size = kwargs.get("first") or 20
-        offset = kwargs.get("after") or 0
 
         public_jobs = list_public_jobs(
             user,
             search=kwargs.get("search", "") or "",
             time_range=_normalize_time_range(kwargs.get("time_range", "all") or "all"),
             page_size=page_size,
-            offset=offset,
+            search_after=search_after,
         )
 
-        records = public_jobs["records"]
-        if not records:
-            return []
+        # The search requests one extra record than page_size so that has_next can be set
+        records = public_jobs["records"][:page_size]
 
         job_controller_jobs = public_jobs["job_controller_jobs"]
 
@@ -559,22 +585,11 @@ class Query:
             else:
                 raise RuntimeError(f"Unknown Bilby Job Type {bilby_job.job_type}")
 
-            result.append(job_node)
+            result.append((_record_cursor(record), job_node))
 
-        # Nb. The elastic search function requests one extra record than kwargs['first'].
-        # This triggers the ArrayConnection used by returning the result array to correctly set
-        # hasNextPage correctly, such that infinite scroll works as expected.
-
-        # graphene_django's arrayconnection implementation is a bit crazy. It expects this function to return a full
-        # array that has *all* the elements in it, that is then sliced into the expected result. Since the database
-        # only returns us what we expect, what we're doing here is reconstructing that array with the requested offset
-        # worth of empty elements at the start. We then tac on our records from the database, and the arrayconnection
-        # internally slices the correct values from the array and returns that to the client.
-
-        # Furthermore, arrayconnections with offset 0 or 1 are functionally the same, this is why we add a +1 to the
-        # value from after if it is provided, otherwise we use 0 (-1 + 1) if no after value is provided.
-
-        return _pad_result_for_cursor(kwargs.get("after"), result)
+        return _search_connection(
+            BilbyPublicJobConnection, result, records, public_jobs["has_next"], search_after is not None
+        )
 
     @login_required
     def resolve_gwclouduser(self, info, **kwargs):
@@ -912,6 +927,30 @@ class UploadExternalBilbyJobMutation(relay.ClientIDMutation):
         return UploadExternalBilbyJobMutation(result=BilbyJobCreationResult(job_id=job_id))
 
 
+class UploadExternalBilbyJobsMutation(relay.ClientIDMutation):
+    class Input:
+        jobs = graphene.List(graphene.NonNull(ExternalBilbyJobUploadInput), required=True)
+
+    result = graphene.List(ExternalBilbyJobUploadResult)
+
+    @classmethod
+    @login_required
+    def mutate_and_get_payload(cls, _root, info, jobs):
+        user = info.context.user
+
+        # Upload each external bilby job, collecting a result or error for each one
+        results = [
+            ExternalBilbyJobUploadResult(
+                job_id=to_global_id("BilbyJobNode", bilby_job.id) if bilby_job else None,
+                error=error,
+            )
+            for bilby_job, error in upload_external_bilby_jobs(user, jobs)
+        ]
+
+        # Return the per-job results to the client
+        return UploadExternalBilbyJobsMutation(result=results)
+
+
 class UploadHdf5BilbyJobMutation(relay.ClientIDMutation):
     class Input:
         upload_token = graphene.String()
@@ -1016,6 +1055,7 @@ class Mutation(graphene.ObjectType):
     delete_event_id = DeleteEventIDMutation.Field()
     upload_supporting_files = UploadSupportingFilesMutation.Field()
     upload_external_bilby_job = UploadExternalBilbyJobMutation.Field()
+    upload_external_bilby_jobs = UploadExternalBilbyJobsMutation.Field()
     upload_hdf5_bilby_job = UploadHdf5BilbyJobMutation.Field()
     upsert_gwflow_job = UpsertGwflowJobMutation.Field()
     upload_gwflow_file = UploadGwflowFileMutation.Field()
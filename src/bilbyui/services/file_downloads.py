@@ -0,0 +1,77 @@
+from django.db.models import BooleanField, CharField, F, Value
+
+from bilbyui.models import BilbyJob, FileDownloadToken, GWFlowFile, GWFlowJob, SupportingFile
+
+# The kinds of file a download token can be for
+JOB_FILE = "job"
+SUPPORTING_FILE = "supporting"
+GWFLOW_FILE = "gwflow"
+
+# The columns selected from each kind of token. These are all annotations so that every part of the union selects them
+# in the same order
+_COLUMNS = ["token_kind", "token_id", "token_job_id", "token_name", "token_uploaded", "token_ligo_only"]
+
+
+def _token_rows(queryset, kind, name, uploaded, ligo_only):
+    return queryset.annotate(
+        token_kind=Value(kind, output_field=CharField()),
+        token_id=F("id"),
+        token_job_id=F("job_id"),
+        token_name=F(name),
+        token_uploaded=uploaded,
+        token_ligo_only=ligo_only,
+    ).values_list(*_COLUMNS)
+
+
+def resolve_download_token(token):
+    """
+    Resolves a file download token to the file it is for, with a single query over the job file, supporting file and
+    gwflow file download tokens, each of which is looked up by its unique index. Expired job file tokens are ignored
+    rather than being pruned first, they are removed by the prune_file_download_tokens command instead
+
+    The returned instance only has the fields needed to send the file, along with its job's id (and ligo_only for
+    gwflow jobs)
+
+    :param token: The download token
+    :return: A (kind, instance) tuple, or None if the token was not found or has expired
+    :raises ValidationError: If the token is not a valid UUID
+    """
+    false = Value(False, output_field=BooleanField())
+    true = Value(True, output_field=BooleanField())
+
+    rows = _token_rows(FileDownloadToken.unexpired().filter(token=token), JOB_FILE, "path", true, false).union(
+        _token_rows(
+            SupportingFile.objects.filter(download_token=token, upload_token__isnull=True),
+            SUPPORTING_FILE,
+            "file_name",
+            true,
+            false,
+        ),
+        _token_rows(
+            GWFlowFile.objects.filter(download_token=token),
+            GWFLOW_FILE,
+            "file_name",
+            F("uploaded"),
+            F("job__ligo_only"),
+        ),
+        all=True,
+    )
+
+    row = next(iter(rows), None)
+    if row is None:
+        return None
+
+    kind, file_id, job_id, name, uploaded, ligo_only = row
+    if kind == JOB_FILE:
+        instance = FileDownloadToken.from_db(rows.db, ["id", "job_id", "path"], [file_id, job_id, name])
+        instance.job = BilbyJob.from_db(rows.db, ["id"], [job_id])
+    elif kind == SUPPORTING_FILE:
+        instance = SupportingFile.from_db(rows.db, ["id", "job_id", "file_name"], [file_id, job_id, name])
+        instance.job = BilbyJob.from_db(rows.db, ["id"], [job_id])
+    else:
+        instance = GWFlowFile.from_db(
+            rows.db, ["id", "job_id", "file_name", "uploaded"], [file_id, job_id, name, uploaded]
+        )
+        instance.job = GWFlowJob.from_db(rows.db, ["id", "ligo_only"], [job_id, ligo_only])
+
+    return kind, instance
@@ -5,11 +5,18 @@ from django.conf import settings
 from django.utils import timezone
 
 from bilbyui.models import GWFlowJob
-from bilbyui.services.jobs import _time_range_to_timedelta
+from bilbyui.services.jobs import _next_search_cursor, _time_range_to_timedelta
+from bilbyui.utils.es_client import get_es_client, record_es_latency
 from bilbyui.utils.misc import is_ligo_user
 
 logger = logging.getLogger(__name__)
 
+# As for PUBLIC_JOBS_SORT, most recently updated first with the job id as a tie breaker for search_after
+GWFLOW_JOBS_SORT = [
+    {"lastUpdatedTime": {"order": "desc"}},
+    {"id": {"order": "desc", "unmapped_type": "long"}},
+]
+
 
 def list_gwflow_jobs(
     user,
@@ -19,13 +26,17 @@ def list_gwflow_jobs(
     page=1,
     page_size=20,
     offset=None,
+    search_after=None,
     include_pruned=False,
 ):
     """
     Mirror of list_public_jobs for the gwflow index. Returns the same result
-    dict shape as list_public_jobs (jobs dict, records, has_next, page, page_size).
+    dict shape as list_public_jobs (jobs dict, records, has_next, next_cursor, page, page_size).
     """
-    if offset is None:
+    if search_after is not None:
+        offset = None
+        page = 1
+    elif offset is None:
         offset = (page - 1) * page_size
     else:
         page = (offset // page_size) + 1 if page_size else 1
@@ -34,6 +45,7 @@ def list_gwflow_jobs(
         "jobs": {},
         "records": [],
         "has_next": False,
+        "next_cursor": None,
         "page": page,
         "page_size": page_size,
     }
@@ -45,15 +57,7 @@ def list_gwflow_jobs(
         logger.warning("User %s attempted to search private info in gwflow index", user_id)
         return empty_result
 
-    try:
-        es = elasticsearch.Elasticsearch(
-            hosts=[settings.ELASTIC_SEARCH_HOST],
-            api_key=settings.ELASTIC_SEARCH_API_KEY,
-            verify_certs=False,
-        )
-    except elasticsearch.exceptions.ConnectionError:
-        logger.exception("Failed to connect to Elasticsearch")
-        return empty_result
+    es = get_es_client()
 
     if time_range != "all":
         now = timezone.now()
@@ -67,13 +71,14 @@ def list_gwflow_jobs(
         q = f"({q}) AND isPruned:false"
 
     try:
-        results = es.search(
-            index=settings.ELASTIC_SEARCH_GWFLOW_INDEX,
-            q=q,
-            size=page_size + 1,
-            from_=offset,
-            sort="lastUpdatedTime:desc",
-        )
+        with record_es_latency("search", settings.ELASTIC_SEARCH_GWFLOW_INDEX):
+            results = es.search(
+                index=settings.ELASTIC_SEARCH_GWFLOW_INDEX,
+                q=q,
+                size=page_size + 1,
+                sort=GWFLOW_JOBS_SORT,
+                **({"search_after": search_after} if search_after is not None else {"from_": offset}),
+            )
     except elasticsearch.NotFoundError:
         logger.exception(
             "Elasticsearch gwflow index missing or not found: %s",
@@ -96,16 +101,14 @@ def list_gwflow_jobs(
     has_next = len(numeric_records) > page_size
 
     hit_ids = [record["_id"] for record in numeric_records]
-    qs_before = GWFlowJob.objects.filter(id__in=hit_ids).select_related("event_id", "user").prefetch_related("files")
-
-    qs_after = qs_before
-    if not is_ligo_user(user):
-        qs_after = qs_after.filter(ligo_only=False)
-
-    if not include_pruned:
-        qs_after = qs_after.filter(is_pruned=False)
+    # The hits are fetched once and checked here rather than counted before and after filtering in the database
+    ligo_user = is_ligo_user(user)
+    jobs = {
+        job.id: job
+        for job in GWFlowJob.objects.filter(id__in=hit_ids).select_related("event_id", "user").prefetch_related("files")
+    }
 
-    if qs_before.count() != qs_after.count():
+    if any((job.ligo_only and not ligo_user) or (job.is_pruned and not include_pruned) for job in jobs.values()):
         user_id = user.id if user and user.is_authenticated else 0
         logger.warning(
             "User %s query returned unauthorized or pruned GWFlowJob records during reconciliation",
@@ -113,12 +116,11 @@ def list_gwflow_jobs(
         )
         return empty_result
 
-    jobs = {job.id: job for job in qs_after}
-
     return {
         "jobs": jobs,
         "records": numeric_records,
         "has_next": has_next,
+        "next_cursor": _next_search_cursor(numeric_records, page_size, has_next),
         "page": page,
         "page_size": page_size,
     }
@@ -7,12 +7,21 @@ from django.db.models import Q
 from django.utils import timezone
 
 from bilbyui.models import BilbyJob, EventID, Label
-from bilbyui.utils.embargo import embargo_filter, user_subject_to_embargo
+from bilbyui.utils.embargo import job_passes_embargo_filter, user_subject_to_embargo
+from bilbyui.utils.es_client import get_es_client, record_es_latency
 from bilbyui.utils.job_validation import validate_job_name
-from bilbyui.utils.jobs.request_job_filter import request_job_filter
+from bilbyui.utils.jobs.request_job_filter import request_cached_job_filter
+from bilbyui.utils.search_cursor import encode_search_cursor
 
 logger = logging.getLogger(__name__)
 
+# Public jobs are listed most recently updated first. The job id breaks ties so that every hit has a unique position to
+# page on from with search_after. Documents indexed before the id was added sort as if it were missing
+PUBLIC_JOBS_SORT = [
+    {"job.lastUpdatedTime": {"order": "desc"}},
+    {"job.id": {"order": "desc", "unmapped_type": "long"}},
+]
+
 
 _TIME_RANGE_DELTAS = {
     "1d": timedelta(days=1),
@@ -68,10 +77,13 @@ def list_user_jobs(user, *, search="", time_range="all", page=1, page_size=20):
 
 
 def _fetch_job_controller_jobs(jobs, user_id):
-    job_controller_ids = {job.job_controller_id: job.id for job in jobs if job.job_controller_id}
+    # Jobs that have finished already have their final status stored, so the job controller isn't asked about them
+    job_controller_ids = {
+        job.job_controller_id: job.id for job in jobs if job.job_controller_id and not job.has_terminal_status
+    }
     job_controller_jobs = {}
     if job_controller_ids:
-        status, job_controller_result = request_job_filter(user_id, ids=job_controller_ids.keys())
+        status, job_controller_result = request_cached_job_filter(user_id, ids=job_controller_ids.keys())
         if status == "OK":
             job_controller_jobs = {
                 job_controller_ids[job["id"]]: job
@@ -81,8 +93,32 @@ def _fetch_job_controller_jobs(jobs, user_id):
     return job_controller_jobs
 
 
-def list_public_jobs(user, *, search="", time_range="all", page=1, page_size=20, offset=None):
-    if offset is None:
+def _next_search_cursor(records, page_size, has_next):
+    """
+    Returns the cursor to fetch the page after the one in records with, or None if there isn't one
+    """
+    if not has_next or not records[:page_size]:
+        return None
+
+    sort_values = records[:page_size][-1].get("sort")
+    return encode_search_cursor(sort_values) if sort_values else None
+
+
+def list_public_jobs(user, *, search="", time_range="all", page=1, page_size=20, offset=None, search_after=None):
+    """
+    Searches the public jobs in elastic search
+
+    Pages are either fetched by offset, or for deep paging, with the search_after sort values of the last hit on the
+    previous page (see decode_search_cursor), which costs elastic search the same however far in the page is.
+
+    :param search_after: The sort values to page on from, if given offset and page are ignored
+    :return: A dict of jobs (BilbyJob by id), records (the elastic search hits), job_controller_jobs, has_next,
+        next_cursor (the cursor of the next page), page and page_size
+    """
+    if search_after is not None:
+        offset = None
+        page = 1
+    elif offset is None:
         offset = (page - 1) * page_size
     else:
         page = (offset // page_size) + 1 if page_size else 1
@@ -92,19 +128,12 @@ def list_public_jobs(user, *, search="", time_range="all", page=1, page_size=20,
         "records": [],
         "job_controller_jobs": {},
         "has_next": False,
+        "next_cursor": None,
         "page": page,
         "page_size": page_size,
     }
 
-    try:
-        es = elasticsearch.Elasticsearch(
-            hosts=[settings.ELASTIC_SEARCH_HOST],
-            api_key=settings.ELASTIC_SEARCH_API_KEY,
-            verify_certs=False,
-        )
-    except elasticsearch.exceptions.ConnectionError:
-        logger.exception("Failed to connect to Elasticsearch")
-        return empty_result
+    es = get_es_client()
 
     q = search or "*"
 
@@ -126,13 +155,14 @@ def list_public_jobs(user, *, search="", time_range="all", page=1, page_size=20,
         q = f"({q}) AND (params.trigger_time:<{settings.EMBARGO_START_TIME} OR ini.n_simulation:>0)"
 
     try:
-        results = es.search(
-            index=settings.ELASTIC_SEARCH_INDEX,
-            q=q,
-            size=page_size + 1,
-            from_=offset,
-            sort="job.lastUpdatedTime:desc",
-        )
+        with record_es_latency("search", settings.ELASTIC_SEARCH_INDEX):
+            results = es.search(
+                index=settings.ELASTIC_SEARCH_INDEX,
+                q=q,
+                size=page_size + 1,
+                sort=PUBLIC_JOBS_SORT,
+                **({"search_after": search_after} if search_after is not None else {"from_": offset}),
+            )
     except elasticsearch.NotFoundError:
         # Missing index (common in fresh local setups) — show empty list, not 500.
         logger.exception(
@@ -155,25 +185,21 @@ def list_public_jobs(user, *, search="", time_range="all", page=1, page_size=20,
     ]
     has_next = len(records) > page_size
 
-    qs_before = (
-        BilbyJob.objects.filter(id__in=[record["_id"] for record in records])
+    # The hits are fetched once and checked here rather than counted before and after filtering in the database
+    subject_to_embargo = user_subject_to_embargo(user)
+    jobs = {
+        job.id: job
+        for job in BilbyJob.objects.filter(id__in=[record["_id"] for record in records])
         .select_related("event_id")
         .prefetch_related("labels")
-    )
-    qs_after = qs_before
-    if user_subject_to_embargo(user):
-        qs_after = embargo_filter(qs_before, user)
-
-    qs_after = qs_after.filter(private=False)
+    }
 
-    if qs_before.count() != qs_after.count():
+    if any(job.private or (subject_to_embargo and not job_passes_embargo_filter(job)) for job in jobs.values()):
         user_id = user.id if user.is_authenticated else 0
         msg = f"User {user_id} query violated embargo or included private job"
         logger.warning(msg)
         return empty_result
 
-    jobs = {job.id: job for job in qs_after}
-
     job_controller_jobs = _fetch_job_controller_jobs(jobs.values(), user.id if user.is_authenticated else 0)
 
     return {
@@ -181,6 +207,7 @@ def list_public_jobs(user, *, search="", time_range="all", page=1, page_size=20,
         "records": records,
         "job_controller_jobs": job_controller_jobs,
         "has_next": has_next,
+        "next_cursor": _next_search_cursor(records, page_size, has_next),
         "page": page,
         "page_size": page_size,
     }
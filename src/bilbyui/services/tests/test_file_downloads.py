@@ -0,0 +1,84 @@
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from bilbyui.models import BilbyJob, FileDownloadToken, GWFlowFile, GWFlowJob, SupportingFile
+from bilbyui.services.file_downloads import GWFLOW_FILE, JOB_FILE, SUPPORTING_FILE, resolve_download_token
+from bilbyui.tests.test_utils import create_test_ini_string
+from bilbyui.tests.testcases import BilbyTestCase
+
+
+class TestResolveDownloadToken(BilbyTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls.create_user()
+        cls.job = BilbyJob.objects.create(
+            user_id=cls.user.id,
+            name="Test Job",
+            ini_string=create_test_ini_string({"detectors": "['H1']"}),
+        )
+        cls.gwflow_job = GWFlowJob.objects.create(sname="S230601ag", user=cls.user, ligo_only=True)
+
+    def test_job_file(self):
+        token = FileDownloadToken.create(self.job, ["/data/test.txt"])[0]
+
+        with self.assertNumQueries(1):
+            kind, instance = resolve_download_token(token.token)
+
+        self.assertEqual(kind, JOB_FILE)
+        self.assertEqual(instance.id, token.id)
+        self.assertEqual(instance.path, "/data/test.txt")
+        self.assertEqual(instance.job.id, self.job.id)
+
+    def test_expired_job_file(self):
+        token = FileDownloadToken.create(self.job, ["/data/test.txt"])[0]
+        token.created = timezone.now() - timezone.timedelta(seconds=settings.FILE_DOWNLOAD_TOKEN_EXPIRY + 1)
+        token.save()
+
+        self.assertIsNone(resolve_download_token(token.token))
+
+        # Expired tokens are left for the prune_file_download_tokens command
+        self.assertTrue(FileDownloadToken.objects.filter(id=token.id).exists())
+
+    def test_supporting_file(self):
+        supporting_file = SupportingFile.objects.create(
+            job=self.job, file_type="psd", key="L1", file_name="test.psd", upload_token=None
+        )
+
+        with self.assertNumQueries(1):
+            kind, instance = resolve_download_token(supporting_file.download_token)
+
+        self.assertEqual(kind, SUPPORTING_FILE)
+        self.assertEqual(instance.id, supporting_file.id)
+        self.assertEqual(instance.file_name, "test.psd")
+        self.assertEqual(instance.job.id, self.job.id)
+
+    def test_supporting_file_not_uploaded(self):
+        supporting_file = SupportingFile.objects.create(job=self.job, file_type="psd", key="L1", file_name="test.psd")
+
+        self.assertIsNone(resolve_download_token(supporting_file.download_token))
+
+    def test_gwflow_file(self):
+        gwflow_file = GWFlowFile.objects.create(
+            job=self.gwflow_job, path="outdir/data.h5", file_name="data.h5", uploaded=True
+        )
+
+        with self.assertNumQueries(1):
+            kind, instance = resolve_download_token(gwflow_file.download_token)
+
+        self.assertEqual(kind, GWFLOW_FILE)
+        self.assertEqual(instance.id, gwflow_file.id)
+        self.assertEqual(instance.file_name, "data.h5")
+        self.assertTrue(instance.uploaded)
+        self.assertEqual(instance.job.id, self.gwflow_job.id)
+        self.assertTrue(instance.job.ligo_only)
+
+    def test_unknown_token(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(resolve_download_token(uuid.uuid4()))
+
+    def test_invalid_token(self):
+        with self.assertRaises(ValidationError):
+            resolve_download_token("not-a-token")
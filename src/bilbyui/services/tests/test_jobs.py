@@ -2,6 +2,7 @@ from datetime import timedelta
 from unittest.mock import patch
 
 import elasticsearch
+from django.test import override_settings
 from django.utils import timezone
 
 from bilbyui.models import BilbyJob
@@ -116,26 +117,9 @@ class TestJobsService(BilbyTestCase):
         with self.assertRaises(BilbyJob.DoesNotExist):
             get_job(99999, self.user)
 
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_elasticsearch_connection_failure(self, mock_elasticsearch):
-        mock_elasticsearch.side_effect = elasticsearch.exceptions.ConnectionError("connection failed")
-        result = list_public_jobs(self.user)
-        self.assertEqual(
-            result,
-            {
-                "jobs": {},
-                "records": [],
-                "job_controller_jobs": {},
-                "has_next": False,
-                "page": 1,
-                "page_size": 20,
-            },
-        )
-        mock_elasticsearch.assert_called_once()
-
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_elasticsearch_missing_index(self, mock_elasticsearch):
-        mock_es = mock_elasticsearch.return_value
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_elasticsearch_missing_index(self, mock_get_es_client):
+        mock_es = mock_get_es_client.return_value
         mock_es.search.side_effect = elasticsearch.NotFoundError("Exists", None, None)
         result = list_public_jobs(self.user)
         self.assertEqual(
@@ -145,15 +129,16 @@ class TestJobsService(BilbyTestCase):
                 "records": [],
                 "job_controller_jobs": {},
                 "has_next": False,
+                "next_cursor": None,
                 "page": 1,
                 "page_size": 20,
             },
         )
         mock_es.search.assert_called_once()
 
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_elasticsearch_search_connection_error(self, mock_elasticsearch):
-        mock_es = mock_elasticsearch.return_value
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_elasticsearch_search_connection_error(self, mock_get_es_client):
+        mock_es = mock_get_es_client.return_value
         mock_es.search.side_effect = elasticsearch.exceptions.ConnectionError("connection failed")
         result = list_public_jobs(self.user)
         self.assertEqual(
@@ -163,15 +148,16 @@ class TestJobsService(BilbyTestCase):
                 "records": [],
                 "job_controller_jobs": {},
                 "has_next": False,
+                "next_cursor": None,
                 "page": 1,
                 "page_size": 20,
             },
         )
         mock_es.search.assert_called_once()
 
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_empty_hits_returns_empty_result(self, mock_elasticsearch):
-        mock_es = mock_elasticsearch.return_value
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_empty_hits_returns_empty_result(self, mock_get_es_client):
+        mock_es = mock_get_es_client.return_value
         mock_es.search.return_value = {"hits": {"total": 0, "hits": []}}
         result = list_public_jobs(self.user)
         self.assertEqual(
@@ -181,15 +167,16 @@ class TestJobsService(BilbyTestCase):
                 "records": [],
                 "job_controller_jobs": {},
                 "has_next": False,
+                "next_cursor": None,
                 "page": 1,
                 "page_size": 20,
             },
         )
         mock_es.search.assert_called_once()
 
-    @patch("bilbyui.services.jobs.request_job_filter")
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_skips_unexpected_controller_job_id(self, mock_elasticsearch, mock_request_job_filter):
+    @patch("bilbyui.services.jobs.request_cached_job_filter")
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_skips_unexpected_controller_job_id(self, mock_get_es_client, mock_request_job_filter):
         job = BilbyJob.objects.create(
             user_id=self.user.id,
             name="public_job",
@@ -198,7 +185,7 @@ class TestJobsService(BilbyTestCase):
             job_controller_id=42,
             ini_string=create_test_ini_string({"detectors": "['H1']"}),
         )
-        mock_es = mock_elasticsearch.return_value
+        mock_es = mock_get_es_client.return_value
         mock_es.search.return_value = {
             "hits": {
                 "hits": [
@@ -222,8 +209,8 @@ class TestJobsService(BilbyTestCase):
         self.assertEqual(list(result["job_controller_jobs"].keys()), [job.id])
         self.assertEqual(result["job_controller_jobs"][job.id]["id"], 42)
 
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_has_next_ignores_non_numeric_trailing_id(self, mock_elasticsearch):
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_has_next_ignores_non_numeric_trailing_id(self, mock_get_es_client):
         job = BilbyJob.objects.create(
             user_id=self.user.id,
             name="public_job",
@@ -231,7 +218,7 @@ class TestJobsService(BilbyTestCase):
             private=False,
             ini_string=create_test_ini_string({"detectors": "['H1']"}),
         )
-        mock_es = mock_elasticsearch.return_value
+        mock_es = mock_get_es_client.return_value
         mock_es.search.return_value = {
             "hits": {
                 "hits": [
@@ -247,8 +234,8 @@ class TestJobsService(BilbyTestCase):
         self.assertFalse(result["has_next"])
         self.assertEqual(len(result["records"]), 2)
 
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_skips_non_dict_hit(self, mock_elasticsearch):
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_skips_non_dict_hit(self, mock_get_es_client):
         job = BilbyJob.objects.create(
             user_id=self.user.id,
             name="public_job",
@@ -256,7 +243,7 @@ class TestJobsService(BilbyTestCase):
             private=False,
             ini_string=create_test_ini_string({"detectors": "['H1']"}),
         )
-        mock_es = mock_elasticsearch.return_value
+        mock_es = mock_get_es_client.return_value
         mock_es.search.return_value = {
             "hits": {
                 "hits": [
@@ -271,8 +258,8 @@ class TestJobsService(BilbyTestCase):
         self.assertIn(job.id, result["jobs"])
         self.assertEqual(len(result["records"]), 1)
 
-    @patch("bilbyui.services.jobs.elasticsearch.Elasticsearch")
-    def test_list_public_jobs_skips_dict_hit_missing_id(self, mock_elasticsearch):
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_skips_dict_hit_missing_id(self, mock_get_es_client):
         job = BilbyJob.objects.create(
             user_id=self.user.id,
             name="public_job",
@@ -280,7 +267,7 @@ class TestJobsService(BilbyTestCase):
             private=False,
             ini_string=create_test_ini_string({"detectors": "['H1']"}),
         )
-        mock_es = mock_elasticsearch.return_value
+        mock_es = mock_get_es_client.return_value
         mock_es.search.return_value = {
             "hits": {
                 "hits": [
@@ -294,3 +281,49 @@ class TestJobsService(BilbyTestCase):
 
         self.assertIn(job.id, result["jobs"])
         self.assertEqual(len(result["records"]), 1)
+
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_fetches_hits_once(self, mock_get_es_client):
+        mock_es = mock_get_es_client.return_value
+        mock_es.search.return_value = {"hits": {"hits": [{"_id": self.job1.id}, {"_id": self.job2.id}]}}
+
+        # One query for the jobs and one to prefetch their labels
+        with self.assertNumQueries(2):
+            result = list_public_jobs(self.user)
+
+        self.assertEqual(set(result["jobs"]), {self.job1.id, self.job2.id})
+
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_private_hit_returns_empty_result(self, mock_get_es_client):
+        job = BilbyJob.objects.create(
+            user_id=self.user.id,
+            name="private_job",
+            description="Private job",
+            private=True,
+            ini_string=create_test_ini_string({"detectors": "['H1']"}),
+        )
+        mock_es = mock_get_es_client.return_value
+        mock_es.search.return_value = {"hits": {"hits": [{"_id": self.job1.id}, {"_id": job.id}]}}
+
+        with self.assertLogs("bilbyui.services.jobs", level="WARNING"):
+            result = list_public_jobs(self.user)
+
+        self.assertEqual(result["jobs"], {})
+
+    @override_settings(EMBARGO_START_TIME=5.0)
+    @patch("bilbyui.services.jobs.get_es_client")
+    def test_list_public_jobs_embargoed_hit_returns_empty_result(self, mock_get_es_client):
+        job = BilbyJob.objects.create(
+            user_id=self.user.id,
+            name="embargoed_job",
+            description="Embargoed job",
+            private=False,
+            ini_string=create_test_ini_string({"detectors": "['H1']", "trigger-time": 10.0, "n-simulation": 0}),
+        )
+        mock_es = mock_get_es_client.return_value
+        mock_es.search.return_value = {"hits": {"hits": [{"_id": job.id}]}}
+
+        with self.assertLogs("bilbyui.services.jobs", level="WARNING"):
+            result = list_public_jobs(self.user)
+
+        self.assertEqual(result["jobs"], {})
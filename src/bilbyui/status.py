@@ -53,6 +53,15 @@ class JobStatus:
         COMPLETED: "Completed",
     }
 
+    # States a job never leaves once it has reached them
+    TERMINAL_STATES: ClassVar[frozenset] = frozenset(
+        {CANCELLED, DELETED, ERROR, WALL_TIME_EXCEEDED, OUT_OF_MEMORY, COMPLETED}
+    )
+
     @staticmethod
     def display_name(status):
         return JobStatus._DISPLAY_NAMES.get(status, "Unknown")
+
+    @staticmethod
+    def is_terminal(status):
+        return status in JobStatus.TERMINAL_STATES
@@ -49,21 +49,21 @@ class TestCheckJobEmbargoStatus(BilbyTestCase):
         self.assertFalse(check_job_embargo_status(self.user, args))
 
     @override_settings(EMBARGO_START_TIME=1.5)
-    @patch("bilbyui.views.event_gps", return_value=2.0)
+    @patch("gwosc.datasets.event_gps", return_value=2.0)
     def test_event_name_trigger_time_resolved(self, _mock_event_gps):
         args = _args(trigger_time="GW150914", n_simulation="0")
         self.assertTrue(check_job_embargo_status(None, args))
         _mock_event_gps.assert_called_once_with("GW150914")
 
     @override_settings(EMBARGO_START_TIME=1.5)
-    @patch("bilbyui.views.event_gps", side_effect=ValueError("unknown event"))
+    @patch("gwosc.datasets.event_gps", side_effect=ValueError("unknown event"))
     def test_unresolvable_trigger_time_not_embargoed(self, _mock_event_gps):
         args = _args(trigger_time="NOT_A_REAL_EVENT", n_simulation="0")
         self.assertFalse(check_job_embargo_status(None, args))
 
     @override_settings(EMBARGO_START_TIME=1.5)
     @patch(
-        "bilbyui.views.event_gps",
+        "gwosc.datasets.event_gps",
         side_effect=requests.HTTPError("404 Client Error: Not Found for url"),
     )
     def test_gwosc_http_error_trigger_time_not_embargoed(self, _mock_event_gps):
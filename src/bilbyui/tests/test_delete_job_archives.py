@@ -0,0 +1,55 @@
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from bilbyui.constants import BilbyJobType
+from bilbyui.models import BilbyJob
+from bilbyui.tests.test_utils import create_test_ini_string
+from bilbyui.tests.testcases import BilbyTestCase
+
+
+class TestDeleteJobArchives(BilbyTestCase):
+    def setUp(self):
+        # Each test has its own upload directory, since job ids are reused between tests
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        settings = override_settings(IGNORE_ELASTIC_SEARCH=True, JOB_UPLOAD_DIR=temp_dir.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.user = self.create_user()
+
+        self.archives = []
+        for name in ["job1", "job2"]:
+            job = BilbyJob.objects.create(
+                user=self.user,
+                name=name,
+                ini_string=create_test_ini_string({"detectors": "['H1']"}),
+                job_type=BilbyJobType.UPLOADED,
+            )
+            job_dir = Path(job.get_upload_directory())
+            (job_dir / "result").mkdir(parents=True)
+            (job_dir / "archive.tar.gz").write_bytes(b"archive")
+            (job_dir / "result" / "archive.tar.gz").write_bytes(b"not the archive")
+            self.archives.append(job_dir / "archive.tar.gz")
+
+    def test_delete(self):
+        out = StringIO()
+        call_command("delete_job_archives", stdout=out)
+
+        self.assertIn("Deleted 2 job archives (14 bytes)", out.getvalue())
+        for archive in self.archives:
+            self.assertFalse(archive.exists())
+            self.assertTrue((archive.parent / "result" / "archive.tar.gz").exists())
+
+    def test_dry_run(self):
+        out = StringIO()
+        call_command("delete_job_archives", "--dry-run", stdout=out)
+
+        self.assertIn("Would delete 2 job archives (14 bytes)", out.getvalue())
+        for archive in self.archives:
+            self.assertTrue(archive.exists())
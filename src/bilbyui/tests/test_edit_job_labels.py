@@ -112,7 +112,7 @@ class TestEditJobLabels(BilbyTestCase):
         self.job.refresh_from_db()
         self.assertIn(self.official_label, self.job.labels.all())
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_dropdown_only_shows_unassigned_labels(self, request_job_filter):
         self.authenticate(authentication_method=AUTHENTICATION_METHODS["LIGO_SHIBBOLETH"])
         self.job.labels.add(self.pe_label)
@@ -124,7 +124,7 @@ class TestEditJobLabels(BilbyTestCase):
         self.assertNotContains(response, f'name="add" value="{self.official_label.name}"')
         self.assertContains(response, f'name="add" value="{self.unassigned_label.name}"')
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     @override_settings(
         SECURE_PROXY_SSL_HEADER=("HTTP_X_FORWARDED_PROTO", "https"),
         CSRF_TRUSTED_ORIGINS=["https://gwcloud.org.au"],
@@ -49,7 +49,7 @@ class TestEditJobPrivacy(BilbyTestCase):
         self.job.refresh_from_db()
         self.assertTrue(self.job.private)
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_label_text_for_ligo_job(self, request_job_filter):
         self.authenticate(authentication_method=AUTHENTICATION_METHODS["LIGO_SHIBBOLETH"])
         ligo_job = BilbyJob.objects.create(
@@ -67,7 +67,7 @@ class TestEditJobPrivacy(BilbyTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Share with LVK collaborators")
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_label_text_for_non_ligo_job(self, request_job_filter):
         response = self.client.get(self.base_url)
 
@@ -106,7 +106,7 @@ class TestEditJobPrivacy(BilbyTestCase):
             f"{settings.LOGIN_URL}?next={self.base_url}edit/privacy/",
         )
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_post_requires_csrf_token(self, request_job_filter):
         self.client = self.client_class(enforce_csrf_checks=True)
         self.authenticate()
@@ -133,7 +133,7 @@ class TestEditJobPrivacy(BilbyTestCase):
         self.job.refresh_from_db()
         self.assertFalse(self.job.private)
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     @override_settings(
         SECURE_PROXY_SSL_HEADER=("HTTP_X_FORWARDED_PROTO", "https"),
         CSRF_TRUSTED_ORIGINS=["https://gwcloud.org.au"],
@@ -160,7 +160,7 @@ class TestEditJobPrivacy(BilbyTestCase):
         self.job.refresh_from_db()
         self.assertFalse(self.job.private)
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_privacy_form_submits_via_form_element(self, request_job_filter):
         response = self.client.get(self.base_url)
 
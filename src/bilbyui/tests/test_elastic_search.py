@@ -3,15 +3,27 @@ from unittest import mock
 import elasticsearch
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import DatabaseError
 from django.test import override_settings
 
-from bilbyui.models import BilbyJob, EventID, Label
+from bilbyui.models import BilbyJob, ElasticSearchOutbox, EventID, Label
 from bilbyui.tests.test_utils import create_test_ini_string, generate_elastic_doc
 from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.es_outbox import drain_es_outbox
 
 User = get_user_model()
 
 
+def bulk_ok(client, actions, **kwargs):
+    for action in actions:
+        yield True, {action["_op_type"]: {"_id": str(action["_id"]), "status": 200}}
+
+
+def bulk_not_found(client, actions, **kwargs):
+    for action in actions:
+        yield False, {action["_op_type"]: {"_id": str(action["_id"]), "status": 404, "error": "not found"}}
+
+
 @override_settings(IGNORE_ELASTIC_SEARCH=False)
 class TestElasticSearch(BilbyTestCase):
     def setUp(self):
@@ -26,48 +38,68 @@ class TestElasticSearch(BilbyTestCase):
     def request_lookup_users_failure_mock(*args, **kwargs):
         return False, "Error looking up users: auth service unavailable"
 
-    def request_elasticsearch_update_mock_raises(*args, **kwargs):
-        raise elasticsearch.NotFoundError("Exists", None, None)
-
-    @mock.patch(
-        "elasticsearch.Elasticsearch.update",
-        side_effect=request_elasticsearch_update_mock_raises,
-    )
-    @mock.patch("elasticsearch.Elasticsearch.index")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
-    def test_job_save_create_document_basic(
-        self,
-        lookup_users_mock,
-        elasticsearch_index_mock,
-        elasticsearch_update_mock_raises,
-    ):
-        """
-        Test that if we create a job, the elastic search index function is called as expected.
-        Also tests that if update raises a elasticsearch.NotFoundError exception, that index is called to insert the
-        record in elastic search
-        """
-        job = BilbyJob.objects.create(
+    def create_job(self, **kwargs):
+        return BilbyJob.objects.create(
             user_id=self.user.id,
             name="Test1",
             description="first job",
             job_controller_id=2,
             private=False,
             ini_string=create_test_ini_string({"detectors": "['H1']"}),
+            **kwargs,
         )
 
-        # request_lookup_users should have been called once with an array containing only the user id
-        self.assertEqual(lookup_users_mock.call_count, 1)
-        self.assertEqual(lookup_users_mock.mock_calls[0].args, ([1],))
+    @mock.patch("elasticsearch.Elasticsearch")
+    @mock.patch("bilbyui.utils.es_outbox.get_users")
+    def test_job_save_only_queues_update(self, lookup_users_mock, elasticsearch_mock):
+        """
+        Test that saving a job queues an outbox row in the database without calling the auth service or elastic search
+        """
+        job = self.create_job()
 
-        # Update should have been called once, which then raises elasticsearch.NotFoundError
-        self.assertEqual(elasticsearch_update_mock_raises.call_count, 1)
+        lookup_users_mock.assert_not_called()
+        elasticsearch_mock.assert_not_called()
 
-        # Verify the document
         self.assertEqual(
-            elasticsearch_index_mock.mock_calls[0].kwargs["index"],
-            settings.ELASTIC_SEARCH_INDEX,
+            list(ElasticSearchOutbox.objects.values_list("index", "doc_id", "action", "document")),
+            [(settings.ELASTIC_SEARCH_INDEX, job.id, ElasticSearchOutbox.ACTION_INDEX, None)],
         )
-        self.assertEqual(elasticsearch_index_mock.mock_calls[0].kwargs["id"], job.id)
+
+    @mock.patch("bilbyui.models.enqueue_es_index", side_effect=DatabaseError("outbox unavailable"))
+    def test_job_save_rolled_back_if_update_not_queued(self, enqueue_mock):
+        """
+        Test that a job is never saved without its outbox row
+        """
+        with self.assertRaises(DatabaseError):
+            self.create_job()
+
+        self.assertFalse(BilbyJob.objects.exists())
+
+    @mock.patch("bilbyui.models.enqueue_es_delete", side_effect=DatabaseError("outbox unavailable"))
+    def test_job_delete_rolled_back_if_removal_not_queued(self, enqueue_mock):
+        """
+        Test that a job is never deleted without its outbox row
+        """
+        job = self.create_job()
+
+        with self.assertRaises(DatabaseError):
+            job.delete()
+
+        self.assertTrue(BilbyJob.objects.filter(id=job.id).exists())
+
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok)
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_job_save_create_document_basic(self, lookup_users_mock, bulk_mock):
+        """
+        Test that if we create a job, draining the outbox upserts the expected document in elastic search
+        """
+        job = self.create_job()
+
+        self.assertEqual(drain_es_outbox(mock.Mock()), (1, 0))
+
+        # request_lookup_users should have been called once with an array containing only the user id
+        self.assertEqual(lookup_users_mock.call_count, 1)
+        self.assertEqual(lookup_users_mock.mock_calls[0].args, ([1],))
 
         # Make sure this test has no labels or an event id
         doc = generate_elastic_doc(job, {"name": "buffy summers"})
@@ -75,25 +107,26 @@ class TestElasticSearch(BilbyTestCase):
         self.assertEqual(doc["labels"], [])
         self.assertIsNone(doc["eventId"])
 
-        self.assertDictEqual(elasticsearch_index_mock.mock_calls[0].kwargs["document"], doc)
+        self.assertEqual(
+            bulk_mock.call_args.args[1],
+            [
+                {
+                    "_op_type": "update",
+                    "_index": settings.ELASTIC_SEARCH_INDEX,
+                    "_id": job.id,
+                    "doc": doc,
+                    "doc_as_upsert": True,
+                }
+            ],
+        )
+        self.assertFalse(ElasticSearchOutbox.objects.filter(applied=None).exists())
 
-    @mock.patch(
-        "elasticsearch.Elasticsearch.update",
-        side_effect=request_elasticsearch_update_mock_raises,
-    )
-    @mock.patch("elasticsearch.Elasticsearch.index")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
-    def test_job_save_create_document_complete(
-        self,
-        lookup_users_mock,
-        elasticsearch_index_mock,
-        elasticsearch_update_mock_raises,
-    ):
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok)
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_job_save_create_document_complete(self, lookup_users_mock, bulk_mock):
         """
-        Test that if we create a job with event id and labels, that the elastic search index function
-        is called as expected
-        Also tests that if update raises a elasticsearch.NotFoundError exception, that index is called to insert the
-        record in elastic search
+        Test that if we create a job with event id and labels, the queued updates are coalesced into a single upsert of
+        the expected document
         """
         label1 = Label.objects.create(name="label 1", description="my label 1", protected=True)
         label2 = Label.objects.create(name="label 2", description="my label 2", protected=False)
@@ -106,136 +139,72 @@ class TestElasticSearch(BilbyTestCase):
             is_ligo_event=True,
         )
 
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            event_id=event_id,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
+        job = self.create_job(event_id=event_id)
 
         job.labels.add(label1)
         job.labels.add(label2)
 
-        # request_lookup_users should have been called three times
-        self.assertEqual(lookup_users_mock.call_count, 3)
+        # One queued write for the save and one for each label added
+        self.assertEqual(ElasticSearchOutbox.objects.filter(doc_id=job.id).count(), 3)
 
-        # Update should have been called three times, which raises elasticsearch.NotFoundError
-        self.assertEqual(elasticsearch_update_mock_raises.call_count, 3)
+        self.assertEqual(drain_es_outbox(mock.Mock()), (3, 0))
 
-        # Verify the document
-        self.assertEqual(
-            elasticsearch_index_mock.mock_calls[-1].kwargs["index"],
-            settings.ELASTIC_SEARCH_INDEX,
-        )
-        self.assertEqual(elasticsearch_index_mock.mock_calls[-1].kwargs["id"], job.id)
+        # The writes are coalesced, so the user is looked up and the document sent once
+        self.assertEqual(lookup_users_mock.call_count, 1)
+        actions = bulk_mock.call_args.args[1]
+        self.assertEqual(len(actions), 1)
 
-        # Make sure this test has no labels or an event id
         doc = generate_elastic_doc(job, {"name": "buffy summers"})
 
         self.assertNotEqual(doc["labels"], [])
         self.assertNotEqual(doc["eventId"], None)
 
-        self.assertDictEqual(elasticsearch_index_mock.mock_calls[-1].kwargs["document"], doc)
+        self.assertEqual(actions[0]["_id"], job.id)
+        self.assertDictEqual(actions[0]["doc"], doc)
 
-    @mock.patch("elasticsearch.Elasticsearch.update")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_failure_mock)
-    def test_job_save_user_lookup_failure_skips_indexing(self, lookup_users_mock, elasticsearch_update_mock):
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk")
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_failure_mock)
+    def test_job_save_user_lookup_failure_retries(self, lookup_users_mock, bulk_mock):
         """
-        Test that when the user lookup fails (auth service down), the job is still saved without
-        raising a TypeError and no document is indexed in elastic search
+        Test that when the user lookup fails (auth service down), the job is still saved and the queued write is kept
+        to be retried
         """
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
-
-        # request_lookup_users should have been called once with an array containing only the user id
-        self.assertEqual(lookup_users_mock.call_count, 1)
-        self.assertEqual(lookup_users_mock.mock_calls[0].args, ([1],))
-
-        # No elastic search update/index call should have been made
-        elasticsearch_update_mock.assert_not_called()
-
-        self.assertIsNotNone(job.id)
-
-    def request_lookup_users_empty_mock(*args, **kwargs):
-        return True, []
+        job = self.create_job()
 
-    @mock.patch("elasticsearch.Elasticsearch.update")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_empty_mock)
-    def test_job_save_user_lookup_empty_skips_indexing(self, lookup_users_mock, elasticsearch_update_mock):
-        """
-        Test that when the user lookup succeeds but returns no matching users, the job is still
-        saved without raising an IndexError and no document is indexed in elastic search
-        """
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
+        self.assertEqual(drain_es_outbox(mock.Mock()), (0, 1))
 
         # request_lookup_users should have been called once with an array containing only the user id
         self.assertEqual(lookup_users_mock.call_count, 1)
         self.assertEqual(lookup_users_mock.mock_calls[0].args, ([1],))
 
-        # No elastic search update/index call should have been made
-        elasticsearch_update_mock.assert_not_called()
+        # No elastic search request should have been made
+        bulk_mock.assert_not_called()
 
-        self.assertIsNotNone(job.id)
+        # The auth service couldn't be reached, so this doesn't count as an attempt
+        row = ElasticSearchOutbox.objects.get(doc_id=job.id)
+        self.assertEqual(row.attempts, 0)
+        self.assertEqual(row.last_error, "Error looking up users")
 
-    @mock.patch("elasticsearch.Elasticsearch.update")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
-    def test_job_save_update_document(self, lookup_users_mock, elasticsearch_update_mock):
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk")
+    @mock.patch("bilbyui.utils.es_outbox.get_users", return_value=(True, []))
+    def test_job_save_user_lookup_empty_skips_indexing(self, lookup_users_mock, bulk_mock):
         """
-        Test that update is called with the expected document
+        Test that when the user lookup succeeds but returns no matching users, no document is indexed in elastic search
+        and the queued write is discarded
         """
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
-
-        # request_lookup_users should have been called once with an array containing only the user id
-        self.assertEqual(lookup_users_mock.call_count, 1)
-        self.assertEqual(lookup_users_mock.mock_calls[0].args, ([1],))
-
-        # Update should have been called once
-        self.assertEqual(elasticsearch_update_mock.call_count, 1)
+        self.create_job()
 
-        # Verify the document
-        self.assertEqual(
-            elasticsearch_update_mock.mock_calls[0].kwargs["index"],
-            settings.ELASTIC_SEARCH_INDEX,
-        )
-        self.assertEqual(elasticsearch_update_mock.mock_calls[0].kwargs["id"], job.id)
+        self.assertEqual(drain_es_outbox(mock.Mock()), (1, 0))
 
-        # Make sure this test has no labels or an event id
-        doc = generate_elastic_doc(job, {"name": "buffy summers"})
-
-        self.assertEqual(doc["labels"], [])
-        self.assertIsNone(doc["eventId"])
-
-        self.assertDictEqual(elasticsearch_update_mock.mock_calls[0].kwargs["doc"], doc)
+        self.assertEqual(lookup_users_mock.call_count, 1)
+        bulk_mock.assert_not_called()
+        self.assertFalse(ElasticSearchOutbox.objects.filter(applied=None).exists())
 
-    @mock.patch("elasticsearch.Elasticsearch.update")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
-    def test_job_save_event_id_update(self, lookup_users_mock, elasticsearch_update_mock):
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok)
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_job_save_event_id_update(self, lookup_users_mock, bulk_mock):
         """
-        Test that if we update an event id associated with a job, that the job's elastic search update
-        is triggered
+        Test that if we update an event id associated with a job, that the job's elastic search update is queued
         """
         event_id = EventID.create(
             "GW123456_123456",
@@ -245,112 +214,145 @@ class TestElasticSearch(BilbyTestCase):
             is_ligo_event=True,
         )
 
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            event_id=event_id,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
+        job = self.create_job(event_id=event_id)
+        drain_es_outbox(mock.Mock())
 
         event_id.is_ligo_event = False
         event_id.save()
 
-        # Update should have been called twice, which then raises elasticsearch.NotFoundError
-        self.assertEqual(elasticsearch_update_mock.call_count, 2)
+        self.assertEqual(ElasticSearchOutbox.objects.filter(doc_id=job.id, applied=None).count(), 1)
+
+        drain_es_outbox(mock.Mock())
 
         self.assertDictEqual(
-            elasticsearch_update_mock.mock_calls[-1].kwargs["doc"],
+            bulk_mock.call_args.args[1][0]["doc"],
             generate_elastic_doc(job, {"name": "buffy summers"}),
         )
 
-    @mock.patch("elasticsearch.Elasticsearch.update")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
-    def test_job_save_label_update(self, lookup_users_mock, elasticsearch_update_mock):
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok)
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_job_save_label_update(self, lookup_users_mock, bulk_mock):
         """
-        Test that if we update a label associated with a job, that the job's elastic search update
-        is triggered
+        Test that if we update a label associated with a job, that the job's elastic search update is queued
         """
         label1 = Label.objects.create(name="label 1", description="my label 1", protected=True)
 
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
+        job = self.create_job()
 
         job.labels.add(label1)
+        drain_es_outbox(mock.Mock())
 
         label1.name = "label 2"
         label1.save()
 
-        # Update should have been called three times
-        self.assertEqual(elasticsearch_update_mock.call_count, 3)
+        self.assertEqual(ElasticSearchOutbox.objects.filter(doc_id=job.id, applied=None).count(), 1)
+
+        drain_es_outbox(mock.Mock())
 
         self.assertDictEqual(
-            elasticsearch_update_mock.mock_calls[-1].kwargs["doc"],
+            bulk_mock.call_args.args[1][0]["doc"],
             generate_elastic_doc(job, {"name": "buffy summers"}),
         )
 
-    @mock.patch("elasticsearch.Elasticsearch.delete")
-    @mock.patch("elasticsearch.Elasticsearch.update")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
-    def test_job_delete_remove_document(self, request_lookup_users, elastic_search_update, elastic_search_delete):
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok)
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_job_delete_remove_document(self, lookup_users_mock, bulk_mock):
         """
         Test that when a bilby job is deleted, the elastic search record is also deleted
         """
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
+        job = self.create_job()
 
         job_id = job.id
 
         job.delete()
 
-        self.assertDictEqual(
-            elastic_search_delete.mock_calls[0].kwargs,
-            {"index": settings.ELASTIC_SEARCH_INDEX, "id": job_id},
+        self.assertEqual(drain_es_outbox(mock.Mock()), (2, 0))
+
+        # The queued index is superseded by the delete
+        lookup_users_mock.assert_not_called()
+        self.assertEqual(
+            bulk_mock.call_args.args[1],
+            [{"_op_type": "delete", "_index": settings.ELASTIC_SEARCH_INDEX, "_id": job_id}],
         )
 
-    @mock.patch(
-        "elasticsearch.Elasticsearch.delete",
-        side_effect=request_elasticsearch_update_mock_raises,
-    )
-    @mock.patch("elasticsearch.Elasticsearch.update")
-    @mock.patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
-    def test_job_delete_missing_document_still_deletes(
-        self, request_lookup_users, elastic_search_update, elastic_search_delete
-    ):
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_not_found)
+    def test_job_delete_missing_document_still_deletes(self, bulk_mock):
         """
-        Test that deleting a job whose elastic search document is missing (e.g. a legacy job that
-        was never indexed) still deletes the job, without the pre_delete signal aborting on
-        elasticsearch.NotFoundError
+        Test that deleting a job whose elastic search document is missing (e.g. a legacy job that was never indexed)
+        still deletes the job, and the queued delete is treated as done
         """
-        job = BilbyJob.objects.create(
-            user_id=self.user.id,
-            name="Test1",
-            description="first job",
-            job_controller_id=2,
-            private=False,
-            ini_string=create_test_ini_string({"detectors": "['H1']"}),
-        )
+        job = self.create_job()
+        ElasticSearchOutbox.objects.all().delete()
 
         job_id = job.id
 
         job.delete()
 
-        # The delete call should still have been attempted
-        self.assertEqual(elastic_search_delete.call_count, 1)
-
         # The job should no longer exist in the database
         self.assertFalse(BilbyJob.objects.filter(id=job_id).exists())
+
+        self.assertEqual(drain_es_outbox(mock.Mock()), (1, 0))
+        self.assertFalse(ElasticSearchOutbox.objects.filter(applied=None).exists())
+
+    @mock.patch(
+        "bilbyui.utils.es_outbox.helpers.streaming_bulk",
+        side_effect=elasticsearch.ConnectionError("elastic search unavailable"),
+    )
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_elastic_search_outage_keeps_queued_writes(self, lookup_users_mock, bulk_mock):
+        """
+        Test that when elastic search is unavailable, saves still succeed and the queued writes are kept to be retried
+        """
+        job = self.create_job()
+
+        with self.assertLogs("bilbyui.utils.es_outbox", level="ERROR"):
+            self.assertEqual(drain_es_outbox(mock.Mock()), (0, 1))
+
+        row = ElasticSearchOutbox.objects.get(doc_id=job.id)
+        self.assertEqual(row.attempts, 0)
+        self.assertEqual(row.last_error, "ConnectionError('elastic search unavailable')")
+
+    @override_settings(ELASTIC_SEARCH_OUTBOX_MAX_ATTEMPTS=2)
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=elasticsearch.ConnectionError("down"))
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_outage_does_not_count_towards_max_attempts(self, lookup_users_mock, bulk_mock):
+        job = self.create_job()
+
+        for _ in range(3):
+            with self.assertLogs("bilbyui.utils.es_outbox", level="ERROR"):
+                self.assertEqual(drain_es_outbox(mock.Mock()), (0, 1))
+
+        row = ElasticSearchOutbox.objects.get(doc_id=job.id)
+        self.assertEqual((row.attempts, row.dead), (0, False))
+
+    @override_settings(ELASTIC_SEARCH_OUTBOX_MAX_ATTEMPTS=2)
+    @mock.patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
+    def test_queued_write_dead_after_max_attempts(self, lookup_users_mock):
+        def bulk_rejected(client, actions, **kwargs):
+            for action in actions:
+                yield False, {"update": {"_id": str(action["_id"]), "status": 400, "error": "mapper_parsing_exception"}}
+
+        job = self.create_job()
+
+        with mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_rejected) as bulk_mock:
+            with self.assertLogs("bilbyui.utils.es_outbox", level="WARNING"):
+                drain_es_outbox(mock.Mock())
+            self.assertFalse(ElasticSearchOutbox.objects.get(doc_id=job.id).dead)
+
+            with self.assertLogs("bilbyui.utils.es_outbox", level="ERROR") as logs:
+                drain_es_outbox(mock.Mock())
+            self.assertIn("Giving up", "\n".join(logs.output))
+
+            # The dead write is kept for inspection, but isn't retried
+            self.assertEqual(drain_es_outbox(mock.Mock()), (0, 0))
+
+        self.assertEqual(bulk_mock.call_count, 2)
+        row = ElasticSearchOutbox.objects.get(doc_id=job.id)
+        self.assertEqual((row.attempts, row.dead, row.last_error), (2, True, "mapper_parsing_exception"))
+
+    @override_settings(IGNORE_ELASTIC_SEARCH=True)
+    def test_ignore_elastic_search_queues_nothing(self):
+        job = self.create_job()
+        job.delete()
+
+        self.assertFalse(ElasticSearchOutbox.objects.exists())
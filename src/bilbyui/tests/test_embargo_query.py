@@ -79,7 +79,7 @@ class TestBilbyJobQueries(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1.5)
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_embargoed_user_embargo_single_query(self, *args):
@@ -98,7 +98,7 @@ class TestBilbyJobQueries(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1.5)
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_ligo_user_embargo_single_query(self, *args):
@@ -113,7 +113,7 @@ class TestBilbyJobQueries(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1.5)
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_embargoed_user_embargo_query(self, *args):
@@ -128,7 +128,7 @@ class TestBilbyJobQueries(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1.5)
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_ligo_user_embargo_query(self, *args):
@@ -0,0 +1,78 @@
+from unittest import mock
+
+from django.test import override_settings
+
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.es_client import get_es_client, record_es_latency, reset_es_client
+
+latency_calls = []
+
+
+def latency_hook(operation, index, duration, error):
+    latency_calls.append((operation, index, duration, error))
+
+
+class TestEsClient(BilbyTestCase):
+    def setUp(self):
+        reset_es_client()
+        self.addCleanup(reset_es_client)
+        latency_calls.clear()
+
+    @mock.patch("elasticsearch.Elasticsearch")
+    def test_client_is_shared(self, es_cls):
+        self.assertIs(get_es_client(), get_es_client())
+        es_cls.assert_called_once()
+
+    @override_settings(
+        ELASTIC_SEARCH_HOST="http://es:9200",
+        ELASTIC_SEARCH_CONNECTIONS_PER_NODE=4,
+        ELASTIC_SEARCH_REQUEST_TIMEOUT=3,
+        ELASTIC_SEARCH_MAX_RETRIES=1,
+        ELASTIC_SEARCH_RETRY_ON_TIMEOUT=False,
+    )
+    @mock.patch("elasticsearch.Elasticsearch")
+    def test_client_uses_settings(self, es_cls):
+        get_es_client()
+
+        kwargs = es_cls.call_args.kwargs
+        self.assertEqual(kwargs["hosts"], ["http://es:9200"])
+        self.assertEqual(kwargs["connections_per_node"], 4)
+        self.assertEqual(kwargs["request_timeout"], 3)
+        self.assertEqual(kwargs["max_retries"], 1)
+        self.assertFalse(kwargs["retry_on_timeout"])
+
+    @mock.patch("elasticsearch.Elasticsearch", side_effect=lambda **kwargs: mock.Mock())
+    def test_reset_closes_client(self, es_cls):
+        client = get_es_client()
+        reset_es_client()
+
+        client.close.assert_called_once()
+        self.assertIsNot(get_es_client(), client)
+        self.assertEqual(es_cls.call_count, 2)
+
+    @mock.patch("elasticsearch.Elasticsearch")
+    def test_setting_change_resets_client(self, es_cls):
+        get_es_client()
+
+        with override_settings(ELASTIC_SEARCH_HOST="http://other:9200"):
+            get_es_client()
+
+        self.assertEqual(es_cls.call_count, 2)
+
+    @override_settings(ELASTIC_SEARCH_LATENCY_HOOK="bilbyui.tests.test_es_client.latency_hook")
+    def test_latency_hook(self):
+        with record_es_latency("search", "idx"):
+            pass
+
+        with self.assertRaises(ValueError), record_es_latency("search", "idx"):
+            raise ValueError("boom")
+
+        self.assertEqual(len(latency_calls), 2)
+        self.assertEqual(latency_calls[0][:2], ("search", "idx"))
+        self.assertIsNone(latency_calls[0][3])
+        self.assertIsInstance(latency_calls[1][3], ValueError)
+
+    @override_settings(ELASTIC_SEARCH_LATENCY_HOOK="bilbyui.tests.test_es_client.missing_hook")
+    def test_broken_latency_hook_is_logged(self):
+        with self.assertLogs("bilbyui.utils.es_client", level="ERROR"), record_es_latency("search"):
+            pass
@@ -1,11 +1,12 @@
 from io import StringIO
 from unittest import mock
 
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 from django.db import DatabaseError
 from django.test import override_settings
+from django.utils import timezone
 
-from bilbyui.models import BilbyJob, GWFlowJob
+from bilbyui.models import BilbyJob, ElasticSearchOutbox, EventID, GWFlowJob, Label
 from bilbyui.tests.test_utils import create_test_ini_string
 from bilbyui.tests.testcases import BilbyTestCase
 
@@ -82,3 +83,181 @@ class TestEsIngestCommand(BilbyTestCase):
         output = out.getvalue()
         self.assertIn("GWFlow ingestion complete: 1 succeeded", output)
         self.assertNotIn("Error during gwflow ingestion loop", output)
+
+
+def bulk_ok(client, actions, **kwargs):
+    for action in actions:
+        yield True, {action["_op_type"]: {"_id": str(action["_id"]), "status": 201}}
+
+
+class TestEsIngestReindexCommand(BilbyTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls.create_user()
+        cls.jobs = [
+            BilbyJob.objects.create(
+                user_id=cls.user.id,
+                name=f"Test_Job_{i}",
+                description="Test job description",
+                private=False,
+                ini_string=create_test_ini_string({"detectors": "['H1']"}),
+            )
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        self.es = mock.Mock()
+        self.es.options.return_value = self.es
+        self.es.indices.exists_alias.return_value = True
+        self.es.indices.get_alias.return_value = {"gwcloud-bilbyjob-old": {"aliases": {"gwcloud-bilbyjob": {}}}}
+        self.es.indices.get_mapping.return_value = {"gwcloud-bilbyjob-old": {"mappings": {"properties": {}}}}
+
+        patcher = mock.patch("bilbyui.management.commands.es_ingest.get_es_client", return_value=self.es)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.lookup_users_mock = mock.Mock(return_value=(True, [{"id": self.user.id, "name": "buffy summers"}]))
+        patcher = mock.patch("bilbyui.utils.es_outbox.get_users", self.lookup_users_mock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def reindex(self, *args, bulk=bulk_ok):
+        self.actions = []
+
+        def record_bulk(client, actions, **kwargs):
+            actions = list(actions)
+            self.actions += actions
+            yield from bulk(client, actions, **kwargs)
+
+        out = StringIO()
+        with (
+            override_settings(ELASTIC_SEARCH_INDEX="gwcloud-bilbyjob"),
+            mock.patch.object(BilbyJob, "save", autospec=True) as save_mock,
+            mock.patch("bilbyui.management.commands.es_ingest.helpers.parallel_bulk", side_effect=record_bulk),
+        ):
+            call_command("es_ingest", "--reindex", *args, stdout=out)
+
+        save_mock.assert_not_called()
+        return out.getvalue()
+
+    def test_reindex_builds_documents_and_swaps_alias(self):
+        output = self.reindex("--batch-size", "2")
+
+        # One user lookup per batch of jobs
+        self.assertEqual(self.lookup_users_mock.call_count, 2)
+
+        new_index = self.es.indices.create.call_args.kwargs["index"]
+        self.assertTrue(new_index.startswith("gwcloud-bilbyjob-"))
+        self.assertEqual(self.es.indices.create.call_args.kwargs["mappings"], {"properties": {}})
+
+        self.assertEqual([action["_id"] for action in self.actions], [job.id for job in self.jobs])
+        self.assertEqual({action["_index"] for action in self.actions}, {new_index})
+        self.assertEqual(self.actions[0]["_source"], self.jobs[0].elastic_search_document({"name": "buffy summers"}))
+
+        self.es.indices.refresh.assert_called_once_with(index=new_index)
+        self.es.indices.update_aliases.assert_called_once_with(
+            actions=[
+                {"remove": {"index": "gwcloud-bilbyjob-old", "alias": "gwcloud-bilbyjob"}},
+                {"add": {"index": new_index, "alias": "gwcloud-bilbyjob"}},
+            ]
+        )
+        self.es.indices.delete.assert_not_called()
+        self.assertIn("Reindex complete: 3 succeeded, 0 skipped, 0 failed", output)
+
+    def test_reindex_replaces_concrete_index(self):
+        self.es.indices.exists_alias.return_value = False
+        self.es.indices.exists.return_value = True
+
+        self.reindex("--delete-old")
+
+        new_index = self.es.indices.create.call_args.kwargs["index"]
+        self.es.indices.update_aliases.assert_called_once_with(
+            actions=[
+                {"remove_index": {"index": "gwcloud-bilbyjob"}},
+                {"add": {"index": new_index, "alias": "gwcloud-bilbyjob"}},
+            ]
+        )
+        self.es.indices.delete.assert_not_called()
+
+    def test_reindex_delete_old(self):
+        self.reindex("--delete-old")
+
+        self.es.indices.delete.assert_called_once_with(index="gwcloud-bilbyjob-old")
+
+    def test_reindex_errors_leave_alias_alone(self):
+        def bulk_error(client, actions, **kwargs):
+            for action in actions:
+                yield False, {"index": {"_id": str(action["_id"]), "status": 400, "error": "mapper_parsing_exception"}}
+
+        with self.assertRaises(CommandError), self.assertLogs("bilbyui.management.commands.es_ingest", level="ERROR"):
+            self.reindex(bulk=bulk_error)
+
+        self.es.indices.update_aliases.assert_not_called()
+
+    def test_reindex_user_lookup_failure_leaves_alias_alone(self):
+        self.lookup_users_mock.return_value = (False, "auth service unavailable")
+
+        with self.assertRaises(CommandError):
+            self.reindex()
+
+        self.assertEqual(self.actions, [])
+        self.es.indices.update_aliases.assert_not_called()
+
+    def pending_writes(self):
+        return list(ElasticSearchOutbox.objects.filter(applied=None).order_by("id").values_list("doc_id", "action"))
+
+    def test_reindex_queues_jobs_changed_during_reindex(self):
+        ElasticSearchOutbox.objects.all().delete()
+        deleted_id = self.jobs[2].id
+
+        def bulk_and_change(client, actions, **kwargs):
+            self.jobs[1].elastic_search_update()
+            BilbyJob.objects.filter(id=deleted_id).delete()
+
+            # The process_es_outbox worker applies these writes to the old index
+            ElasticSearchOutbox.objects.update(applied=timezone.now())
+            yield from bulk_ok(client, actions)
+
+        self.reindex(bulk=bulk_and_change)
+
+        self.assertEqual(
+            self.pending_writes(),
+            [(self.jobs[1].id, ElasticSearchOutbox.ACTION_INDEX), (deleted_id, ElasticSearchOutbox.ACTION_DELETE)],
+        )
+
+    def test_reindex_queues_jobs_relabelled_during_reindex(self):
+        label = Label.objects.create(name="Bad Run", description="This run has problems")
+        event_id = EventID.objects.create(event_id="GW123456_123456")
+        BilbyJob.objects.filter(id=self.jobs[2].id).update(event_id=event_id)
+        ElasticSearchOutbox.objects.all().delete()
+
+        def bulk_and_relabel(client, actions, **kwargs):
+            # Neither of these saves the job itself
+            self.jobs[0].labels.add(label)
+            event_id.update(nickname="GW123456")
+
+            ElasticSearchOutbox.objects.update(applied=timezone.now())
+            yield from bulk_ok(client, actions)
+
+        self.reindex(bulk=bulk_and_relabel)
+
+        self.assertEqual(
+            self.pending_writes(),
+            [(self.jobs[0].id, ElasticSearchOutbox.ACTION_INDEX), (self.jobs[2].id, ElasticSearchOutbox.ACTION_INDEX)],
+        )
+        # The jobs weren't changed, so they keep their place in the listings
+        self.assertEqual(
+            list(BilbyJob.objects.order_by("id").values_list("last_updated", flat=True)),
+            [job.last_updated for job in self.jobs],
+        )
+
+    def test_reindex_ignores_writes_before_it_started(self):
+        ElasticSearchOutbox.objects.update(applied=timezone.now())
+
+        self.reindex()
+
+        self.assertEqual(self.pending_writes(), [])
+
+    def test_reindex_with_gwflow(self):
+        with self.assertRaises(CommandError):
+            call_command("es_ingest", "--reindex", "--gwflow", stdout=StringIO())
@@ -0,0 +1,185 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+import elasticsearch
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from bilbyui.models import ElasticSearchOutbox
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.es_outbox import (
+    collapse_outbox_rows,
+    drain_es_outbox,
+    enqueue_es_delete,
+    enqueue_es_index,
+    enqueue_es_update,
+)
+
+
+def bulk_ok(client, actions, **kwargs):
+    for action in actions:
+        yield True, {action["_op_type"]: {"_id": str(action["_id"]), "status": 200}}
+
+
+class TestCollapseOutboxRows(BilbyTestCase):
+    def collapse(self):
+        return {
+            key: (action, document)
+            for key, (action, document, _) in collapse_outbox_rows(ElasticSearchOutbox.objects.order_by("id")).items()
+        }
+
+    def test_partial_updates_merge_into_index(self):
+        enqueue_es_index("idx", 1, {"sname": "S1", "childJobIds": []})
+        enqueue_es_update("idx", 1, {"childJobIds": [1]})
+        enqueue_es_update("idx", 1, {"childJobIds": [1, 2]})
+
+        self.assertEqual(self.collapse(), {("idx", 1): ("index", {"sname": "S1", "childJobIds": [1, 2]})})
+
+    def test_partial_updates_merge(self):
+        enqueue_es_update("idx", 1, {"a": 1})
+        enqueue_es_update("idx", 1, {"b": 2})
+
+        self.assertEqual(self.collapse(), {("idx", 1): ("update", {"a": 1, "b": 2})})
+
+    def test_delete_supersedes_earlier_writes(self):
+        enqueue_es_index("idx", 1)
+        enqueue_es_delete("idx", 1)
+        enqueue_es_update("idx", 1, {"a": 1})
+
+        self.assertEqual(self.collapse(), {("idx", 1): ("delete", None)})
+
+    def test_index_after_delete_recreates(self):
+        enqueue_es_delete("idx", 1)
+        enqueue_es_index("idx", 1, {"a": 1})
+
+        self.assertEqual(self.collapse(), {("idx", 1): ("index", {"a": 1})})
+
+    def test_documents_kept_separate(self):
+        enqueue_es_index("idx", 1)
+        enqueue_es_index("idx", 2)
+        enqueue_es_index("other", 1)
+
+        self.assertEqual(list(self.collapse()), [("idx", 1), ("idx", 2), ("other", 1)])
+
+    def test_row_ids_tracked(self):
+        enqueue_es_index("idx", 1)
+        enqueue_es_index("idx", 1)
+
+        row_ids = list(ElasticSearchOutbox.objects.order_by("id").values_list("id", flat=True))
+        collapsed = collapse_outbox_rows(ElasticSearchOutbox.objects.order_by("id"))
+
+        self.assertEqual(collapsed[("idx", 1)][2], row_ids)
+
+
+class TestDrainEsOutbox(BilbyTestCase):
+    def test_empty_outbox(self):
+        with mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk") as bulk_mock:
+            self.assertEqual(drain_es_outbox(mock.Mock()), (0, 0))
+
+        bulk_mock.assert_not_called()
+
+    def test_not_found_on_upsert_is_a_failure(self):
+        def bulk_not_found(client, actions, **kwargs):
+            for action in actions:
+                yield False, {"update": {"_id": str(action["_id"]), "status": 404, "error": "index missing"}}
+
+        enqueue_es_index("idx", 1, {"a": 1})
+        enqueue_es_update("idx", 2, {"a": 1})
+
+        with (
+            mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_not_found),
+            self.assertLogs("bilbyui.utils.es_outbox", level="WARNING"),
+        ):
+            self.assertEqual(drain_es_outbox(mock.Mock()), (1, 1))
+
+        # The partial update of a missing document is dropped, the failed upsert is kept for retry
+        row = ElasticSearchOutbox.objects.get(applied=None)
+        self.assertEqual((row.doc_id, row.attempts, row.last_error), (1, 1, "index missing"))
+
+    def test_batch_size(self):
+        for doc_id in range(5):
+            enqueue_es_update("idx", doc_id, {"a": 1})
+
+        with mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok):
+            self.assertEqual(drain_es_outbox(mock.Mock(), batch_size=2), (2, 0))
+
+        self.assertEqual(ElasticSearchOutbox.objects.filter(applied=None).count(), 3)
+
+    def test_applied_rows_kept_until_retention_expires(self):
+        enqueue_es_update("idx", 1, {"a": 1})
+        enqueue_es_update("idx", 2, {"a": 1})
+        ElasticSearchOutbox.objects.filter(doc_id=1).update(applied=timezone.now() - datetime.timedelta(days=8))
+
+        with mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok):
+            self.assertEqual(drain_es_outbox(mock.Mock()), (1, 0))
+
+        # The write applied just now is kept, the one applied longer than ELASTIC_SEARCH_OUTBOX_RETENTION ago is not
+        row = ElasticSearchOutbox.objects.get()
+        self.assertEqual(row.doc_id, 2)
+        self.assertIsNotNone(row.applied)
+
+    def test_rows_queued_during_drain_are_kept(self):
+        enqueue_es_update("idx", 1, {"a": 1})
+
+        def bulk_and_enqueue(client, actions, **kwargs):
+            enqueue_es_update("idx", 1, {"a": 2})
+            yield from bulk_ok(client, actions)
+
+        with mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_and_enqueue):
+            drain_es_outbox(mock.Mock())
+
+        self.assertEqual(ElasticSearchOutbox.objects.get(applied=None).document, {"a": 2})
+
+
+@override_settings(ELASTIC_SEARCH_OUTBOX_BATCH_SIZE=2)
+class TestProcessEsOutboxCommand(BilbyTestCase):
+    @mock.patch("bilbyui.management.commands.process_es_outbox.get_es_client")
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok)
+    def test_once_drains_outbox(self, bulk_mock, es_mock):
+        for doc_id in range(5):
+            enqueue_es_update("idx", doc_id, {"a": 1})
+
+        out = StringIO()
+        call_command("process_es_outbox", "--once", stdout=out)
+
+        self.assertFalse(ElasticSearchOutbox.objects.filter(applied=None).exists())
+        self.assertEqual(bulk_mock.call_count, 3)
+        self.assertEqual(es_mock.call_count, 1)
+        self.assertIn("5 applied, 0 failed", out.getvalue())
+
+    @mock.patch("bilbyui.management.commands.process_es_outbox.get_es_client")
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=bulk_ok)
+    def test_replay_dead(self, bulk_mock, es_mock):
+        enqueue_es_update("idx", 1, {"a": 1})
+        ElasticSearchOutbox.objects.update(attempts=10, dead=True)
+
+        out = StringIO()
+        call_command("process_es_outbox", "--once", "--replay-dead", stdout=out)
+
+        self.assertFalse(ElasticSearchOutbox.objects.filter(applied=None).exists())
+        self.assertIn("Replaying 1 dead writes", out.getvalue())
+        self.assertIn("1 applied, 0 failed", out.getvalue())
+
+    @override_settings(ELASTIC_SEARCH_OUTBOX_MAX_BACKOFF=20)
+    @mock.patch("bilbyui.management.commands.process_es_outbox.signal.signal")
+    @mock.patch("bilbyui.management.commands.process_es_outbox.get_es_client")
+    @mock.patch("bilbyui.utils.es_outbox.helpers.streaming_bulk", side_effect=elasticsearch.ConnectionError("down"))
+    def test_backs_off_while_elastic_search_unavailable(self, bulk_mock, es_mock, signal_mock):
+        enqueue_es_update("idx", 1, {"a": 1})
+
+        class Stop(Exception):
+            pass
+
+        with (
+            mock.patch(
+                "bilbyui.management.commands.process_es_outbox.time.sleep", side_effect=[None] * 4 + [Stop]
+            ) as sleep_mock,
+            self.assertLogs("bilbyui.utils.es_outbox", level="ERROR"),
+            self.assertRaises(Stop),
+        ):
+            call_command("process_es_outbox", "--poll-interval", "5", stdout=StringIO())
+
+        self.assertEqual([call.args[0] for call in sleep_mock.call_args_list], [5, 10, 20, 20, 20])
+        self.assertEqual(ElasticSearchOutbox.objects.get().attempts, 0)
@@ -1,11 +1,13 @@
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 from adacs_sso_plugin.constants import AUTHENTICATION_METHODS
 from django.contrib.auth import get_user_model
+from django.db import DatabaseError
 from django.test import override_settings
 
 from bilbyui.constants import BilbyJobType
-from bilbyui.models import BilbyJob, ExternalBilbyJob, Label
+from bilbyui.models import BilbyJob, EventID, ExternalBilbyJob, Label
 from bilbyui.tests.test_utils import (
     compare_ini_kvs,
     create_test_ini_string,
@@ -394,3 +396,120 @@ class TestExternalJobUploadLigoPermissions(BilbyTestCase):
             job = BilbyJob.objects.all().last()
             self.assertFalse(job.is_ligo_job)
             job.delete()
+
+
+class TestExternalJobBatchUpload(BilbyTestCase):
+    def setUp(self):
+        self.authenticate(authentication_method=AUTHENTICATION_METHODS["LIGO_SHIBBOLETH"])
+
+        self.mutation_string = """
+            mutation ExternalJobsUploadMutation($input: UploadExternalBilbyJobsMutationInput!) {
+              uploadExternalBilbyJobs(input: $input) {
+                result {
+                  jobId
+                  error
+                }
+              }
+            }
+        """
+
+        EventID.create(event_id="GW123456_123456", gps_time=1126259462.391)
+
+    def make_job_input(self, name, event_id=None):
+        job_input = {
+            "details": {
+                "name": name,
+                "description": "Test Description",
+                "private": False,
+            },
+            "iniFile": create_test_ini_string({"label": name}, complete=True),
+            "resultUrl": f"https://www.example.com/{name}.h5",
+        }
+        if event_id is not None:
+            job_input["eventId"] = event_id
+        return job_input
+
+    @silence_errors
+    def test_batch_upload_unauthorised_user(self):
+        self.deauthenticate()
+
+        response = self.query(self.mutation_string, input_data={"jobs": [self.make_job_input("myjob1")]})
+
+        self.assertEqual(
+            response.errors[0]["message"],
+            "You do not have permission to perform this action",
+        )
+        self.assertFalse(BilbyJob.objects.all().exists())
+
+    def test_batch_upload_success(self):
+        response = self.query(
+            self.mutation_string,
+            input_data={"jobs": [self.make_job_input("myjob1"), self.make_job_input("myjob2", "GW123456_123456")]},
+        )
+
+        self.assertIsNone(response.errors)
+        results = response.data["uploadExternalBilbyJobs"]["result"]
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(r["jobId"] and r["error"] is None for r in results))
+
+        first = BilbyJob.objects.get(name="myjob1")
+        second = BilbyJob.objects.get(name="myjob2")
+        self.assertEqual(first.job_type, BilbyJobType.EXTERNAL)
+        self.assertIsNone(first.event_id)
+        self.assertEqual(second.event_id.event_id, "GW123456_123456")
+        self.assertTrue(ExternalBilbyJob.objects.filter(job=second, url="https://www.example.com/myjob2.h5").exists())
+
+    @silence_errors
+    def test_batch_upload_partial_failure(self):
+        response = self.query(
+            self.mutation_string,
+            input_data={
+                "jobs": [
+                    self.make_job_input("bad$name"),
+                    self.make_job_input("myjob2", "GW999999_999999"),
+                    self.make_job_input("myjob3"),
+                ]
+            },
+        )
+
+        results = response.data["uploadExternalBilbyJobs"]["result"]
+        self.assertEqual(
+            [r["error"] for r in results],
+            [
+                "Job name must not contain any spaces or special characters.",
+                "Event ID 'GW999999_999999' not found.",
+                None,
+            ],
+        )
+        self.assertIsNone(results[0]["jobId"])
+        self.assertIsNone(results[1]["jobId"])
+        self.assertIsNotNone(results[2]["jobId"])
+
+        self.assertEqual(list(BilbyJob.objects.values_list("name", flat=True)), ["myjob3"])
+        self.assertEqual(ExternalBilbyJob.objects.count(), 1)
+
+    @silence_errors
+    def test_batch_upload_ligo_event_id_non_ligo_user(self):
+        self.authenticate()
+        EventID.create(event_id="GW654321_654321", gps_time=1126259462.391, is_ligo_event=True)
+
+        response = self.query(
+            self.mutation_string, input_data={"jobs": [self.make_job_input("myjob1", "GW654321_654321")]}
+        )
+
+        results = response.data["uploadExternalBilbyJobs"]["result"]
+        self.assertEqual(
+            results, [{"jobId": None, "error": "You do not have permission to use event ID 'GW654321_654321'."}]
+        )
+        self.assertFalse(BilbyJob.objects.exists())
+
+    @silence_errors
+    def test_batch_upload_unexpected_error_is_not_sent_to_client(self):
+        with mock.patch(
+            "bilbyui.views.ExternalBilbyJob.objects.create", side_effect=DatabaseError("table bilbyui_job is locked")
+        ):
+            response = self.query(self.mutation_string, input_data={"jobs": [self.make_job_input("myjob1")]})
+
+        results = response.data["uploadExternalBilbyJobs"]["result"]
+        self.assertEqual(results, [{"jobId": None, "error": "Failed to upload job"}])
+        self.assertFalse(BilbyJob.objects.exists())
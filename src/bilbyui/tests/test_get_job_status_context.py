@@ -54,7 +54,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_badge_class"], "dark")
         self.assertEqual(result["status_date"], self.job.last_updated)
 
-    @mock.patch("bilbyui.views.request_job_filter", return_value=("OK", []))
+    @mock.patch("bilbyui.views.request_cached_job_filter", return_value=("OK", []))
     def test_empty_filter_result_returns_unknown(self, mock_filter):
         result = _get_job_status_context(self.job, self.user)
 
@@ -63,7 +63,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], self.job.last_updated)
         mock_filter.assert_called_once_with(self.user.id, ids=[10001])
 
-    @mock.patch("bilbyui.views.request_job_filter", return_value=("UNKNOWN", "Error getting job filter"))
+    @mock.patch("bilbyui.views.request_cached_job_filter", return_value=("UNKNOWN", "Error getting job filter"))
     def test_controller_unavailable_returns_unknown(self, mock_filter):
         result = _get_job_status_context(self.job, self.user)
 
@@ -73,7 +73,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         mock_filter.assert_called_once_with(self.user.id, ids=[10001])
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=("OK", [{"history": []}]),
     )
     def test_empty_history_returns_unknown(self, mock_filter):
@@ -84,7 +84,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], self.job.last_updated)
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=(
             "OK",
             [
@@ -100,7 +100,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_badge_class"], "primary")
         self.assertEqual(result["status_date"], "2024-03-01 10:00:00 UTC")
 
-    @mock.patch("bilbyui.views.request_job_filter", return_value=("OK", ["malformed"]))
+    @mock.patch("bilbyui.views.request_cached_job_filter", return_value=("OK", ["malformed"]))
     def test_all_non_dict_records_return_unknown(self, mock_filter):
         result = _get_job_status_context(self.job, self.user)
 
@@ -109,7 +109,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], self.job.last_updated)
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=("OK", [{}]),
     )
     def test_missing_history_key_returns_unknown(self, mock_filter):
@@ -120,7 +120,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], self.job.last_updated)
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=("OK", [{"history": [{"state": 50, "timestamp": "not-a-timestamp"}]}]),
     )
     def test_invalid_history_entries_fall_back_to_last_updated(self, mock_filter):
@@ -131,7 +131,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], self.job.last_updated)
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=("OK", [{"history": [{"state": 500, "timestamp": "2024-03-01 10:00:00 UTC"}]}]),
     )
     def test_successful_status_fetch(self, mock_filter):
@@ -142,7 +142,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], "2024-03-01 10:00:00 UTC")
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=(
             "OK",
             [
@@ -163,7 +163,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], "2024-03-02 10:00:00 UTC")
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=(
             "OK",
             [
@@ -180,7 +180,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(result["status_date"], "2024-03-02 10:00:00 UTC")
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=(
             "OK",
             [{"id": 999, "history": [{"state": 500, "timestamp": "2024-03-01 10:00:00 UTC"}]}],
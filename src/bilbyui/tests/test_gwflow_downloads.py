@@ -44,6 +44,36 @@ class GWFlowDownloadTestCase(BilbyTestCase):
             self.assertEqual(b"".join(response.streaming_content), b"binary file content")
             self.assertIn('filename="data.h5"', response.headers.get("Content-Disposition", ""))
 
+    def test_file_download_gwflow_file_accel_redirect(self):
+        """Test downloading a GWFlowFile is handed to nginx when FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION is set."""
+        with override_settings(
+            GWFLOW_FILE_UPLOAD_DIR=Path(self.temp_dir.name) / "gwflow",
+            EXTERNAL_STORAGE_PATH=self.temp_dir.name,
+            FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION="/_job_data/",
+        ):
+            job = GWFlowJob.objects.create(
+                sname="S230601ag_accel",
+                user=self.user,
+                ligo_only=False,
+            )
+            gwflow_file = GWFlowFile.objects.create(
+                job=job,
+                analysis_uid="",
+                path="outdir/data.h5",
+                file_name="data.h5",
+                uploaded=True,
+            )
+
+            job_file_dir = Path(self.temp_dir.name) / "gwflow" / str(job.id)
+            job_file_dir.mkdir(parents=True, exist_ok=True)
+            (job_file_dir / str(gwflow_file.id)).write_bytes(b"binary file content")
+
+            response = self.client.get(f"/file_download/?fileId={gwflow_file.download_token}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, b"")
+            self.assertEqual(response.headers["X-Accel-Redirect"], f"/_job_data/gwflow/{job.id}/{gwflow_file.id}")
+            self.assertIn('filename="data.h5"', response.headers.get("Content-Disposition", ""))
+
     def test_file_download_gwflow_file_unuploaded_returns_404(self):
         """Test download fails with 404 when uploaded=False."""
         with override_settings(GWFLOW_FILE_UPLOAD_DIR=self.temp_dir.name):
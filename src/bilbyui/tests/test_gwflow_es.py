@@ -1,11 +1,10 @@
 from unittest.mock import MagicMock, patch
 
-import elasticsearch
 import requests
 from django.core.management import call_command
 from django.test import override_settings
 
-from bilbyui.models import BilbyJob, EventID, GWFlowJob
+from bilbyui.models import BilbyJob, ElasticSearchOutbox, EventID, GWFlowJob
 from bilbyui.tests.test_utils import create_test_ini_string
 from bilbyui.tests.testcases import BilbyTestCase
 from bilbyui.utils.gwflow_es import (
@@ -72,6 +71,7 @@ class TestGWFlowESDocBuilder(BilbyTestCase):
 
         doc = build_gwflow_es_doc(self.job, metadata)
 
+        self.assertEqual(doc["id"], self.job.id)
         self.assertEqual(doc["user"]["name"], "Jane Doe")
         self.assertEqual(doc["sname"], "S150914a")
         self.assertEqual(doc["schemaVersion"], "v3")
@@ -199,92 +199,54 @@ class TestGWFlowESUpdateRemove(BilbyTestCase):
         )
 
     @override_settings(IGNORE_ELASTIC_SEARCH=True)
-    @patch("elasticsearch.Elasticsearch")
-    def test_update_ignored(self, mock_es):
+    def test_update_ignored(self):
         gwflow_elastic_search_update(self.job, {})
-        mock_es.assert_not_called()
+        self.assertFalse(ElasticSearchOutbox.objects.exists())
 
     @override_settings(IGNORE_ELASTIC_SEARCH=True)
-    @patch("elasticsearch.Elasticsearch")
-    def test_remove_ignored(self, mock_es):
+    def test_remove_ignored(self):
         gwflow_elastic_search_remove(self.job)
-        mock_es.assert_not_called()
+        self.assertFalse(ElasticSearchOutbox.objects.exists())
 
-    @override_settings(
-        IGNORE_ELASTIC_SEARCH=False,
-        ELASTIC_SEARCH_HOST="localhost",
-        ELASTIC_SEARCH_API_KEY="test_key",
-        ELASTIC_SEARCH_GWFLOW_INDEX="gwflow_test_idx",
-    )
-    @patch("elasticsearch.Elasticsearch")
-    def test_update_and_index_fallback(self, mock_es_cls):
-        mock_client = MagicMock()
-        mock_es_cls.return_value = mock_client
-        mock_client.update.side_effect = elasticsearch.NotFoundError(404, "not found", {})
+    @override_settings(IGNORE_ELASTIC_SEARCH=False, ELASTIC_SEARCH_GWFLOW_INDEX="gwflow_test_idx")
+    def test_update_queues_upsert(self):
+        ElasticSearchOutbox.objects.all().delete()
 
         gwflow_elastic_search_update(self.job, {})
 
-        mock_client.update.assert_called_once()
-        mock_client.index.assert_called_once()
+        row = ElasticSearchOutbox.objects.get()
+        self.assertEqual(row.index, "gwflow_test_idx")
+        self.assertEqual(row.doc_id, self.job.id)
+        self.assertEqual(row.action, ElasticSearchOutbox.ACTION_INDEX)
+        self.assertEqual(row.document, build_gwflow_es_doc(self.job, {}))
 
-    @override_settings(
-        IGNORE_ELASTIC_SEARCH=False,
-        ELASTIC_SEARCH_HOST="localhost",
-        ELASTIC_SEARCH_API_KEY="test_key",
-        ELASTIC_SEARCH_GWFLOW_INDEX="gwflow_test_idx",
-    )
-    @patch("elasticsearch.Elasticsearch")
-    def test_remove_swallows_not_found(self, mock_es_cls):
-        mock_client = MagicMock()
-        mock_es_cls.return_value = mock_client
-        mock_client.delete.side_effect = elasticsearch.NotFoundError(404, "not found", {})
+    @override_settings(IGNORE_ELASTIC_SEARCH=False, ELASTIC_SEARCH_GWFLOW_INDEX="gwflow_test_idx")
+    def test_remove_queues_delete(self):
+        ElasticSearchOutbox.objects.all().delete()
 
         gwflow_elastic_search_remove(self.job)
-        mock_client.delete.assert_called_once()
+
+        row = ElasticSearchOutbox.objects.get()
+        self.assertEqual((row.index, row.doc_id, row.action), ("gwflow_test_idx", self.job.id, "delete"))
 
     @override_settings(IGNORE_ELASTIC_SEARCH=True)
-    @patch("elasticsearch.Elasticsearch")
-    def test_update_child_job_ids_ignored(self, mock_es):
+    def test_update_child_job_ids_ignored(self):
         update_child_job_ids(self.job)
-        mock_es.assert_not_called()
+        self.assertFalse(ElasticSearchOutbox.objects.exists())
 
-    @override_settings(
-        IGNORE_ELASTIC_SEARCH=False,
-        ELASTIC_SEARCH_HOST="localhost",
-        ELASTIC_SEARCH_API_KEY="test_key",
-        ELASTIC_SEARCH_GWFLOW_INDEX="gwflow_test_idx",
-    )
-    @patch("elasticsearch.Elasticsearch")
-    def test_update_child_job_ids_updates_doc(self, mock_es_cls):
-        mock_client = MagicMock()
-        mock_es_cls.return_value = mock_client
+    @override_settings(IGNORE_ELASTIC_SEARCH=False, ELASTIC_SEARCH_GWFLOW_INDEX="gwflow_test_idx")
+    def test_update_child_job_ids_queues_partial_update(self):
+        ElasticSearchOutbox.objects.all().delete()
 
         update_child_job_ids(self.job)
 
-        mock_client.update.assert_called_once()
-        call_kwargs = mock_client.update.call_args.kwargs
-        self.assertEqual(call_kwargs["index"], "gwflow_test_idx")
-        self.assertEqual(call_kwargs["id"], self.job.id)
+        row = ElasticSearchOutbox.objects.get()
+        self.assertEqual((row.index, row.doc_id, row.action), ("gwflow_test_idx", self.job.id, "update"))
         self.assertEqual(
-            call_kwargs["doc"]["childJobIds"],
+            row.document["childJobIds"],
             list(self.job.bilby_jobs.values_list("id", flat=True)),
         )
 
-    @override_settings(
-        IGNORE_ELASTIC_SEARCH=False,
-        ELASTIC_SEARCH_HOST="localhost",
-        ELASTIC_SEARCH_API_KEY="test_key",
-        ELASTIC_SEARCH_GWFLOW_INDEX="gwflow_test_idx",
-    )
-    @patch("elasticsearch.Elasticsearch")
-    def test_update_child_job_ids_swallows_not_found(self, mock_es_cls):
-        mock_client = MagicMock()
-        mock_es_cls.return_value = mock_client
-        mock_client.update.side_effect = elasticsearch.NotFoundError(404, "not found", {})
-
-        update_child_job_ids(self.job)
-        mock_client.update.assert_called_once()
-
     @override_settings(IGNORE_ELASTIC_SEARCH=False)
     @patch("bilbyui.models.gwflow_elastic_search_remove")
     def test_pre_delete_signal(self, mock_remove):
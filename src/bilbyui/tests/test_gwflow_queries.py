@@ -8,6 +8,7 @@ from bilbyui.models import BilbyJob, EventID, GWFlowFile, GWFlowJob
 from bilbyui.schema import BilbyJobNode, GWFlowJobNode, PublicBilbyJobFilter, UserBilbyJobFilter
 from bilbyui.tests.testcases import BilbyTestCase
 from bilbyui.types import GWFlowFileType
+from bilbyui.utils.search_cursor import encode_search_cursor
 
 User = get_user_model()
 
@@ -187,7 +188,7 @@ class TestGWFlowQueries(BilbyTestCase):
             search="S230601ag",
             time_range="all",
             page_size=20,
-            offset=0,
+            search_after=None,
             include_pruned=False,
         )
         edges = res.data["gwflowJobs"]["edges"]
@@ -227,11 +228,11 @@ class TestGWFlowQueries(BilbyTestCase):
             search="",
             time_range="all",
             page_size=20,
-            offset=0,
+            search_after=None,
             include_pruned=False,
         )
 
-    @mock.patch("elasticsearch.Elasticsearch")
+    @mock.patch("bilbyui.services.gwflow.get_es_client")
     def test_gwflow_jobs_connection_files_no_nplus1(self, mock_es_cls):
         """
         gwflowJobs connection querying files should not issue one query per node (N+1).
@@ -280,12 +281,12 @@ class TestGWFlowQueries(BilbyTestCase):
         """
 
         self._auth_as(self.normal_user)
-        with self.assertNumQueries(6):
+        with self.assertNumQueries(4):
             res = self.query(query)
         self.assertResponseNoErrors(res)
         self.assertEqual(len(res.data["gwflowJobs"]["edges"]), 3)
 
-    @mock.patch("bilbyui.schema.request_job_filter", return_value=(True, []))
+    @mock.patch("bilbyui.schema.request_cached_job_filter", return_value=(True, []))
     def test_bilby_job_node_gwflow_additions(self, mock_req_filter):
         # Create a BilbyJob linked to GWFlowJob
         linked_job = BilbyJob.objects.create(
@@ -333,7 +334,7 @@ class TestGWFlowQueries(BilbyTestCase):
         self.assertIsNone(unlinked_data["gwflowAnalysisUid"])
         self.assertIsNone(unlinked_data["gwflowJob"])
 
-    @mock.patch("bilbyui.schema.request_job_filter", return_value=(True, []))
+    @mock.patch("bilbyui.schema.request_cached_job_filter", return_value=(True, []))
     def test_bilby_job_node_gwflow_job_visibility(self, mock_req_filter):
         # Bilby job linked to LIGO-only GWFlowJob
         ligo_linked_job = BilbyJob.objects.create(
@@ -369,7 +370,7 @@ class TestGWFlowQueries(BilbyTestCase):
         self.assertIsNotNone(res_ligo.data["bilbyJob"]["gwflowJob"])
         self.assertEqual(res_ligo.data["bilbyJob"]["gwflowJob"]["sname"], "S230601ah")
 
-    @mock.patch("bilbyui.schema.request_job_filter")
+    @mock.patch("bilbyui.schema.request_cached_job_filter")
     def test_gwflow_bilby_jobs_resolve_real_job_status(self, mock_req_filter):
         # A BilbyJob linked to a GWFlowJob with a job_controller_id should resolve its
         # real controller status (not "Unknown") when queried via bilbyJobs.
@@ -496,10 +497,11 @@ class TestGWFlowQueries(BilbyTestCase):
             "page": 1,
             "page_size": 20,
         }
-        cursor_0 = to_global_id("arrayconnection", 0)
-        res_cursor = self.query(query, variables={"first": 20, "after": cursor_0})
+        cursor = encode_search_cursor([1700000000000, self.job_public.id + 1])
+        res_cursor = self.query(query, variables={"first": 20, "after": cursor})
         self.assertResponseNoErrors(res_cursor)
         self.assertEqual(len(res_cursor.data["gwflowJobs"]["edges"]), 1)
+        self.assertEqual(mock_list_jobs.call_args.kwargs["search_after"], [1700000000000, self.job_public.id + 1])
 
     @mock.patch("bilbyui.schema.list_gwflow_jobs")
     def test_gwflow_jobs_connection_malformed_cursor(self, mock_list_jobs):
@@ -538,6 +540,6 @@ class TestGWFlowQueries(BilbyTestCase):
             search="",
             time_range="all",
             page_size=20,
-            offset=0,
+            search_after=None,
             include_pruned=False,
         )
@@ -45,20 +45,13 @@ class TestGWFlowServices(BilbyTestCase):
             is_pruned=True,
         )
 
-    @patch("elasticsearch.Elasticsearch")
-    def test_list_gwflow_jobs_connection_error(self, mock_es_cls):
-        mock_es_cls.side_effect = elasticsearch.exceptions.ConnectionError("Connection refused")
-        res = list_gwflow_jobs(self.non_ligo_user)
-        self.assertEqual(res["jobs"], {})
-        self.assertFalse(res["has_next"])
-
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_private_info_query(self, mock_es_cls):
         res = list_gwflow_jobs(self.non_ligo_user, search="_private_info_.userId:100")
         self.assertEqual(res["jobs"], {})
         mock_es_cls.assert_not_called()
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_index_not_found(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -67,7 +60,7 @@ class TestGWFlowServices(BilbyTestCase):
         res = list_gwflow_jobs(self.non_ligo_user)
         self.assertEqual(res["jobs"], {})
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_search_connection_error(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -78,7 +71,7 @@ class TestGWFlowServices(BilbyTestCase):
         self.assertFalse(res["has_next"])
         mock_client.search.assert_called_once()
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_non_ligo_user_query(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -101,7 +94,7 @@ class TestGWFlowServices(BilbyTestCase):
 
         self.assertIn(self.job_public.id, res["jobs"])
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_ligo_user_query(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -122,7 +115,7 @@ class TestGWFlowServices(BilbyTestCase):
 
         self.assertIn(self.job_ligo.id, res["jobs"])
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_reconciliation_mismatch_bails(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -139,7 +132,7 @@ class TestGWFlowServices(BilbyTestCase):
         # Reconciliation will see count mismatch (1 returned from ES vs 0 passing DB filter for non_ligo)
         self.assertEqual(res["jobs"], {})
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_skips_malformed_non_numeric_id(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -157,7 +150,7 @@ class TestGWFlowServices(BilbyTestCase):
         self.assertIn(self.job_public.id, res["jobs"])
         self.assertEqual(len(res["records"]), 1)
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_skips_non_dict_hit(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -175,7 +168,7 @@ class TestGWFlowServices(BilbyTestCase):
         self.assertIn(self.job_public.id, res["jobs"])
         self.assertEqual(len(res["records"]), 1)
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_skips_dict_hit_missing_id(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -193,7 +186,7 @@ class TestGWFlowServices(BilbyTestCase):
         self.assertIn(self.job_public.id, res["jobs"])
         self.assertEqual(len(res["records"]), 1)
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_has_next_ignores_non_numeric_trailing_id(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
@@ -218,7 +211,7 @@ class TestGWFlowServices(BilbyTestCase):
         self.assertFalse(res["has_next"])
         self.assertEqual(len(res["records"]), 2)
 
-    @patch("elasticsearch.Elasticsearch")
+    @patch("bilbyui.services.gwflow.get_es_client")
     def test_list_gwflow_jobs_returns_extra_record_for_has_next(self, mock_es_cls):
         mock_client = MagicMock()
         mock_es_cls.return_value = mock_client
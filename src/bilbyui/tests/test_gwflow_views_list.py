@@ -130,7 +130,7 @@ class TestGWFlowJobsListView(BilbyTestCase):
             response = self.client.get(self.url, {"search": "foo", "time_range": "1d", "page": 2})
 
         self.assertEqual(response.status_code, 200)
-        mock_list.assert_called_once_with(self.user, search="foo", time_range="1d", page=2)
+        mock_list.assert_called_once_with(self.user, search="foo", time_range="1d", page=2, search_after=None)
 
     def test_row_building_counts_from_db(self):
         job1 = GWFlowJob.objects.create(sname="S230601ag", user=self.user)
@@ -291,7 +291,7 @@ class TestGWFlowJobsListView(BilbyTestCase):
             response = self.client.get(self.url, {"page": "abc", "time_range": "invalid"})
 
         self.assertEqual(response.status_code, 200)
-        mock_list.assert_called_once_with(self.user, search="", time_range="all", page=1)
+        mock_list.assert_called_once_with(self.user, search="", time_range="all", page=1, search_after=None)
 
     def test_navbar_active_link(self):
         with mock.patch("bilbyui.views.list_gwflow_jobs", side_effect=_gwflow_jobs_side_effect()):
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from bilbyui.tests.testcases import BilbyTestCase
+
+# Packages from the scientific stack that the web tier should only import when a view needs them
+HEAVY_PACKAGES = {"astropy", "bilby", "bilby_pipe", "gwosc", "lal", "numpy", "scipy"}
+
+# The most time (in seconds) importing the web tier may take. Wall clock timings vary too much on a loaded machine (for
+# example under manage.py test --parallel), so the budget is only checked when CHECK_IMPORT_TIME is set
+IMPORT_TIME_BUDGET = 1.0
+
+IMPORT_WEB_TIER = f"""
+import sys
+
+import django
+
+django.setup()
+
+import gw_bilby.schema
+import gw_bilby.urls
+
+print(",".join(sorted({{name for name in sys.modules if name.split(".")[0] in {HEAVY_PACKAGES!r}}})))
+"""
+
+
+def import_web_tier():
+    """
+    Imports the web tier in a new interpreter, as a gunicorn worker or management command would
+
+    :return: A tuple (heavy_packages, import_time) of the heavy packages that were imported, and the total time spent
+        importing modules in seconds according to python -X importtime
+    """
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "gw_bilby.test")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_WEB_TIER],
+        cwd=Path(__file__).resolve().parents[2],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Each line is "import time: self [us] | cumulative | imported package", nested imports are indented
+    import_time = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            import_time += int(cumulative) / 1e6
+
+    return set(filter(None, result.stdout.strip().split(","))), import_time
+
+
+class TestImportTime(BilbyTestCase):
+    def test_web_tier_import(self):
+        heavy_packages, _ = import_web_tier()
+
+        self.assertEqual(heavy_packages, set(), "The web tier should not import the scientific stack at startup")
+
+    @unittest.skipUnless(os.environ.get("CHECK_IMPORT_TIME"), "Set CHECK_IMPORT_TIME to check the import time budget")
+    def test_web_tier_import_time(self):
+        _, import_time = import_web_tier()
+
+        self.assertLess(import_time, IMPORT_TIME_BUDGET)
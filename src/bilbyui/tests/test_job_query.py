@@ -63,7 +63,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         return 1, "Test Status", datetime.fromtimestamp(0)
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_query(self, *args):
@@ -76,7 +76,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_user_query(self, *args):
@@ -97,7 +97,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         return_value=(None, [{"id": 1, "history": None}]),
     )
     @mock.patch("bilbyui.schema.derive_job_status", side_effect=derive_job_status_mock)
@@ -118,7 +118,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         return_value=(None, [{"id": 1, "history": None}]),
     )
     def test_bilby_job_status_query_empty_history(self, *args):
@@ -139,7 +139,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_last_updated_query(self, *args):
@@ -151,7 +151,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_labels_query(self, *args):
@@ -163,7 +163,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_event_id_query(self, *args):
@@ -185,7 +185,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_supporting_files_dont_exist(self, *args):
@@ -242,7 +242,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_query_anonymous_user(self, *args):
@@ -275,7 +275,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected_none, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_query_non_ligo_user(self, *args):
@@ -330,7 +330,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertDictEqual(expected_none, response.data, "bilbyJob query returned unexpected data.")
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_job_query_ligo_user(self, *args):
@@ -399,7 +399,7 @@ class TestBilbyJobQueries(BilbyTestCase):
 
     @silence_errors
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_jobs_query(self, request_job_filter_mock, *args):
@@ -535,7 +535,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertTrue(all(isinstance(x, int) for x in request_job_filter_mock.call_args[1]["ids"]))
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_jobs_query_labels_event_id_no_nplus1(self, *args):
@@ -575,7 +575,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertEqual(len(response.data["bilbyJobs"]["edges"]), 4)
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         side_effect=lambda *args, **kwargs: (True, []),
     )
     def test_bilby_jobs_query_gwflow_job_no_nplus1(self, *args):
@@ -616,7 +616,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         self.assertEqual(len(response.data["bilbyJobs"]["edges"]), 4)
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         return_value=("UNKNOWN", []),
     )
     def test_bilby_jobs_query_job_controller_down(self, *args):
@@ -646,7 +646,7 @@ class TestBilbyJobQueries(BilbyTestCase):
         )
 
     @mock.patch(
-        "bilbyui.schema.request_job_filter",
+        "bilbyui.schema.request_cached_job_filter",
         return_value=("OK", ["malformed", {"id": 999, "history": []}]),
     )
     def test_bilby_jobs_query_malformed_controller_entry(self, *args):
@@ -674,7 +674,7 @@ class TestBilbyJobQueries(BilbyTestCase):
             "bilbyJobs query returned unexpected data with malformed controller entries.",
         )
 
-    @mock.patch("bilbyui.schema.request_job_filter")
+    @mock.patch("bilbyui.schema.request_cached_job_filter")
     def test_bilby_jobs_query_no_controller_ids_skips_request(self, request_job_filter_mock):
         """
         bilbyJobs query should not call request_job_filter when no jobs have job controller ids
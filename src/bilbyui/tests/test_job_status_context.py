@@ -61,7 +61,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(context["status_badge_class"], "dark")
         self.assertEqual(context["status_date"], job.last_updated)
 
-    @mock.patch("bilbyui.views.request_job_filter", return_value=("OK", []))
+    @mock.patch("bilbyui.views.request_cached_job_filter", return_value=("OK", []))
     def test_empty_job_controller_response_returns_unknown(self, mock_filter):
         job = BilbyJob.objects.create(
             user_id=self.user.id,
@@ -77,7 +77,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(context["status_badge_class"], "dark")
         mock_filter.assert_called_once_with(self.user.id, ids=[42])
 
-    @mock.patch("bilbyui.views.request_job_filter")
+    @mock.patch("bilbyui.views.request_cached_job_filter")
     def test_running_job_returns_status_from_controller(self, mock_filter):
         timestamp = "2020-01-01 12:00:00 UTC"
         mock_filter.return_value = (
@@ -98,7 +98,7 @@ class TestGetJobStatusContext(BilbyTestCase):
         self.assertEqual(context["status_badge_class"], "info")
         self.assertEqual(context["status_date"], timestamp)
 
-    @mock.patch("bilbyui.views.request_job_filter")
+    @mock.patch("bilbyui.views.request_cached_job_filter")
     def test_error_job_uses_danger_badge(self, mock_filter):
         timestamp = "2021-06-15 08:30:00 UTC"
         mock_filter.return_value = (
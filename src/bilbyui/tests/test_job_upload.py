@@ -149,7 +149,8 @@ class TestJobUpload(BilbyTestCase):
         self.assertTrue((Path(job_dir) / "results_page").is_dir())
         self.assertTrue((Path(job_dir) / "myjob_config_complete.ini").is_file())
 
-        self.assertTrue((Path(job_dir) / "archive.tar.gz").is_file())
+        # The archive is generated when it's downloaded, rather than being stored alongside the unpacked job
+        self.assertFalse((Path(job_dir) / "archive.tar.gz").exists())
 
     @override_settings(JOB_UPLOAD_DIR=TemporaryDirectory().name)
     def test_job_upload_success_outdir_replace(self):
@@ -196,7 +197,7 @@ class TestJobUpload(BilbyTestCase):
         self.assertTrue((Path(job_dir) / "results_page").is_dir())
         self.assertTrue((Path(job_dir) / "another_job_config_complete.ini").is_file())
 
-        self.assertTrue((Path(job_dir) / "archive.tar.gz").is_file())
+        self.assertFalse((Path(job_dir) / "archive.tar.gz").exists())
 
     @override_settings(JOB_UPLOAD_DIR=TemporaryDirectory().name)
     @silence_errors
@@ -703,7 +704,7 @@ class TestJobUploadSupportingFiles(BilbyTestCase):
         self.assertTrue((Path(job_dir) / "results_page").is_dir())
         self.assertTrue((Path(job_dir) / "myjob_config_complete.ini").is_file())
 
-        self.assertTrue((Path(job_dir) / "archive.tar.gz").is_file())
+        self.assertFalse((Path(job_dir) / "archive.tar.gz").exists())
 
         return job, job_dir
 
@@ -1482,7 +1483,9 @@ class TestHdf5JobUpload(BilbyTestCase):
         self.assertTrue((Path(job_dir) / "results_page").is_dir())
         self.assertTrue((Path(job_dir) / "result" / "result.hdf5").is_file())
         self.assertTrue((Path(job_dir) / f"{test_name}_config_complete.ini").is_file())
-        self.assertTrue((Path(job_dir) / "archive.tar.gz").is_file())
+
+        # The archive is generated when it's downloaded, rather than copying the result file in to it
+        self.assertFalse((Path(job_dir) / "archive.tar.gz").exists())
 
     @override_settings(JOB_UPLOAD_DIR=TemporaryDirectory().name)
     def test_hdf5_job_upload_invalid_hdf5_extension(self):
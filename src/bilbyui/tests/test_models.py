@@ -342,8 +342,8 @@ class TestFileDownloadToken(BilbyTestCase):
         result = FileDownloadToken.get_paths(self.job, tokens)
         self.assertEqual(result, [None] * 5)
 
-        # No records should exist in the database anymore
-        self.assertFalse(FileDownloadToken.objects.exists())
+        # Expired records are left for the prune_file_download_tokens command to remove
+        self.assertEqual(FileDownloadToken.objects.count(), 5)
 
 
 class TestBilbyJobUploadToken(BilbyTestCase):
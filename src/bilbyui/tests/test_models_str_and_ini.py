@@ -1,5 +1,3 @@
-from unittest import mock
-
 from django.test import override_settings
 
 from bilbyui.models import BilbyJob, EventID, IniKeyValue, Label
@@ -68,8 +66,8 @@ class TestModelStrAndIniGuards(BilbyTestCase):
         with override_settings(IGNORE_ELASTIC_SEARCH=False):
             self.assertIsNone(job.elastic_search_update())
 
-    def test_elastic_search_update_ignores_malformed_ini_value(self):
-        # A malformed/legacy IniKeyValue JSON value must not crash elastic_search_update;
+    def test_elastic_search_document_ignores_malformed_ini_value(self):
+        # A malformed/legacy IniKeyValue JSON value must not crash elastic_search_document;
         # the offending key is indexed as None and the remaining keys are parsed normally.
         IniKeyValue.objects.create(
             job=self.job,
@@ -78,18 +76,8 @@ class TestModelStrAndIniGuards(BilbyTestCase):
             index=0,
             processed=False,
         )
-        with override_settings(IGNORE_ELASTIC_SEARCH=False):
-            with (
-                mock.patch(
-                    "bilbyui.models.request_lookup_users",
-                    return_value=(True, [{"id": self.user.id, "name": "buffy summers"}]),
-                ),
-                mock.patch("elasticsearch.Elasticsearch.update") as update_mock,
-                mock.patch("elasticsearch.Elasticsearch.index"),
-            ):
-                self.job.elastic_search_update()
 
-        self.assertEqual(update_mock.call_count, 1)
-        doc = update_mock.call_args.kwargs["doc"]
+        doc = self.job.elastic_search_document({"id": self.user.id, "name": "buffy summers"})
+
         self.assertIn("corrupt", doc["ini"])
         self.assertIsNone(doc["ini"]["corrupt"])
@@ -36,7 +36,7 @@ class TestJobSubmission(BilbyTestCase):
         self.user = self.create_user()
         self.authenticate()
 
-    @patch("bilbyui.schema.request_job_filter")
+    @patch("bilbyui.schema.request_cached_job_filter")
     @patch("bilbyui.models.submit_job")
     def test_generate_parameter_output(self, mock_api_call, mock_request_job_filter, *args):
         # Try randomly generating 100 jobs
@@ -238,7 +238,7 @@ sampler-kwargs={'queue_size': 4, 'nlive': 2000, 'sample': 'rwalk', 'walks': 100,
         # Generate the output params. Bilby raises if the decimal parser is not updated to handle the rwalk sample case.
         generate_parameter_output(job)
 
-    @patch("bilbyui.models.request_lookup_users", side_effect=request_lookup_users_mock)
+    @patch("bilbyui.utils.es_outbox.get_users", side_effect=request_lookup_users_mock)
     def test_request_lookup_users_mock_branch(self, lookup_users_mock):
         # Exercise the unused lookup-users mock helper so both its branches are covered
         success, users = lookup_users_mock()
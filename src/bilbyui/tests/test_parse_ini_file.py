@@ -45,3 +45,62 @@ class TestParseIniFileErrorBranches(BilbyTestCase):
         # Unprocessed k/v pairs are still persisted despite the data-input failure
         self.assertTrue(IniKeyValue.objects.filter(job=self.job, processed=False).exists())
         self.assertFalse(IniKeyValue.objects.filter(job=self.job, processed=True).exists())
+
+
+@override_settings(IGNORE_ELASTIC_SEARCH=True)
+class TestIncrementalIniKeyValues(BilbyTestCase):
+    def setUp(self):
+        self.user = self.create_user()
+        self.job = BilbyJob.objects.create(
+            user_id=self.user.id,
+            name="test job",
+            description="test job",
+            ini_string=create_test_ini_string({"detectors": "['H1']", "label": "first"}),
+        )
+
+    def test_ini_hash_stored(self):
+        self.job.refresh_from_db()
+        self.assertEqual(len(self.job.ini_hash), 64)
+
+    def test_save_without_ini_change_skips_parse(self):
+        self.job.name = "renamed job"
+        self.job.private = True
+
+        with mock.patch("bilbyui.models.parse_ini_file") as parse_mock:
+            self.job.save()
+
+        parse_mock.assert_not_called()
+
+    def test_save_with_update_fields_skips_parse(self):
+        self.job.ini_string = create_test_ini_string({"detectors": "['H1']", "label": "second"})
+        self.job.description = "new description"
+
+        with mock.patch("bilbyui.models.parse_ini_file") as parse_mock:
+            self.job.save(update_fields=["description"])
+
+        parse_mock.assert_not_called()
+
+    def test_ini_change_only_writes_changed_rows(self):
+        before = dict(IniKeyValue.objects.filter(job=self.job).values_list("id", "value"))
+
+        self.job.ini_string = create_test_ini_string({"detectors": "['H1']", "label": "second"})
+        self.job.save()
+
+        after = dict(IniKeyValue.objects.filter(job=self.job).values_list("id", "value"))
+
+        # Rows are updated in place rather than deleted and re-inserted
+        self.assertEqual(before.keys(), after.keys())
+        changed = {row_id for row_id in before if before[row_id] != after[row_id]}
+        self.assertTrue(
+            set(IniKeyValue.objects.filter(job=self.job, key="label").values_list("id", flat=True)) <= changed
+        )
+        self.assertLess(len(changed), len(before) / 2)
+        self.assertEqual(IniKeyValue.objects.get(job=self.job, key="label", processed=False).value, '"second"')
+
+    def test_duplicate_rows_removed(self):
+        kv = IniKeyValue.objects.get(job=self.job, key="label", processed=False)
+        IniKeyValue.objects.create(job=self.job, key=kv.key, value=kv.value, index=kv.index, processed=kv.processed)
+
+        parse_ini_file(self.job)
+
+        self.assertEqual(IniKeyValue.objects.filter(job=self.job, key="label", processed=False).count(), 1)
@@ -0,0 +1,31 @@
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.utils import timezone
+
+from bilbyui.models import BilbyJob, FileDownloadToken
+from bilbyui.tests.test_utils import create_test_ini_string
+from bilbyui.tests.testcases import BilbyTestCase
+
+
+class TestPruneFileDownloadTokens(BilbyTestCase):
+    def setUp(self):
+        self.user = self.create_user()
+        self.job = BilbyJob.objects.create(
+            user_id=self.user.id,
+            name="Test Job",
+            ini_string=create_test_ini_string({"detectors": "['H1']"}),
+        )
+
+    def test_prune_once(self):
+        tokens = FileDownloadToken.create(self.job, ["/data/a.txt", "/data/b.txt", "/data/c.txt"])
+
+        expired = timezone.now() - timezone.timedelta(seconds=settings.FILE_DOWNLOAD_TOKEN_EXPIRY + 1)
+        FileDownloadToken.objects.filter(id__in=[tokens[0].id, tokens[1].id]).update(created=expired)
+
+        out = StringIO()
+        call_command("prune_file_download_tokens", "--once", stdout=out)
+
+        self.assertIn("File download token prune complete: 2 pruned", out.getvalue())
+        self.assertQuerySetEqual(FileDownloadToken.objects.values_list("id", flat=True), [tokens[2].id])
@@ -11,12 +11,14 @@ from graphql_relay.node.node import to_global_id
 
 from bilbyui.constants import BilbyJobType
 from bilbyui.models import BilbyJob, EventID
+from bilbyui.services.jobs import PUBLIC_JOBS_SORT
 from bilbyui.tests.test_utils import (
     create_test_ini_string,
     generate_elastic_doc,
     silence_errors,
 )
 from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.search_cursor import encode_search_cursor
 
 User = get_user_model()
 
@@ -258,7 +260,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         return "OK", jobs
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_no_cursor(self, request_job_filter, elasticsearch_search):
         # This job shouldn't appear in the list because it's private and owned by a different user
         other_user = self.create_user(id=self.user.id + 1, name="other user", primary_email="other+1@test.com")
@@ -294,7 +296,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
                     "q": "(*) AND _private_info_.private:false",
                     "size": 51,
                     "from_": 0,
-                    "sort": "job.lastUpdatedTime:desc",
+                    "sort": PUBLIC_JOBS_SORT,
                 },
             )
 
@@ -306,7 +308,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
     @mock.patch(
-        "bilbyui.services.jobs.request_job_filter",
+        "bilbyui.services.jobs.request_cached_job_filter",
         side_effect=request_job_filter_mock_out_of_order_history,
     )
     def test_public_bilby_jobs_query_out_of_order_history(self, request_job_filter, elasticsearch_search):
@@ -350,7 +352,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
     @mock.patch(
-        "bilbyui.services.jobs.request_job_filter",
+        "bilbyui.services.jobs.request_cached_job_filter",
         side_effect=request_job_filter_mock_missing_record,
     )
     def test_public_bilby_jobs_query_missing_job_controller_job(self, request_job_filter, elasticsearch_search):
@@ -391,7 +393,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
                     "q": "(*) AND _private_info_.private:false",
                     "size": 51,
                     "from_": 0,
-                    "sort": "job.lastUpdatedTime:desc",
+                    "sort": PUBLIC_JOBS_SORT,
                 },
             )
 
@@ -401,7 +403,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
     @mock.patch(
-        "bilbyui.services.jobs.request_job_filter",
+        "bilbyui.services.jobs.request_cached_job_filter",
         side_effect=request_job_filter_mock_empty_history,
     )
     def test_public_bilby_jobs_query_empty_history(self, request_job_filter, elasticsearch_search):
@@ -427,7 +429,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
     @mock.patch(
-        "bilbyui.services.jobs.request_job_filter",
+        "bilbyui.services.jobs.request_cached_job_filter",
         side_effect=request_job_filter_mock_missing_history_key,
     )
     def test_public_bilby_jobs_query_missing_history_key(self, request_job_filter, elasticsearch_search):
@@ -452,13 +454,13 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_test_cursor_count(self, request_job_filter, elasticsearch_search):
         # Loop twice, the first loop the user will not be authenticated, the second loop the user will be authenticated
         for _ in range(2):
             variables = {
                 "count": 50,
-                "cursor": "YXJyYXljb25uZWN0aW9uOjk5",
+                "cursor": encode_search_cursor([1577836800000, 99]),
                 "search": "",
                 "timeRange": "all",
             }
@@ -471,20 +473,21 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
                 "publicBilbyJobs query returned unexpected data.",
             )
 
-            # Verify that the "first" and "count" arguments were passed to the elastic search search function
+            # Verify that the "first" and "count" arguments and the cursor's sort values were passed to the elastic
+            # search search function
             self.assertDictEqual(
                 elasticsearch_search.mock_calls[-1].kwargs,
                 {
                     "index": settings.ELASTIC_SEARCH_INDEX,
                     "q": "(*) AND _private_info_.private:false",
                     "size": 51,
-                    "from_": 99,
-                    "sort": "job.lastUpdatedTime:desc",
+                    "search_after": [1577836800000, 99],
+                    "sort": PUBLIC_JOBS_SORT,
                 },
             )
 
-            # Double check that all array connection values from 0 - 100 work as expected
-            for idx in range(100):
+            # Offset based array connection cursors are no longer understood and fall back to the first page
+            for idx in range(3):
                 variables = {
                     "count": 25,
                     "cursor": to_global_id("arrayconnection", idx),
@@ -492,18 +495,16 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
                     "timeRange": "all",
                 }
 
-                # Check that providing a cursor works as expected
                 response = self.query(self.public_bilby_job_query, variables=variables)
 
-                # Verify that the expected results are returned, first = count, after = cursor
                 self.assertDictEqual(
                     elasticsearch_search.mock_calls[-1].kwargs,
                     {
                         "index": settings.ELASTIC_SEARCH_INDEX,
                         "q": "(*) AND _private_info_.private:false",
                         "size": 26,
-                        "from_": idx,
-                        "sort": "job.lastUpdatedTime:desc",
+                        "from_": 0,
+                        "sort": PUBLIC_JOBS_SORT,
                     },
                 )
 
@@ -530,7 +531,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
                     "q": "(*) AND _private_info_.private:false",
                     "size": 26,
                     "from_": 0,
-                    "sort": "job.lastUpdatedTime:desc",
+                    "sort": PUBLIC_JOBS_SORT,
                 },
             )
 
@@ -538,7 +539,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
             self.authenticate()
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_uploaded(self, request_job_filter, elasticsearch_search):
         # This job shouldn't appear in the list because it's private.
         other_user = self.create_user(id=4, name="other user", primary_email="other4@test.com")
@@ -583,7 +584,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @silence_errors
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_unknown_job_type(self, request_job_filter, elasticsearch_search):
         BilbyJob.objects.all().delete()
 
@@ -609,7 +610,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_private_info(self, request_job_filter, elasticsearch_search):
         for term in [
             "_private_info_.private:true",
@@ -627,7 +628,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
             )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_time_ranges(self, request_job_filter, elasticsearch_search):
         for time_range in ["1d", "1w", "1m", "1y", "all"]:
             variables = {"count": 50, "search": None, "timeRange": time_range}
@@ -677,7 +678,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
                 self.assertEqual((to - _from), delta)
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_no_time_range(self, request_job_filter, elasticsearch_search):
         # A client may omit the optional timeRange argument entirely; the resolver should
         # fall back to "all" rather than raising a KeyError (500).
@@ -717,7 +718,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1234)
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_embargo(self, request_job_filter, elasticsearch_search):
         variables = {"count": 50, "search": None, "timeRange": "all", "after": None}
 
@@ -737,13 +738,13 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1234)
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_combine_all(self, request_job_filter, elasticsearch_search):
         variables = {
             "count": 50,
             "search": "test",
             "timeRange": "1m",
-            "cursor": "YXJyYXljb25uZWN0aW9uOjk5",
+            "cursor": encode_search_cursor([1577836800000, 99]),
         }
 
         # Should return expected results
@@ -778,11 +779,11 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         self.assertEqual(
             elasticsearch_search.mock_calls[-1].kwargs,
             elasticsearch_search.mock_calls[-1].kwargs
-            | {"index": settings.ELASTIC_SEARCH_INDEX, "size": 51, "from_": 99},
+            | {"index": settings.ELASTIC_SEARCH_INDEX, "size": 51, "search_after": [1577836800000, 99]},
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_invalid_time_range(self, request_job_filter, elasticsearch_search):
         variables = {"count": 50, "search": None, "timeRange": "invalid"}
 
@@ -802,7 +803,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         "elasticsearch.Elasticsearch.search",
         side_effect=elasticsearch_search_mock_with_corrupt_id,
     )
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_corrupt_non_numeric_id(self, request_job_filter, elasticsearch_search):
         # A corrupt ES record with a non-numeric _id should be filtered out rather
         # than raising a ValueError and 500ing the publicBilbyJobs query.
@@ -817,7 +818,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock_with_stale_record)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_stale_es_record(self, request_job_filter, elasticsearch_search):
         variables = {"count": 50, "search": None, "timeRange": "all"}
 
@@ -833,7 +834,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         "elasticsearch.Elasticsearch.search",
         side_effect=elasticsearch_search_mock_with_missing_source,
     )
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_missing_or_non_dict_source(self, request_job_filter, elasticsearch_search):
         variables = {"count": 50, "search": None, "timeRange": "all"}
 
@@ -850,7 +851,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         "elasticsearch.Elasticsearch.search",
         side_effect=elasticsearch_search_mock_with_non_dict_sections,
     )
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_non_dict_user_and_job_sections(self, request_job_filter, elasticsearch_search):
         variables = {"count": 50, "search": None, "timeRange": "all"}
 
@@ -903,7 +904,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1234)
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_embargo_violation(self, request_job_filter, elasticsearch_search):
         variables = {"count": 50, "search": None, "timeRange": "all"}
 
@@ -923,7 +924,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_private_violation(self, request_job_filter, elasticsearch_search):
         variables = {"count": 50, "search": None, "timeRange": "all"}
 
@@ -941,7 +942,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_malformed_cursor(self, request_job_filter, elasticsearch_search):
         # A malformed cursor (invalid base64 or a non-numeric id) should fall back to the first page
         # instead of raising a ValueError and returning a 500.
@@ -963,7 +964,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
             )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_without_first(self, request_job_filter, elasticsearch_search):
         # Omitting the optional relay `first` connection argument should fall back to the
         # default page size instead of raising a KeyError (500) on this public endpoint.
@@ -995,7 +996,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_first_null(self, request_job_filter, elasticsearch_search):
         # An explicit `first: null` connection argument should fall back to the default page
         # size instead of raising a TypeError (500) on this public endpoint.
@@ -1027,7 +1028,7 @@ class TestPublicBilbyJobsQueries(BilbyTestCase):
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_public_bilby_jobs_query_event_id_uses_prefetched_value(self, request_job_filter, elasticsearch_search):
         # eventId should resolve from the already-prefetched bilby_job.event_id instead of
         # issuing a per-row EventIDType.get_node query (N+1).
@@ -128,7 +128,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertContains(response, "Create a new job or try searching 'Any time'.")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_renders_list_with_data(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         for index in range(25):
@@ -151,7 +151,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertContains(response, "page=2")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", return_value=("UNKNOWN", "Error getting job filter"))
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", return_value=("UNKNOWN", "Error getting job filter"))
     def test_controller_unavailable_renders_unknown(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
@@ -171,7 +171,7 @@ class TestPublicJobsView(BilbyTestCase):
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
     @mock.patch(
-        "bilbyui.services.jobs.request_job_filter",
+        "bilbyui.services.jobs.request_cached_job_filter",
         return_value=("OK", ["malformed", {"id": 999, "history": []}]),
     )
     def test_malformed_controller_entry_does_not_crash(self, request_job_filter, elasticsearch_search):
@@ -191,7 +191,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertContains(response, "Malformed controller job")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_search_filters(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
@@ -218,7 +218,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertNotContains(response, "Other job")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_time_range_filters(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
@@ -248,7 +248,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertNotContains(response, "Old job")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_invalid_time_range_defaults_to_all(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
@@ -266,7 +266,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertContains(response, "Invalid range job")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_invalid_page_defaults_to_one(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
@@ -285,7 +285,7 @@ class TestPublicJobsView(BilbyTestCase):
 
     @override_settings(EMBARGO_START_TIME=1234.0)
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_embargo_filter(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
@@ -348,7 +348,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertNotContains(response, 'href="#">Switch to my jobs')
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_htmx_request_returns_fragment(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
@@ -373,7 +373,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertNotContains(response, "Public Jobs")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_renders_event_id_values(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         event_id = EventID.objects.create(
@@ -401,7 +401,7 @@ class TestPublicJobsView(BilbyTestCase):
         self.assertContains(response, "GW123456")
 
     @mock.patch("elasticsearch.Elasticsearch.search", side_effect=elasticsearch_search_mock)
-    @mock.patch("bilbyui.services.jobs.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.services.jobs.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_renders_no_event_ids_when_missing(self, request_job_filter, elasticsearch_search):
         self.user = self.create_user()
         BilbyJob.objects.create(
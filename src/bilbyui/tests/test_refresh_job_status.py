@@ -0,0 +1,88 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from bilbyui.constants import BilbyJobType
+from bilbyui.models import BilbyJob
+from bilbyui.status import JobStatus
+from bilbyui.tests.test_utils import create_test_ini_string
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.jobs.refresh_job_status import refresh_job_statuses
+
+
+def controller_job(job_id, state, timestamp="2020-01-01 12:00:00 UTC"):
+    return {"id": job_id, "history": [{"state": state, "timestamp": timestamp}]}
+
+
+@override_settings(IGNORE_ELASTIC_SEARCH=True)
+class TestRefreshJobStatuses(BilbyTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls.create_user()
+
+    def make_job(self, name, **kwargs):
+        return BilbyJob.objects.create(
+            user=self.user, name=name, ini_string=create_test_ini_string({"detectors": "['H1']"}), **kwargs
+        )
+
+    @mock.patch("bilbyui.utils.jobs.refresh_job_status.request_job_filter")
+    def test_updates_unfinished_jobs_in_batches(self, request_job_filter_mock):
+        running = self.make_job("running", job_controller_id=1)
+        completed = self.make_job("completed", job_controller_id=2, status=JobStatus.COMPLETED, status_name="Done")
+        queued = self.make_job("queued", job_controller_id=3, status=JobStatus.QUEUED, status_name="Queued")
+        missing = self.make_job("missing", job_controller_id=4)
+        self.make_job("draft")
+        uploaded = self.make_job("uploaded", job_type=BilbyJobType.UPLOADED)
+
+        request_job_filter_mock.side_effect = [
+            ("OK", [controller_job(1, JobStatus.RUNNING), controller_job(3, JobStatus.COMPLETED)]),
+            ("OK", []),
+        ]
+
+        last_updated = BilbyJob.objects.get(id=running.id).last_updated
+        self.assertEqual(refresh_job_statuses(batch_size=2), (3, 2))
+
+        self.assertEqual(
+            request_job_filter_mock.call_args_list,
+            [mock.call(0, ids=[1, 3]), mock.call(0, ids=[4])],
+        )
+
+        running.refresh_from_db()
+        self.assertEqual((running.status, running.status_name), (JobStatus.RUNNING, "Running"))
+        self.assertEqual(running.status_time, datetime.datetime(2020, 1, 1, 12, tzinfo=datetime.UTC))
+        self.assertEqual(running.last_updated, last_updated)
+
+        queued.refresh_from_db()
+        self.assertTrue(queued.has_terminal_status)
+
+        completed.refresh_from_db()
+        self.assertEqual(completed.status_name, "Done")
+
+        missing.refresh_from_db()
+        self.assertIsNone(missing.status)
+
+        uploaded.refresh_from_db()
+        self.assertEqual(uploaded.status, JobStatus.COMPLETED)
+
+    @mock.patch("bilbyui.utils.jobs.refresh_job_status.request_job_filter", return_value=("UNKNOWN", []))
+    def test_stops_when_job_controller_unavailable(self, request_job_filter_mock):
+        self.make_job("first", job_controller_id=1)
+        self.make_job("second", job_controller_id=2)
+
+        with self.assertLogs("bilbyui.utils.jobs.refresh_job_status", level="ERROR"):
+            self.assertEqual(refresh_job_statuses(batch_size=1), (0, 0))
+
+        request_job_filter_mock.assert_called_once()
+
+    @mock.patch("bilbyui.utils.jobs.refresh_job_status.request_job_filter")
+    def test_command_once(self, request_job_filter_mock):
+        self.make_job("running", job_controller_id=1)
+        request_job_filter_mock.return_value = ("OK", [controller_job(1, JobStatus.RUNNING)])
+
+        out = StringIO()
+        call_command("refresh_job_status", "--once", stdout=out)
+
+        self.assertIn("1 checked, 1 updated", out.getvalue())
@@ -8,6 +8,7 @@ from bilbyui.constants import BilbyJobType
 from bilbyui.models import BilbyJob
 from bilbyui.tests.test_utils import create_test_ini_string
 from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.job_archive import job_archive_members, job_archive_size
 from bilbyui.utils.jobs.request_file_list import request_file_list
 
 
@@ -36,6 +37,25 @@ class TestRequestFileListUploaded(BilbyTestCase):
         self.assertEqual(len(file_list), 1)
         self.assertEqual(file_list[0]["path"], "/data/a.txt")
 
+    @override_settings(IGNORE_ELASTIC_SEARCH=True, JOB_UPLOAD_DIR=TemporaryDirectory().name)
+    def test_generated_archive_listed(self):
+        job_dir = self.job.get_upload_directory()
+        (job_dir / "data").mkdir(parents=True, exist_ok=True)
+        (job_dir / "data" / "a.txt").write_text("hi")
+
+        success, file_list = request_file_list(self.job, "", False)
+        self.assertTrue(success)
+
+        archive_size = job_archive_size(job_archive_members(job_dir))
+        self.assertIn({"path": "/archive.tar.gz", "isDir": False, "fileSize": archive_size}, file_list)
+
+        # A stored archive is listed as it is
+        (job_dir / "archive.tar.gz").write_text("archive")
+
+        success, file_list = request_file_list(self.job, "", True)
+        self.assertTrue(success)
+        self.assertEqual([f for f in file_list if f["path"] == "/archive.tar.gz"][0]["fileSize"], 7)
+
     @override_settings(IGNORE_ELASTIC_SEARCH=True, JOB_UPLOAD_DIR=TemporaryDirectory().name)
     def test_sibling_upload_dir_is_rejected(self):
         # job id 123 vs sibling dir 1234: "/uploads/1234/x".startswith("/uploads/123") is True
@@ -69,7 +89,17 @@ class TestRequestFileListUploaded(BilbyTestCase):
 
         success, file_list = request_file_list(self.job, "", False)
         self.assertTrue(success)
-        self.assertEqual(file_list, [])
+        # The job directory is empty, apart from the archive which is generated when it is downloaded
+        self.assertEqual(
+            file_list,
+            [
+                {
+                    "path": "/archive.tar.gz",
+                    "isDir": False,
+                    "fileSize": job_archive_size(job_archive_members(job_dir)),
+                }
+            ],
+        )
 
     @override_settings(IGNORE_ELASTIC_SEARCH=True, JOB_UPLOAD_DIR=TemporaryDirectory().name)
     def test_recursive_listing_returns_all_entries(self):
@@ -67,13 +67,13 @@ class TestSchemaCoverage(BilbyTestCase):
     def test_resolve_params_value_error_returns_none(self, *_):
         self.assertIsNone(BilbyJobNode.resolve_params(mock.Mock(), mock.Mock()))
 
-    @mock.patch("bilbyui.schema.request_job_filter", return_value=(None, [{"id": 2, "history": None}]))
+    @mock.patch("bilbyui.schema.request_cached_job_filter", return_value=(None, [{"id": 2, "history": None}]))
     @mock.patch("bilbyui.schema.derive_job_status", side_effect=KeyError("status unavailable"))
     def test_bilby_job_status_exception_fallback(self, *_):
         response = self.query(JOB_STATUS_QUERY % self.global_id)
         self.assertEqual(response.data["bilbyJob"]["jobStatus"], {"name": "Unknown", "number": 0, "date": "Unknown"})
 
-    @mock.patch("bilbyui.schema.request_job_filter", return_value=(None, [{"id": 2, "history": []}]))
+    @mock.patch("bilbyui.schema.request_cached_job_filter", return_value=(None, [{"id": 2, "history": []}]))
     @mock.patch("bilbyui.schema.derive_job_status", return_value=(JobStatus.DRAFT, "Unknown", None))
     def test_bilby_job_status_none_date_falls_back_to_creation_time(self, *_):
         status = self.query(JOB_STATUS_QUERY % self.global_id).data["bilbyJob"]["jobStatus"]
@@ -81,7 +81,7 @@ class TestSchemaCoverage(BilbyTestCase):
         self.assertEqual(status["number"], JobStatus.DRAFT)
         self.assertEqual(status["date"], str(self.job.creation_time))
 
-    @mock.patch("bilbyui.schema.request_job_filter", side_effect=lambda *a, **k: (True, []))
+    @mock.patch("bilbyui.schema.request_cached_job_filter", side_effect=lambda *a, **k: (True, []))
     def test_bilby_job_status_uploaded(self, *_):
         self.job.job_type = BilbyJobType.UPLOADED
         self.job.save()
@@ -90,7 +90,7 @@ class TestSchemaCoverage(BilbyTestCase):
         self.assertEqual(status["number"], JobStatus.COMPLETED)
         self.assertEqual(status["date"], str(self.job.creation_time))
 
-    @mock.patch("bilbyui.schema.request_job_filter", side_effect=lambda *a, **k: (True, []))
+    @mock.patch("bilbyui.schema.request_cached_job_filter", side_effect=lambda *a, **k: (True, []))
     def test_bilby_job_status_external(self, *_):
         self.job.job_type = BilbyJobType.EXTERNAL
         self.job.save()
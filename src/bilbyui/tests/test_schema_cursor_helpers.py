@@ -1,47 +1,43 @@
-from graphql_relay.node.node import to_global_id
-
-from bilbyui.schema import _pad_result_for_cursor, _parse_after_cursor
+from bilbyui.schema import BilbyPublicJobConnection, _record_cursor, _search_connection
 from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.search_cursor import decode_search_cursor, encode_search_cursor
+
 
+class TestRecordCursor(BilbyTestCase):
+    def test_cursor_holds_sort_values(self):
+        cursor = _record_cursor({"_id": "5", "sort": [1700000000000, 5]})
+        self.assertEqual(decode_search_cursor(cursor, 2), [1700000000000, 5])
 
-class TestParseAfterCursor(BilbyTestCase):
-    def test_missing_cursor_stays_none(self):
-        kwargs = {}
-        _parse_after_cursor(kwargs)
-        self.assertIsNone(kwargs["after"])
+    def test_missing_sort_values(self):
+        self.assertEqual(_record_cursor({"_id": "5"}), encode_search_cursor([]))
 
-    def test_none_cursor_stays_none(self):
-        kwargs = {"after": None}
-        _parse_after_cursor(kwargs)
-        self.assertIsNone(kwargs["after"])
 
-    def test_zero_offset_parsed(self):
-        kwargs = {"after": to_global_id("BilbyJobNode", 0)}
-        _parse_after_cursor(kwargs)
-        self.assertEqual(kwargs["after"], 0)
+class TestSearchConnection(BilbyTestCase):
+    def test_empty_page(self):
+        connection = _search_connection(BilbyPublicJobConnection, [], [], False, False)
 
-    def test_positive_offset_parsed(self):
-        kwargs = {"after": to_global_id("BilbyJobNode", 5)}
-        _parse_after_cursor(kwargs)
-        self.assertEqual(kwargs["after"], 5)
+        self.assertEqual(connection.edges, [])
+        self.assertIsNone(connection.page_info.start_cursor)
+        self.assertIsNone(connection.page_info.end_cursor)
+        self.assertFalse(connection.page_info.has_next_page)
+        self.assertFalse(connection.page_info.has_previous_page)
 
-    def test_malformed_cursor_falls_back_to_none(self):
-        kwargs = {"after": "not-a-valid-cursor"}
-        _parse_after_cursor(kwargs)
-        self.assertIsNone(kwargs["after"])
+    def test_edges_and_page_info(self):
+        records = [{"sort": [3, 3]}, {"sort": [2, 2]}, {"sort": [1, 1]}]
+        edges = [(_record_cursor(records[0]), "a"), (_record_cursor(records[1]), "b")]
 
-    def test_non_numeric_id_falls_back_to_none(self):
-        kwargs = {"after": to_global_id("BilbyJobNode", "abc")}
-        _parse_after_cursor(kwargs)
-        self.assertIsNone(kwargs["after"])
+        connection = _search_connection(BilbyPublicJobConnection, edges, records, True, True)
 
+        self.assertEqual([(edge.cursor, edge.node) for edge in connection.edges], edges)
+        self.assertEqual(connection.page_info.start_cursor, edges[0][0])
+        self.assertTrue(connection.page_info.has_next_page)
+        self.assertTrue(connection.page_info.has_previous_page)
 
-class TestPadResultForCursor(BilbyTestCase):
-    def test_none_cursor_returns_nodes_unpadded(self):
-        self.assertEqual(_pad_result_for_cursor(None, ["a", "b"]), ["a", "b"])
+    def test_end_cursor_follows_last_record(self):
+        # The last hit is not visible to the user, the next page must still follow on from it rather than repeat it
+        records = [{"sort": [2, 2]}, {"sort": [1, 1]}]
+        edges = [(_record_cursor(records[0]), "a")]
 
-    def test_zero_offset_pads_one_entry(self):
-        self.assertEqual(_pad_result_for_cursor(0, ["a", "b"]), [None, "a", "b"])
+        connection = _search_connection(BilbyPublicJobConnection, edges, records, True, False)
 
-    def test_positive_offset_pads_offset_plus_one(self):
-        self.assertEqual(_pad_result_for_cursor(2, ["a", "b"]), [None, None, None, "a", "b"])
+        self.assertEqual(decode_search_cursor(connection.page_info.end_cursor, 2), [1, 1])
@@ -1,3 +1,6 @@
+import io
+import shutil
+import tarfile
 import uuid
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -8,6 +11,7 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client, override_settings
 from django.urls import reverse
 
+from bilbyui.constants import BilbyJobType
 from bilbyui.models import BilbyJob, FileDownloadToken
 from bilbyui.tests.test_utils import (
     create_test_ini_string,
@@ -143,6 +147,10 @@ class TestUploadedJobFileDownload(BilbyTestCase):
         files = get_files(response)
 
         for idx, file in enumerate(files):
+            # The archive isn't stored, it is generated on the fly instead (see test_archive_is_generated)
+            if file["path"] == "/archive.tar.gz":
+                continue
+
             token = self.generate_download_id_from_token(download_tokens[idx])
 
             response = self.http_client.get(f"{reverse(viewname='file_download')}?fileId={token}")
@@ -164,6 +172,10 @@ class TestUploadedJobFileDownload(BilbyTestCase):
         files = get_files(response)
 
         for idx, file in enumerate(files):
+            # The archive isn't stored, it is generated on the fly instead (see test_archive_is_generated)
+            if file["path"] == "/archive.tar.gz":
+                continue
+
             token = self.generate_download_id_from_token(download_tokens[idx])
 
             disk_path = Path(self.job.get_upload_directory()) / file["path"][1:]
@@ -178,6 +190,10 @@ class TestUploadedJobFileDownload(BilbyTestCase):
         files = get_files(response)
 
         for idx, file in enumerate(files):
+            # The archive isn't stored, it is generated on the fly instead (see test_archive_is_generated)
+            if file["path"] == "/archive.tar.gz":
+                continue
+
             token = self.generate_download_id_from_token(download_tokens[idx])
 
             response = self.http_client.get(f"{reverse(viewname='file_download')}?fileId={token}&forceDownload")
@@ -192,3 +208,164 @@ class TestUploadedJobFileDownload(BilbyTestCase):
 
             with (Path(self.job.get_upload_directory()) / file["path"][1:]).open("rb") as f:
                 self.assertEqual(content, f.read())
+
+    @silence_errors
+    def test_accel_redirect(self):
+        download_tokens, response = self.generate_file_download_tokens()
+
+        job_dir = Path(self.job.get_upload_directory()).resolve()
+        storage_path = job_dir.parent.parent
+
+        for file, download_token in zip(get_files(response), download_tokens, strict=True):
+            # The archive is generated by django, so can't be sent by nginx
+            if file["path"] == "/archive.tar.gz":
+                continue
+
+            token = self.generate_download_id_from_token(download_token)
+
+            with override_settings(
+                FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION="/_job_data/", EXTERNAL_STORAGE_PATH=storage_path
+            ):
+                response = self.http_client.get(f"{reverse(viewname='file_download')}?fileId={token}&forceDownload")
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, b"")
+            self.assertEqual(
+                response.headers["X-Accel-Redirect"],
+                f"/_job_data/{(job_dir / file['path'][1:]).relative_to(storage_path).as_posix()}",
+            )
+            self.assertEqual(
+                response.headers["Content-Disposition"],
+                f'attachment; filename="{Path(file["path"][1:]).name}"',
+            )
+
+    @silence_errors
+    def test_accel_redirect_outside_external_storage(self):
+        download_tokens, response = self.generate_file_download_tokens()
+        files = get_files(response)
+
+        file = next(file for file in files if file["path"] != "/archive.tar.gz")
+        token = self.generate_download_id_from_token(download_tokens[files.index(file)])
+
+        # Files that nginx can't serve are still streamed by django
+        with (
+            TemporaryDirectory() as storage_path,
+            override_settings(FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION="/_job_data/", EXTERNAL_STORAGE_PATH=storage_path),
+        ):
+            response = self.http_client.get(f"{reverse(viewname='file_download')}?fileId={token}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Accel-Redirect", response.headers)
+        self.assertEqual(b"".join(response), (Path(self.job.get_upload_directory()) / file["path"][1:]).read_bytes())
+
+    @silence_errors
+    def test_archive_is_generated(self):
+        job_dir = Path(self.job.get_upload_directory())
+
+        download_tokens, response = self.generate_file_download_tokens()
+        files = get_files(response)
+
+        # The archive should be listed, with the size of the generated archive
+        archive = next(file for file in files if file["path"] == "/archive.tar.gz")
+        token = self.generate_download_id_from_token(download_tokens[files.index(archive)])
+
+        response = self.http_client.get(f"{reverse(viewname='file_download')}?fileId={token}&forceDownload")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Type"], "application/octet-stream")
+        self.assertEqual(response.headers["Content-Disposition"], 'attachment; filename="archive.tar.gz"')
+
+        content = b"".join(response.streaming_content)
+        self.assertEqual(len(content), int(archive["fileSize"]))
+        self.assertEqual(int(response.headers["Content-Length"]), int(archive["fileSize"]))
+
+        with tarfile.open(fileobj=io.BytesIO(content)) as tar:
+            self.assertEqual(
+                tar.extractfile("./myjob_config_complete.ini").read(),
+                (job_dir / "myjob_config_complete.ini").read_bytes(),
+            )
+            self.assertNotIn("./archive.tar.gz", tar.getnames())
+
+    def get_archive(self, query="", headers=None):
+        return self.client.get(f"/job-results/{self.job.id}/archive/{query}", headers=headers)
+
+    @silence_errors
+    def test_job_archive(self):
+        job_dir = Path(self.job.get_upload_directory())
+
+        response = self.get_archive("?forceDownload")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Accept-Ranges"], "bytes")
+        self.assertEqual(response.headers["Content-Disposition"], 'attachment; filename="myjob.tar"')
+
+        content = b"".join(response.streaming_content)
+        self.assertEqual(int(response.headers["Content-Length"]), len(content))
+
+        with tarfile.open(fileobj=io.BytesIO(content)) as tar:
+            self.assertIn("./data", tar.getnames())
+            self.assertIn("./result", tar.getnames())
+            self.assertEqual(
+                tar.extractfile("./myjob_config_complete.ini").read(),
+                (job_dir / "myjob_config_complete.ini").read_bytes(),
+            )
+
+    @silence_errors
+    def test_job_archive_subtree(self):
+        response = self.get_archive("?path=result")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Disposition"], 'inline; filename="myjob_result.tar"')
+
+        with tarfile.open(fileobj=io.BytesIO(b"".join(response.streaming_content))) as tar:
+            self.assertTrue(all(name.startswith("./result") for name in tar.getnames()))
+            self.assertIn("./result/myjob_test.png", tar.getnames())
+
+        # A sibling of the job directory, which a prefix check of the path would accept
+        sibling_dir = Path(self.job.get_upload_directory()).parent / f"{self.job.id}_sibling"
+        sibling_dir.mkdir(parents=True, exist_ok=True)
+        self.addCleanup(shutil.rmtree, sibling_dir)
+
+        # Paths which aren't directories in the job are not found
+        for path in ["myjob_config_complete.ini", "not_a_directory", "../", f"../{self.job.id}_sibling"]:
+            self.assertEqual(self.get_archive(f"?path={path}").status_code, 404)
+
+    @silence_errors
+    def test_job_archive_range(self):
+        response = self.get_archive()
+        content = b"".join(response.streaming_content)
+        etag = response.headers["ETag"]
+
+        for range_header, start, stop in [
+            ("bytes=0-511", 0, 512),
+            ("bytes=1000-", 1000, len(content)),
+            ("bytes=-100", len(content) - 100, len(content)),
+            (f"bytes=100-{len(content) * 2}", 100, len(content)),
+        ]:
+            response = self.get_archive(headers={"Range": range_header})
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(response.headers["Content-Range"], f"bytes {start}-{stop - 1}/{len(content)}")
+            self.assertEqual(b"".join(response.streaming_content), content[start:stop])
+
+            # The range is only used if the archive hasn't changed since the client last downloaded it
+            response = self.get_archive(headers={"Range": range_header, "If-Range": etag})
+            self.assertEqual(response.status_code, 206)
+
+            response = self.get_archive(headers={"Range": range_header, "If-Range": '"out of date"'})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b"".join(response.streaming_content), content)
+
+        # Unsatisfiable ranges are refused
+        response = self.get_archive(headers={"Range": f"bytes={len(content)}-"})
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response.headers["Content-Range"], f"bytes */{len(content)}")
+
+        # Other ranges are ignored
+        for range_header in ["bytes=0-1,5-6", "bytes=10-5", "lines=0-1", "bytes=a-b"]:
+            response = self.get_archive(headers={"Range": range_header})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b"".join(response.streaming_content), content)
+
+    @silence_errors
+    def test_job_archive_not_uploaded_job(self):
+        self.job.job_type = BilbyJobType.NORMAL
+        self.job.save()
+
+        self.assertEqual(self.get_archive().status_code, 404)
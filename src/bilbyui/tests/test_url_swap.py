@@ -44,7 +44,7 @@ class TestUrlSwap(BilbyTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response["Location"], f"{settings.LOGIN_URL}?next=/job-list/")
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_view_job_path_returns_200(self, request_job_filter):
         self.authenticate()
         job = self._create_viewable_job()
@@ -54,7 +54,7 @@ class TestUrlSwap(BilbyTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "URL swap job")
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_view_job_numeric_path_no_redirect(self, request_job_filter):
         self.authenticate()
         job = self._create_viewable_job()
@@ -64,7 +64,7 @@ class TestUrlSwap(BilbyTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertNotIn("Location", response)
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_view_job_relay_id_redirects_to_numeric_pk(self, request_job_filter):
         self.authenticate()
         job = self._create_viewable_job()
@@ -78,7 +78,7 @@ class TestUrlSwap(BilbyTestCase):
             reverse("bilbyui:view_job", kwargs={"job_id": job.id}),
         )
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_nested_relay_id_path_redirects_preserving_suffix(self, request_job_filter):
         self.authenticate()
         job = self._create_viewable_job()
@@ -92,7 +92,7 @@ class TestUrlSwap(BilbyTestCase):
             reverse("bilbyui:edit_job_name", kwargs={"job_id": job.id}),
         )
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_relay_id_redirect_preserves_query_string(self, request_job_filter):
         self.authenticate()
         job = self._create_viewable_job()
@@ -106,7 +106,7 @@ class TestUrlSwap(BilbyTestCase):
             f"{reverse('bilbyui:view_job', kwargs={'job_id': job.id})}?tab=results",
         )
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_invalid_relay_id_returns_404(self, request_job_filter):
         self.authenticate()
         self._create_viewable_job()
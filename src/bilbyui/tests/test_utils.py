@@ -306,6 +306,7 @@ def generate_elastic_doc(job, user):
             "name": user["name"],
         },
         "job": {
+            "id": job.id,
             "name": job.name,
             "description": job.description,
             "creationTime": job.creation_time,
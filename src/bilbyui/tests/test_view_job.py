@@ -77,7 +77,7 @@ class TestViewJob(BilbyTestCase):
 
         self.assertEqual(response.status_code, 404)
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_renders_known_job(self, request_job_filter):
         response = self.client.get(self.base_url)
 
@@ -88,7 +88,7 @@ class TestViewJob(BilbyTestCase):
         self.assertContains(response, "COMPLETED —")
 
     @mock.patch(
-        "bilbyui.views.request_job_filter",
+        "bilbyui.views.request_cached_job_filter",
         return_value=("OK", [{"history": [{"state": 500}]}]),
     )
     def test_history_with_missing_timestamp_renders_unknown(self, request_job_filter):
@@ -98,7 +98,7 @@ class TestViewJob(BilbyTestCase):
         self.assertContains(response, "Viewable job")
         self.assertContains(response, "UNKNOWN —")
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_parameters_partial(self, request_job_filter):
         response = self.client.get(f"{self.base_url}parameters/")
 
@@ -111,7 +111,7 @@ class TestViewJob(BilbyTestCase):
         self.assertNotContains(response, "<!doctype html>")
 
     @mock.patch("bilbyui.views.generate_parameter_output", side_effect=AttributeError("missing attribute"))
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_parameters_partial_generate_parameter_output_error(self, request_job_filter, generate_parameter_output):
         response = self.client.get(f"{self.base_url}parameters/")
 
@@ -120,7 +120,7 @@ class TestViewJob(BilbyTestCase):
         self.assertNotContains(response, "<!doctype html>")
 
     @mock.patch("bilbyui.views.generate_parameter_output", side_effect=TypeError("unsupported operand type"))
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_parameters_partial_generate_parameter_output_type_error(
         self, request_job_filter, generate_parameter_output
     ):
@@ -130,7 +130,7 @@ class TestViewJob(BilbyTestCase):
         generate_parameter_output.assert_called_once_with(self.job)
         self.assertNotContains(response, "<!doctype html>")
 
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_results_partial(self, request_job_filter):
         files = [
             {"path": "/a", "isDir": True, "fileSize": 0},
@@ -146,7 +146,7 @@ class TestViewJob(BilbyTestCase):
         self.assertNotContains(response, "<!doctype html>")
 
     @mock.patch("bilbyui.views.request_file_download_ids")
-    @mock.patch("bilbyui.views.request_job_filter", side_effect=request_job_filter_mock)
+    @mock.patch("bilbyui.views.request_cached_job_filter", side_effect=request_job_filter_mock)
     def test_file_download_redirect(self, request_job_filter, request_file_download_ids):
         download_id = str(uuid.uuid4())
         request_file_download_ids.return_value = (True, [download_id])
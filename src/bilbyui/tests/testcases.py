@@ -3,10 +3,12 @@ import datetime
 from adacs_sso_plugin.anonymous_user import ADACSAnonymousUser
 from adacs_sso_plugin.test_client import ADACSSSOSessionClient
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.test import override_settings
 from graphene_django.utils.testing import GraphQLTestCase
 from graphene_file_upload.django.testing import GraphQLFileUploadTestMixin
 
+from bilbyui.utils.es_client import reset_es_client
 from gw_bilby.schema import schema
 
 User = get_user_model()
@@ -99,6 +101,18 @@ class BilbyTestCase(GraphQLFileUploadTestMixin, GraphQLTestCase):
         # We always want to see the full diff when an error occurs.
         self.maxDiff = None
 
+    def run(self, result=None):
+        # Most test cases override setUp without calling super, so the shared elasticsearch client is discarded around
+        # every test here instead. Otherwise a client created while Elasticsearch was mocked would leak in to later tests.
+        # The local cache isn't rolled back with the database either, so it is cleared for the same reason
+        reset_es_client()
+        caches["local"].clear()
+        try:
+            return super().run(result)
+        finally:
+            reset_es_client()
+            caches["local"].clear()
+
     # Log in as a user. Any parameters can be overwritten with **kwargs
     def authenticate(self, user=None, **kwargs):
         if user is None:
@@ -210,6 +210,18 @@ class JobIniOutput(graphene.ObjectType):
     ini_string = graphene.Field(IniOutput)
 
 
+class ExternalBilbyJobUploadInput(graphene.InputObjectType):
+    details = JobDetailsInput()
+    ini_file = graphene.String(required=True)
+    result_url = graphene.String(required=True)
+    event_id = graphene.String(required=False)
+
+
+class ExternalBilbyJobUploadResult(graphene.ObjectType):
+    job_id = graphene.String()
+    error = graphene.String()
+
+
 class SupportingFileUploadInput(graphene.InputObjectType):
     file_token = graphene.String()
     supporting_file = Upload(required=True)
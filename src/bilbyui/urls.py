@@ -12,6 +12,11 @@ urlpatterns = [
         views.file_download_redirect,
         name="file_download",
     ),
+    path(
+        "job-results/<str:job_id>/archive/",
+        views.job_archive_download,
+        name="job_archive",
+    ),
     path(
         "job-results/<str:job_id>/parameters/",
         views.view_job_parameters_partial,
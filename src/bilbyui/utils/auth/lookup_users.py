@@ -1,11 +1,16 @@
 import logging
 
 from adacs_sso_plugin.utils import AuthConnectionException, auth_request
+from django.conf import settings
+from django.core.cache import caches
 
 from bilbyui.utils.misc import check_request_leak_decorator
 
 logger = logging.getLogger(__name__)
 
+# Cached in place of a user the auth service doesn't know about
+_MISSING_USER = "missing"
+
 
 @check_request_leak_decorator
 def request_lookup_users(ids):
@@ -26,3 +31,53 @@ def request_lookup_users(ids):
     except AuthConnectionException as e:
         logger.error("Error looking up users: %s", e, exc_info=True)
         return False, f"Error looking up users: {e}"
+
+
+def _user_cache_key(user_id):
+    return f"bilbyui:user:{user_id}"
+
+
+def get_users(ids):
+    """
+    Looks up several users by id, serving them from the per process "local" cache where possible
+
+    Users that aren't cached are requested from the auth service in batches of USER_LOOKUP_BATCH_SIZE. Users that are
+    found are cached for USER_LOOKUP_CACHE_TTL seconds, and ids the auth service doesn't know are cached as missing for
+    USER_LOOKUP_NEGATIVE_CACHE_TTL seconds so that they aren't requested again on every call.
+
+    :param ids: The ids of the users to look up
+    :return: A tuple (success, result) where success is a bool, and result is the
+        list of users that were found on success or an error string on failure
+    """
+    cache = caches["local"]
+    ids = list(dict.fromkeys(ids))
+
+    cached = cache.get_many([_user_cache_key(user_id) for user_id in ids])
+    users = {}
+    missing_ids = []
+    for user_id in ids:
+        user = cached.get(_user_cache_key(user_id))
+        if user is None:
+            missing_ids.append(user_id)
+        elif user != _MISSING_USER:
+            users[user_id] = user
+
+    batch_size = settings.USER_LOOKUP_BATCH_SIZE
+    for start in range(0, len(missing_ids), batch_size):
+        batch = missing_ids[start : start + batch_size]
+        success, result = request_lookup_users(batch)
+        if not success:
+            return False, result
+
+        found = {user["id"]: user for user in result}
+        users.update(found)
+
+        cache.set_many(
+            {_user_cache_key(user_id): user for user_id, user in found.items()}, settings.USER_LOOKUP_CACHE_TTL
+        )
+        cache.set_many(
+            {_user_cache_key(user_id): _MISSING_USER for user_id in batch if user_id not in found},
+            settings.USER_LOOKUP_NEGATIVE_CACHE_TTL,
+        )
+
+    return True, [users[user_id] for user_id in ids if user_id in users]
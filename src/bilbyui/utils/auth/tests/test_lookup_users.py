@@ -1,10 +1,11 @@
 from unittest import mock
 
 from adacs_sso_plugin.utils import AuthConnectionException
+from django.core.cache import caches
 from django.test import override_settings
 
 from bilbyui.tests.testcases import BilbyTestCase
-from bilbyui.utils.auth.lookup_users import request_lookup_users
+from bilbyui.utils.auth.lookup_users import get_users, request_lookup_users
 
 
 @override_settings(ALLOW_HTTP_LEAKS=True)
@@ -39,3 +40,52 @@ class TestRequestLookupUsers(BilbyTestCase):
         self.assertFalse(success)
         self.assertEqual(result, "Error looking up users: malformed response from auth service")
         auth_request_mock.assert_called_once_with("get_users", {"ids": [1]})
+
+
+@override_settings(ALLOW_HTTP_LEAKS=True, USER_LOOKUP_BATCH_SIZE=2)
+class TestGetUsers(BilbyTestCase):
+    def setUp(self):
+        caches["local"].clear()
+
+    @mock.patch("bilbyui.utils.auth.lookup_users.auth_request")
+    def test_get_users_batches_and_caches(self, auth_request_mock):
+        auth_request_mock.side_effect = lambda _, data: {
+            "users": [{"id": user_id, "name": f"User {user_id}"} for user_id in data["ids"]]
+        }
+
+        success, result = get_users([3, 1, 2, 1])
+
+        self.assertTrue(success)
+        self.assertEqual([user["id"] for user in result], [3, 1, 2])
+        self.assertEqual(
+            auth_request_mock.call_args_list,
+            [mock.call("get_users", {"ids": [3, 1]}), mock.call("get_users", {"ids": [2]})],
+        )
+
+        # Cached users aren't requested again
+        auth_request_mock.reset_mock()
+        success, result = get_users([1, 4])
+
+        self.assertTrue(success)
+        self.assertEqual([user["id"] for user in result], [1, 4])
+        auth_request_mock.assert_called_once_with("get_users", {"ids": [4]})
+
+    @mock.patch("bilbyui.utils.auth.lookup_users.auth_request")
+    def test_get_users_caches_unknown_users(self, auth_request_mock):
+        auth_request_mock.return_value = {"users": [{"id": 1, "name": "Test User"}]}
+
+        self.assertEqual(get_users([1, 2]), (True, [{"id": 1, "name": "Test User"}]))
+        self.assertEqual(get_users([1, 2]), (True, [{"id": 1, "name": "Test User"}]))
+
+        auth_request_mock.assert_called_once_with("get_users", {"ids": [1, 2]})
+
+    @mock.patch("bilbyui.utils.auth.lookup_users.auth_request")
+    def test_get_users_error_is_not_cached(self, auth_request_mock):
+        auth_request_mock.side_effect = AuthConnectionException("auth failed")
+
+        self.assertEqual(get_users([1]), (False, "Error looking up users: auth failed"))
+
+        auth_request_mock.side_effect = None
+        auth_request_mock.return_value = {"users": [{"id": 1, "name": "Test User"}]}
+
+        self.assertEqual(get_users([1]), (True, [{"id": 1, "name": "Test User"}]))
@@ -1,10 +1,8 @@
+import json
 import logging
 
 from django.conf import settings
-from django.db.models import FloatField, OuterRef, Q, Subquery
-from django.db.models.functions import Cast
-
-from bilbyui import models
+from django.db.models import Q
 
 from .misc import is_ligo_user
 
@@ -26,21 +24,42 @@ def embargo_filter(qs, user):
 
 
 def qs_embargo_filter(qs):
-    return qs.annotate(
-        trigger_time=Cast(
-            Subquery(
-                models.IniKeyValue.objects.filter(job=OuterRef("pk"), key="trigger_time", processed=True).values(
-                    "value",
-                ),
-            ),
-            FloatField(),
-        ),
-        simulated=Subquery(
-            models.IniKeyValue.objects.filter(job=OuterRef("pk"), key="n_simulation", processed=False).values("value")[
-                :1
-            ],
-        ),
-    ).filter(Q(trigger_time__lt=settings.EMBARGO_START_TIME) | Q(simulated__gt=0))
+    return qs.filter(Q(trigger_time__lt=settings.EMBARGO_START_TIME) | Q(is_simulated=True))
+
+
+def job_passes_embargo_filter(job):
+    """
+    The in memory equivalent of qs_embargo_filter for a BilbyJob that has already been fetched. As with the SQL
+    comparison, a job with no trigger time only passes if it is simulated.
+
+    :param job: The BilbyJob to check
+    :return: True if qs_embargo_filter would include the job
+    """
+    return job.is_simulated or (job.trigger_time is not None and job.trigger_time < settings.EMBARGO_START_TIME)
+
+
+def embargo_fields_from_ini_values(trigger_time, n_simulation):
+    """
+    Convert the json encoded IniKeyValue values used by the embargo into the denormalised BilbyJob columns.
+
+    Args:
+        trigger_time: The json encoded processed trigger_time value, or None if there isn't one.
+        n_simulation: The json encoded unprocessed n_simulation value, or None if there isn't one.
+
+    Returns:
+        tuple: (trigger_time, is_simulated) where trigger_time is a float or None and is_simulated is a bool.
+    """
+    try:
+        trigger_time = float(json.loads(trigger_time)) if trigger_time is not None else None
+    except (TypeError, ValueError):
+        trigger_time = None
+
+    try:
+        is_simulated = n_simulation is not None and int(json.loads(n_simulation)) > 0
+    except (TypeError, ValueError):
+        is_simulated = False
+
+    return trigger_time, is_simulated
 
 
 def should_embargo_job(user, trigger_time, simulated):
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import elasticsearch
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_es_client():
+    """
+    Returns the process wide elasticsearch client, creating it on first use
+
+    The client is thread safe and keeps a pool of persistent connections to each node, so reusing it avoids a fresh
+    TCP/TLS handshake on every search. It is created lazily so that each gunicorn worker builds its own after forking.
+
+    :return: elasticsearch.Elasticsearch
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = elasticsearch.Elasticsearch(
+                    hosts=[settings.ELASTIC_SEARCH_HOST],
+                    api_key=settings.ELASTIC_SEARCH_API_KEY,
+                    verify_certs=False,
+                    connections_per_node=settings.ELASTIC_SEARCH_CONNECTIONS_PER_NODE,
+                    request_timeout=settings.ELASTIC_SEARCH_REQUEST_TIMEOUT,
+                    max_retries=settings.ELASTIC_SEARCH_MAX_RETRIES,
+                    retry_on_timeout=settings.ELASTIC_SEARCH_RETRY_ON_TIMEOUT,
+                )
+
+    return _client
+
+
+def reset_es_client():
+    """
+    Closes and discards the process wide elasticsearch client so that the next get_es_client call creates a new one
+    """
+    global _client
+
+    with _client_lock:
+        client, _client = _client, None
+
+    if client is not None:
+        try:
+            client.close()
+        except Exception:
+            logger.exception("Error closing elasticsearch client")
+
+
+@receiver(setting_changed)
+def _reset_es_client_on_setting_changed(setting, **kwargs):
+    if setting.startswith("ELASTIC_SEARCH_"):
+        reset_es_client()
+
+
+@contextmanager
+def record_es_latency(operation, index=None):
+    """
+    Times an elasticsearch request, logging the duration and passing it to ELASTIC_SEARCH_LATENCY_HOOK if one is set
+
+    The hook is the dotted path to a callable accepting (operation, index, duration, error), where duration is in
+    seconds and error is the exception raised by the request, or None.
+
+    :param operation: The name of the request, for example "search"
+    :param index: The index the request is for, if any
+    """
+    error = None
+    start = time.monotonic()
+    try:
+        yield
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        duration = time.monotonic() - start
+        logger.debug("Elasticsearch %s on %s took %.3fs", operation, index, duration)
+
+        hook = getattr(settings, "ELASTIC_SEARCH_LATENCY_HOOK", None)
+        if hook:
+            try:
+                import_string(hook)(operation, index, duration, error)
+            except Exception:
+                logger.exception("Error calling elasticsearch latency hook %s", hook)
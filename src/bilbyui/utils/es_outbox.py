@@ -0,0 +1,251 @@
+import datetime
+import logging
+
+import elasticsearch
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from elasticsearch import helpers
+
+from bilbyui.utils.auth.lookup_users import get_users
+from bilbyui.utils.es_client import record_es_latency
+
+logger = logging.getLogger(__name__)
+
+HTTP_NOT_FOUND = 404
+
+
+def enqueue_es_index(index, doc_id, document=None):
+    """
+    Queues an upsert of a document in elastic search
+
+    :param index: The elastic search index
+    :param doc_id: The document id
+    :param document: The full document, or None for a BilbyJob document to be built when the outbox is drained
+    :return: Nothing
+    """
+    from bilbyui.models import ElasticSearchOutbox
+
+    ElasticSearchOutbox.objects.create(
+        index=index, doc_id=doc_id, action=ElasticSearchOutbox.ACTION_INDEX, document=document
+    )
+
+
+def enqueue_es_index_many(index, doc_ids):
+    """
+    Queues upserts of several BilbyJob documents in elastic search in a single insert
+
+    :param index: The elastic search index
+    :param doc_ids: The ids of the BilbyJobs to reindex
+    :return: Nothing
+    """
+    from bilbyui.models import ElasticSearchOutbox
+
+    ElasticSearchOutbox.objects.bulk_create(
+        [ElasticSearchOutbox(index=index, doc_id=doc_id, action=ElasticSearchOutbox.ACTION_INDEX) for doc_id in doc_ids]
+    )
+
+
+def enqueue_es_update(index, doc_id, document):
+    """
+    Queues a partial update of an existing document in elastic search. Documents that don't exist yet are skipped
+
+    :param index: The elastic search index
+    :param doc_id: The document id
+    :param document: The fields to update
+    :return: Nothing
+    """
+    from bilbyui.models import ElasticSearchOutbox
+
+    ElasticSearchOutbox.objects.create(
+        index=index, doc_id=doc_id, action=ElasticSearchOutbox.ACTION_UPDATE, document=document
+    )
+
+
+def enqueue_es_delete(index, doc_id):
+    """
+    Queues deletion of a document from elastic search. Documents that don't exist are skipped
+
+    :param index: The elastic search index
+    :param doc_id: The document id
+    :return: Nothing
+    """
+    from bilbyui.models import ElasticSearchOutbox
+
+    ElasticSearchOutbox.objects.create(index=index, doc_id=doc_id, action=ElasticSearchOutbox.ACTION_DELETE)
+
+
+def collapse_outbox_rows(rows):
+    """
+    Coalesces queued writes so that each document is written at most once per batch
+
+    :param rows: ElasticSearchOutbox instances in the order they were queued
+    :return: A dict of (index, doc_id) -> (action, document, row_ids), in first queued order
+    """
+    from bilbyui.models import ElasticSearchOutbox
+
+    collapsed = {}
+    for row in rows:
+        key = (row.index, row.doc_id)
+        action, document, row_ids = collapsed.get(key, (None, None, []))
+        row_ids = [*row_ids, row.id]
+
+        if row.action != ElasticSearchOutbox.ACTION_UPDATE or action is None:
+            # Index and delete replace anything queued before them, as does a partial update queued first
+            action, document = row.action, row.document
+        elif action == ElasticSearchOutbox.ACTION_DELETE:
+            # Partial updates of a deleted document would be skipped anyway
+            pass
+        elif document is not None:
+            # Merge the partial update into the pending index or update. A pending BilbyJob index with no document is
+            # built from the database when drained, so already reflects the update
+            document = {**document, **(row.document or {})}
+
+        collapsed[key] = (action, document, row_ids)
+
+    return collapsed
+
+
+def build_bilby_job_documents(job_ids):
+    """
+    Builds the elastic search documents for several BilbyJobs with a single user lookup
+
+    :param job_ids: The ids of the BilbyJobs to build documents for
+    :return: A tuple (success, documents) where documents is a dict of job id -> document. Jobs that no longer exist,
+        have no ini or whose user could not be found are left out. success is False if the user lookup failed
+    """
+    from bilbyui.models import BilbyJob
+
+    jobs = [
+        job
+        for job in BilbyJob.objects.filter(id__in=job_ids)
+        .order_by("id")
+        .select_related("event_id")
+        .prefetch_related("labels", "inikeyvalue_set")
+        # Jobs with no ini_string (legacy/interrupted) have no parsed params to index
+        if job.ini_string and job.ini_string.strip()
+    ]
+
+    if not jobs:
+        return True, {}
+
+    success, users = get_users(sorted({job.user_id for job in jobs}))
+    if not success:
+        return False, {}
+
+    users = {user["id"]: user for user in users}
+    return True, {job.id: job.elastic_search_document(users[job.user_id]) for job in jobs if job.user_id in users}
+
+
+def _bulk_action(index, doc_id, action, document):
+    from bilbyui.models import ElasticSearchOutbox
+
+    if action == ElasticSearchOutbox.ACTION_DELETE:
+        return {"_op_type": "delete", "_index": index, "_id": doc_id}
+
+    op = {"_op_type": "update", "_index": index, "_id": doc_id, "doc": document}
+    if action == ElasticSearchOutbox.ACTION_INDEX:
+        op["doc_as_upsert"] = True
+    return op
+
+
+def drain_es_outbox(es, batch_size=None):
+    """
+    Applies a batch of queued elastic search writes using the bulk API
+
+    Writes that elasticsearch rejects are left in the outbox to be retried, and are marked as dead once they have been
+    rejected ELASTIC_SEARCH_OUTBOX_MAX_ATTEMPTS times. Writes that couldn't be sent at all, because elasticsearch or
+    the auth service couldn't be reached, are retried without counting towards that limit, so an outage delays writes
+    rather than losing them. Applied writes are marked as applied rather than deleted, and are deleted
+    ELASTIC_SEARCH_OUTBOX_RETENTION seconds later.
+
+    :param es: The elasticsearch.Elasticsearch client to use
+    :param batch_size: The maximum number of outbox rows to process, defaults to ELASTIC_SEARCH_OUTBOX_BATCH_SIZE
+    :return: A tuple (processed, failed) of the number of outbox rows that were applied and that failed
+    """
+    from bilbyui.models import ElasticSearchOutbox
+
+    batch_size = batch_size or settings.ELASTIC_SEARCH_OUTBOX_BATCH_SIZE
+    rows = list(ElasticSearchOutbox.objects.filter(applied=None, dead=False).order_by("id")[:batch_size])
+    if not rows:
+        return 0, 0
+
+    collapsed = collapse_outbox_rows(rows)
+
+    # BilbyJob documents are built now so that they reflect the current state of the job. Writes elasticsearch rejected
+    # are failed, writes that couldn't be sent are unavailable
+    failed = {}
+    unavailable = {}
+    done = []
+    build_ids = [
+        doc_id
+        for (index, doc_id), (action, document, _) in collapsed.items()
+        if action == ElasticSearchOutbox.ACTION_INDEX and document is None
+    ]
+    success, documents = build_bilby_job_documents(build_ids)
+
+    keys = []
+    actions = []
+    for key, (action, document, _) in collapsed.items():
+        if action == ElasticSearchOutbox.ACTION_INDEX and document is None:
+            if not success:
+                unavailable[key] = "Error looking up users"
+                continue
+
+            document = documents.get(key[1])
+            if document is None:
+                # The job has been deleted, has no ini or has no user, so there is nothing to index
+                done.append(key)
+                continue
+
+        keys.append(key)
+        actions.append(_bulk_action(key[0], key[1], action, document))
+
+    if actions:
+        try:
+            with record_es_latency("bulk"):
+                results = list(
+                    helpers.streaming_bulk(
+                        es,
+                        actions,
+                        raise_on_error=False,
+                        raise_on_exception=False,
+                        chunk_size=batch_size,
+                    )
+                )
+            for key, (ok, item) in zip(keys, results, strict=True):
+                result = next(iter(item.values()))
+                if ok or (
+                    result.get("status") == HTTP_NOT_FOUND and collapsed[key][0] != ElasticSearchOutbox.ACTION_INDEX
+                ):
+                    done.append(key)
+                else:
+                    failed[key] = str(result.get("error") or result)
+        except elasticsearch.TransportError as e:
+            logger.exception("Error sending elastic search bulk request")
+            unavailable.update({key: repr(e) for key in keys if key not in done})
+
+    now = timezone.now()
+    done_ids = [row_id for key in done for row_id in collapsed[key][2]]
+    ElasticSearchOutbox.objects.filter(id__in=done_ids).update(applied=now)
+    ElasticSearchOutbox.objects.filter(
+        applied__lt=now - datetime.timedelta(seconds=settings.ELASTIC_SEARCH_OUTBOX_RETENTION)
+    ).delete()
+
+    for key, error in failed.items():
+        row_ids = collapsed[key][2]
+        logger.warning("Error applying elastic search %s for %s/%s: %s", collapsed[key][0], key[0], key[1], error)
+        ElasticSearchOutbox.objects.filter(id__in=row_ids).update(attempts=F("attempts") + 1, last_error=error)
+
+    for key, error in unavailable.items():
+        ElasticSearchOutbox.objects.filter(id__in=collapsed[key][2]).update(last_error=error)
+
+    dead = ElasticSearchOutbox.objects.filter(
+        id__in=[row_id for key in failed for row_id in collapsed[key][2]],
+        attempts__gte=settings.ELASTIC_SEARCH_OUTBOX_MAX_ATTEMPTS,
+    )
+    for row in dead:
+        logger.error("Giving up on elastic search %s after %d attempts: %s", row, row.attempts, row.last_error)
+    dead.update(dead=True)
+
+    return len(done_ids), sum(len(collapsed[key][2]) for key in [*failed, *unavailable])
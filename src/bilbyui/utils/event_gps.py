@@ -0,0 +1,98 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+# Cached in place of a GPS time for an event name GWOSC doesn't know about
+_UNKNOWN_EVENT = "unknown"
+
+
+def _event_gps_cache_key(name):
+    return f"bilbyui:event_gps:{name}"
+
+
+def _local_event_gps(name):
+    """
+    Looks up the GPS time of an event in the EventID table, by event id or by nickname if only one event has it
+
+    :param name: The event name
+    :return: The GPS time, or None if the event isn't known locally
+    """
+    from bilbyui.models import EventID
+
+    gps_times = dict(EventID.objects.filter(Q(event_id=name) | Q(nickname=name)).values_list("event_id", "gps_time"))
+    if name in gps_times:
+        return gps_times[name]
+
+    if len(gps_times) == 1:
+        return next(iter(gps_times.values()))
+
+    return None
+
+
+def resolve_event_gps(name):
+    """
+    Resolves an event name, such as GW150914, to the GPS time of the event
+
+    Events in the EventID table are resolved without asking GWOSC. Otherwise GWOSC lookups are cached for
+    EVENT_GPS_CACHE_TTL seconds, and names GWOSC doesn't know are cached as unknown for EVENT_GPS_NEGATIVE_CACHE_TTL
+    seconds so that repeated uploads for the same event don't each make a request.
+
+    :param name: The event name
+    :return: The GPS time of the event
+    :raises ValueError: If the event is not known locally or by GWOSC
+    :raises requests.RequestException: If GWOSC could not be reached
+    """
+    gps_time = _local_event_gps(name)
+    if gps_time is not None:
+        return gps_time
+
+    cache = caches["default"]
+    key = _event_gps_cache_key(name)
+
+    gps_time = cache.get(key)
+    if gps_time == _UNKNOWN_EVENT:
+        msg = f"Unknown event {name}"
+        raise ValueError(msg)
+
+    if gps_time is not None:
+        return gps_time
+
+    # gwosc is only imported when an event has to be looked up (see test_import_time)
+    from gwosc.datasets import event_gps
+
+    try:
+        gps_time = event_gps(name)
+    except ValueError:
+        cache.set(key, _UNKNOWN_EVENT, settings.EVENT_GPS_NEGATIVE_CACHE_TTL)
+        raise
+
+    cache.set(key, gps_time, settings.EVENT_GPS_CACHE_TTL)
+    return gps_time
+
+
+def warm_event_gps_cache():
+    """
+    Caches the GPS time of every event in the GWOSC allevents catalogue, so that uploads for them don't have to look
+    them up individually
+
+    :return: The number of events cached
+    :raises requests.RequestException: If GWOSC could not be reached
+    """
+    from gwosc.api import fetch_allevents_json
+
+    events = fetch_allevents_json().get("events") or {}
+
+    # The catalogue lists each version of an event, which share the event's common name
+    gps_times = {
+        _event_gps_cache_key(event["commonName"]): event["GPS"]
+        for event in events.values()
+        if isinstance(event, dict) and event.get("commonName") and event.get("GPS") is not None
+    }
+    caches["default"].set_many(gps_times, settings.EVENT_GPS_CACHE_TTL)
+
+    logger.info("Cached the GPS times of %d GWOSC events", len(gps_times))
+    return len(gps_times)
@@ -1,11 +1,13 @@
 import decimal
+import hashlib
+import logging
 import math
 from decimal import Decimal
+from importlib.metadata import version
 from math import floor
 
-from bilby_pipe.data_generation import DataGenerationInput
-from bilby_pipe.input import Input
-from bilby_pipe.utils import logger
+from django.conf import settings
+from django.core.cache import caches
 
 from bilbyui.types import (
     ChannelsOutput,
@@ -17,10 +19,16 @@ from bilbyui.types import (
     SamplerOutput,
     WaveformOutput,
 )
-from bilbyui.utils.ini_utils import bilby_ini_string_to_args, prepare_args_for_data_input
+from bilbyui.utils.ini_utils import bilby_ini_string_to_args, default_prior_files, prepare_args_for_data_input
 
-# Override the log level so it's silent
-logger.setLevel("CRITICAL")
+logger = logging.getLogger(__name__)
+
+# Read from the package metadata rather than bilby_pipe.__version__, so that cache hits don't need to import bilby_pipe
+BILBY_PIPE_VERSION = version("bilby_pipe")
+
+# The version of the cached *Output objects. Bump this whenever the output types in bilbyui.types or the way they are
+# generated here change, so that a deploy doesn't unpickle objects cached by the previous version
+PARAMETER_CACHE_VERSION = 1
 
 
 def to_dec(val):
@@ -53,13 +61,47 @@ def to_dec(val):
     return Decimal(int(val))
 
 
+def _parameter_cache_key(job):
+    # Jobs saved before ini_hash was added don't have one until their ini next changes
+    ini_hash = job.ini_hash or hashlib.sha256(job.ini_string.encode("utf-8")).hexdigest()
+    return f"bilbyui:job_parameters:v{PARAMETER_CACHE_VERSION}:{job.id}:{ini_hash}:{BILBY_PIPE_VERSION}"
+
+
 def generate_parameter_output(job):
     """
     Generates a complete JobParameterOutput for a job
 
+    Parsing the ini with bilby_pipe is slow, so the parameters read from it are cached. The cache key includes the
+    job's stored ini hash, the bilby_pipe version and PARAMETER_CACHE_VERSION, so a saved change to the ini, an upgraded
+    bilby_pipe or changed output types are parsed again rather than served stale.
+
     :param job: The BilbyJob instance to generate the JobParameterOutput for
     :returns: The complete JobParameterOutput
     """
+    cache = caches["default"]
+    key = _parameter_cache_key(job)
+
+    sections = cache.get(key)
+    if sections is None:
+        sections = _generate_parameter_sections(job)
+        cache.set(key, sections, settings.JOB_PARAMETERS_CACHE_TTL)
+
+    # The details are not from the ini and can change independently of it, so are never cached
+    return JobParameterOutput(
+        details=JobDetailsOutput(name=job.name, description=job.description, private=job.private),
+        **sections,
+    )
+
+
+def _generate_parameter_sections(job):
+    """
+    Parses a job's ini to generate the parts of its JobParameterOutput that are read from the ini
+
+    :param job: The BilbyJob instance to parse the ini of
+    :returns: A dict of the data, detector, prior, sampler and waveform outputs
+    """
+    from bilby_pipe.data_generation import DataGenerationInput
+
     # Parse the job ini file and create a bilby input class that can be used to read values from the ini
     args = bilby_ini_string_to_args(job.ini_string.encode("utf-8"))
     prepare_args_for_data_input(args)
@@ -84,7 +126,7 @@ def generate_parameter_output(job):
 
     # Prior files can be defaults (like 4s, 32s etc), if it's one of the defaults - then the prior file is valid, so
     # leave the prior file as is.
-    if args.prior_file not in Input([], []).get_default_prior_files():
+    if args.prior_file not in default_prior_files():
         sanitized_fields.append("prior_file")
 
     for field in sanitized_fields:
@@ -154,11 +196,10 @@ def generate_parameter_output(job):
 
     waveform = WaveformOutput(model=model)
 
-    return JobParameterOutput(
-        details=JobDetailsOutput(name=job.name, description=job.description, private=job.private),
-        data=data,
-        detector=detector,
-        prior=prior,
-        sampler=sampler,
-        waveform=waveform,
-    )
+    return {
+        "data": data,
+        "detector": detector,
+        "prior": prior,
+        "sampler": sampler,
+        "waveform": waveform,
+    }
@@ -1,9 +1,9 @@
-import contextlib
 import logging
 
-import elasticsearch
 from django.conf import settings
 
+from bilbyui.utils.es_outbox import enqueue_es_delete, enqueue_es_index, enqueue_es_update
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,6 +149,7 @@ def build_gwflow_es_doc(job, metadata: dict) -> dict:
         child_job_ids = list(job.bilby_jobs.values_list("id", flat=True))
 
     return {
+        "id": job.id,
         "user": {"name": user_name},
         "sname": job.sname,
         "schemaVersion": job.schema_version,
@@ -166,60 +167,35 @@ def build_gwflow_es_doc(job, metadata: dict) -> dict:
     }
 
 
-def _get_es_client():
-    return elasticsearch.Elasticsearch(
-        hosts=[settings.ELASTIC_SEARCH_HOST],
-        api_key=settings.ELASTIC_SEARCH_API_KEY,
-        verify_certs=False,
-    )
-
-
 def gwflow_elastic_search_update(job, metadata: dict) -> None:
     """
-    Upsert the doc (update, fall back to index). No-op if settings.IGNORE_ELASTIC_SEARCH.
+    Queue an upsert of the doc. No-op if settings.IGNORE_ELASTIC_SEARCH.
     Mirrors BilbyJob.elastic_search_update.
     """
     if getattr(settings, "IGNORE_ELASTIC_SEARCH", False):
         return
 
-    es = _get_es_client()
-
-    doc = build_gwflow_es_doc(job, metadata)
-
-    try:
-        es.update(index=settings.ELASTIC_SEARCH_GWFLOW_INDEX, id=job.id, doc=doc)
-    except elasticsearch.NotFoundError:
-        es.index(index=settings.ELASTIC_SEARCH_GWFLOW_INDEX, id=job.id, document=doc)
+    enqueue_es_index(settings.ELASTIC_SEARCH_GWFLOW_INDEX, job.id, build_gwflow_es_doc(job, metadata))
 
 
 def gwflow_elastic_search_remove(job) -> None:
     """
-    Delete the doc; swallow NotFoundError. No-op if IGNORE_ELASTIC_SEARCH.
+    Queue deletion of the doc. No-op if IGNORE_ELASTIC_SEARCH.
     """
     if getattr(settings, "IGNORE_ELASTIC_SEARCH", False):
         return
 
-    es = _get_es_client()
-
-    with contextlib.suppress(elasticsearch.NotFoundError):
-        es.delete(index=settings.ELASTIC_SEARCH_GWFLOW_INDEX, id=job.id)
+    enqueue_es_delete(settings.ELASTIC_SEARCH_GWFLOW_INDEX, job.id)
 
 
 def update_child_job_ids(job) -> None:
     """
-    Perform a targeted update of childJobIds in Elasticsearch for a GWFlowJob.
-    No-op if settings.IGNORE_ELASTIC_SEARCH. Swallow NotFoundError if document is not in ES yet.
+    Queue a targeted update of childJobIds in Elasticsearch for a GWFlowJob.
+    No-op if settings.IGNORE_ELASTIC_SEARCH. Skipped by the outbox worker if the document is not in ES yet.
     """
     if getattr(settings, "IGNORE_ELASTIC_SEARCH", False):
         return
 
-    es = _get_es_client()
-
     child_job_ids = list(job.bilby_jobs.values_list("id", flat=True))
 
-    with contextlib.suppress(elasticsearch.NotFoundError):
-        es.update(
-            index=settings.ELASTIC_SEARCH_GWFLOW_INDEX,
-            id=job.id,
-            doc={"childJobIds": child_job_ids},
-        )
+    enqueue_es_update(settings.ELASTIC_SEARCH_GWFLOW_INDEX, job.id, {"childJobIds": child_job_ids})
@@ -1,35 +1,82 @@
+import copy
 import logging
-from tempfile import NamedTemporaryFile
-
-from bilby_pipe.parser import create_parser
-from bilby_pipe.utils import parse_args
+import threading
+from io import StringIO
 
 logger = logging.getLogger(__name__)
 
+# The name given to the ini when it is parsed from memory. It only appears in bilby_pipe error messages
+IN_MEMORY_INI_NAME = "<ini string>"
+
+_parser = None
+_parser_lock = threading.Lock()
+
+_default_prior_files = None
+
+
+def _get_parser():
+    """
+    Returns the process wide bilby_pipe argument parser, creating it on first use
+
+    create_parser builds several hundred arguments, so the parser is only built once. It must not be used to parse
+    directly, as parsing stores state on the parser; bilby_ini_string_to_args parses with a copy of it instead.
+
+    bilby_pipe imports the scientific stack, so is only imported here on first use rather than when the web tier
+    starts. Its logging is silenced at the same time, as it is only noise when parsing inis for the web tier.
+
+    :return: bilby_pipe.bilbyargparser.BilbyArgParser
+    """
+    global _parser
+
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                from bilby_pipe.parser import create_parser
+                from bilby_pipe.utils import logger as bilby_pipe_logger
+
+                bilby_pipe_logger.setLevel("CRITICAL")
+                _parser = create_parser()
+
+    return _parser
+
+
+def default_prior_files():
+    """
+    Returns the names of the prior files bundled with bilby_pipe, such as "4s", finding them on first use
+
+    bilby_pipe globs its data directory for these every time it is asked, so they are only looked up once per process.
+
+    :return: A frozenset of the default prior file names
+    """
+    global _default_prior_files
+
+    if _default_prior_files is None:
+        from bilby_pipe.input import Input
+
+        _default_prior_files = frozenset(Input.get_default_prior_files())
+
+    return _default_prior_files
+
 
 def bilby_ini_string_to_args(ini):
     """
     Parses an ini string into an argument Namespace
 
-    :param ini: The ini string to parse
+    :param ini: The ini string to parse, as bytes or str
     :return: An ArgParser Namespace of the parsed arguments from the ini
     """
+    if isinstance(ini, bytes):
+        ini = ini.decode("utf-8")
 
-    # Create a bilby argument parser
-    parser = create_parser()
-
-    # Bilby pipe requires a real file in order to parse the ini file
-    with NamedTemporaryFile() as f:
-        # Write the temporary ini file
-        f.write(ini)
+    # The copy shares the arguments of the process wide parser, but the state stored while parsing (such as the ini
+    # comments) is set on the copy, so concurrent parses don't interfere. The ini is read from memory rather than a
+    # real file, newline=None matches the newline translation of reading a file
+    parser = copy.copy(_get_parser())
+    parser._config_file_open_func = lambda _: StringIO(ini, newline=None)
 
-        # Make sure the data is written to the temporary file
-        f.flush()
+    logger.debug("Parsing INI string in memory")
 
-        logger.debug("Parsing INI string via temporary file %s", f.name)
-
-        # Read the data from the ini file
-        args, _ = parse_args([f.name], parser)
+    args, _ = parser.parse_known_args([IN_MEMORY_INI_NAME])
 
     # ini and verbose are not kept in the ini file, so remove them
     delattr(args, "ini")
@@ -44,25 +91,27 @@ def bilby_args_to_ini_string(args):
     """
     Serializes an argument Namespace into an ini content string
 
+    This writes the same content as BilbyArgParser.write_to_file, which can only write to a named file.
+
     :param args: The argument Namespace to serialize
     :return: A string containing the serialized ini content of the arguments
     """
+    from bilby_pipe.bilbyargparser import HyphenStr
 
-    # Create an argument parser
-    parser = create_parser()
-
-    # Use a tempfile to write the args as an ini file, then read the ini content back from the ini file
-    with NamedTemporaryFile() as f:
-        # Write the temporary ini file
-        parser.write_to_file(f.name, args, overwrite=True)
+    parser = _get_parser()
 
-        # Make sure the data is flushed
-        f.flush()
+    with StringIO() as f:
+        for group in parser._action_groups[2:]:
+            print("#" * 80, file=f)
+            print(f"## {group.title}", file=f)
+            print("#" * 80 + "\n", file=f)
+            for action in group._group_actions:
+                parser.write_line(HyphenStr(action.dest), getattr(args, action.dest, action.default), f)
+            print("", file=f)
 
         logger.debug("Serialized %d arguments to INI string", len(vars(args)))
 
-        # Read the ini content
-        return f.read().decode("utf-8")
+        return f.getvalue()
 
 
 def prepare_args_for_data_input(args):
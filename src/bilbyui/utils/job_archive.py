@@ -0,0 +1,185 @@
+import hashlib
+import os
+import stat
+import tarfile
+from pathlib import Path
+
+# The name of the archive of all of an uploaded job's files, which is generated on the fly if it isn't stored
+JOB_ARCHIVE_NAME = "archive.tar.gz"
+
+# The size of the reads made from each file while streaming an archive
+_READ_SIZE = 1024 * 1024
+
+
+def _tarinfo(path, arcname):
+    """
+    Builds the TarInfo for a file in a job directory, leaving out anything that would make the archive differ between
+    servers, such as the owner of the file
+
+    :param path: The path to the file
+    :param arcname: The name of the file in the archive
+    :return: The TarInfo, or None if the file is not a directory, regular file or symlink
+    """
+    st = path.lstat()
+
+    info = tarfile.TarInfo(arcname)
+    info.mode = stat.S_IMODE(st.st_mode)
+    info.mtime = int(st.st_mtime)
+
+    if stat.S_ISDIR(st.st_mode):
+        info.type = tarfile.DIRTYPE
+    elif stat.S_ISLNK(st.st_mode):
+        info.type = tarfile.SYMTYPE
+        info.linkname = os.readlink(path)
+    elif stat.S_ISREG(st.st_mode):
+        info.type = tarfile.REGTYPE
+        info.size = st.st_size
+    else:
+        return None
+
+    return info
+
+
+def _header(info):
+    return info.tobuf(tarfile.GNU_FORMAT, "utf-8", "surrogateescape")
+
+
+def _padding(size):
+    return -size % tarfile.BLOCKSIZE
+
+
+def job_archive_members(job_dir, path=""):
+    """
+    Lists the members of the archive of a job directory, in the order they are written. Directories are sorted so
+    that the same files always give the same archive, any stored archive.tar.gz is left out, and members are named
+    like `tar -cf archive.tar.gz .` would name them
+
+    :param job_dir: The job directory
+    :param path: A normalised path relative to the job directory, to only archive the files under that directory
+    :return: A list of (TarInfo, path) tuples
+    """
+    job_dir = Path(job_dir)
+
+    members = []
+    for root, dirnames, filenames in os.walk(job_dir / path):
+        root = Path(root)
+        dirnames.sort()
+
+        relative_root = root.relative_to(job_dir)
+        arcname = "." if relative_root == Path() else f"./{relative_root.as_posix()}"
+        members.append((_tarinfo(root, arcname), root))
+
+        # os.walk doesn't descend in to symlinked directories, so they are archived as symlinks alongside the files
+        names = sorted([name for name in dirnames if (root / name).is_symlink()] + filenames)
+        for name in names:
+            if root == job_dir and name == JOB_ARCHIVE_NAME:
+                continue
+
+            info = _tarinfo(root / name, f"{arcname}/{name}")
+            if info is not None:
+                members.append((info, root / name))
+
+    return members
+
+
+def _member_size(info, header):
+    return len(header) + info.size + _padding(info.size)
+
+
+def _end_size(size):
+    # Two empty blocks mark the end of the archive, which is then padded to a whole record, as tarfile does
+    end = size + 2 * tarfile.BLOCKSIZE
+    return end + (-end % tarfile.RECORDSIZE) - size
+
+
+def job_archive_size(members):
+    """
+    Calculates the size of an archive without generating it
+
+    :param members: The members of the archive, from job_archive_members
+    :return: The size of the archive in bytes
+    """
+    size = sum(_member_size(info, _header(info)) for info, _ in members)
+    return size + _end_size(size)
+
+
+def job_archive_etag(members):
+    """
+    Generates an ETag for an archive, which changes if any member of the archive is added, removed, renamed or
+    modified, so that clients don't resume a download of an archive that has since changed
+
+    :param members: The members of the archive, from job_archive_members
+    :return: The ETag, without quotes
+    """
+    digest = hashlib.sha256()
+    for info, _ in members:
+        digest.update(_header(info))
+
+    return digest.hexdigest()
+
+
+def _stream_member(info, path, header, start, stop):
+    """
+    Generates the bytes from start to stop of a member of an archive, where 0 is the start of the member's header
+    """
+    if start < len(header):
+        yield header[start:stop]
+
+    # Offsets in to the content of the file, and then the padding after it
+    start = max(start - len(header), 0)
+    stop -= len(header)
+
+    content_stop = min(stop, info.size)
+    if info.type == tarfile.REGTYPE and start < content_stop:
+        remaining = content_stop - start
+        with path.open("rb") as f:
+            f.seek(start)
+            while remaining:
+                chunk = f.read(min(remaining, _READ_SIZE))
+                if not chunk:
+                    break
+
+                remaining -= len(chunk)
+                yield chunk
+
+        # Make up any bytes of a file that shrank since it was listed
+        if remaining:
+            yield tarfile.NUL * remaining
+
+    padding = stop - max(start, info.size)
+    if padding > 0:
+        yield tarfile.NUL * padding
+
+
+def stream_job_archive(members, start=0, stop=None):
+    """
+    Generates an uncompressed tar archive of a job directory in chunks, without writing it to disk. The generated
+    archive is always job_archive_size(members) bytes, even if a file changes size while it is being read, so that
+    any range of it can be generated on its own
+
+    :param members: The members of the archive, from job_archive_members
+    :param start: The offset of the first byte of the archive to generate
+    :param stop: The offset after the last byte of the archive to generate, or None to generate to the end
+    :return: A generator of byte chunks of the archive
+    """
+    offset = 0
+    for info, path in members:
+        header = _header(info)
+        member_size = _member_size(info, header)
+
+        if stop is not None and offset >= stop:
+            return
+
+        if offset + member_size > start:
+            member_stop = member_size if stop is None else min(stop - offset, member_size)
+            yield from _stream_member(info, path, header, max(start - offset, 0), member_stop)
+
+        offset += member_size
+
+    end_stop = offset + _end_size(offset)
+    if stop is not None:
+        end_stop = min(stop, end_stop)
+
+    end_start = max(start, offset)
+    if end_stop > end_start:
+        yield tarfile.NUL * (end_stop - end_start)
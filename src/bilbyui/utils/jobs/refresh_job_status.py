@@ -0,0 +1,67 @@
+import datetime
+import logging
+
+from bilbyui.constants import BilbyJobType
+from bilbyui.status import JobStatus
+from bilbyui.utils.derive_job_status import derive_job_status
+from bilbyui.utils.jobs.request_job_filter import request_job_filter
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_job_statuses(batch_size):
+    """
+    Updates the persisted status of every submitted job that hasn't reached a terminal state from the job controller
+
+    Jobs are requested from the job controller batch_size at a time. The sweep stops early if the job controller can't
+    be reached, the remaining jobs are picked up by the next sweep.
+
+    :param batch_size: The number of jobs to request from the job controller at a time
+    :return: A tuple (checked, updated) of the number of jobs checked and the number whose status changed
+    """
+    from bilbyui.models import BilbyJob
+
+    qs = (
+        BilbyJob.objects.filter(job_type=BilbyJobType.NORMAL, job_controller_id__isnull=False)
+        .exclude(status__in=JobStatus.TERMINAL_STATES)
+        .only("id", "job_controller_id", "status", "status_name", "status_time")
+        .order_by("id")
+    )
+
+    checked = 0
+    updated = 0
+    last_id = 0
+    while jobs := list(qs.filter(id__gt=last_id)[:batch_size]):
+        last_id = jobs[-1].id
+
+        # Job statuses aren't private, so the jobs are requested as the anonymous user as for public listings
+        status, result = request_job_filter(0, ids=[job.job_controller_id for job in jobs])
+        if status != "OK":
+            logger.error("Error refreshing job statuses, stopping after %d jobs", checked)
+            break
+
+        controller_jobs = {record["id"]: record for record in result if isinstance(record, dict) and "id" in record}
+
+        changed = []
+        for job in jobs:
+            controller_job = controller_jobs.get(job.job_controller_id)
+            if controller_job is None:
+                continue
+
+            state, status_name, timestamp = derive_job_status(controller_job.get("history"))
+            if timestamp is None:
+                continue
+
+            # The job controller history timestamps are in UTC
+            timestamp = timestamp.replace(tzinfo=datetime.UTC)
+            if (job.status, job.status_name, job.status_time) != (state, status_name, timestamp):
+                job.status, job.status_name, job.status_time = state, status_name, timestamp
+                changed.append(job)
+
+        # bulk_update skips save, so neither last_updated nor the search index are touched
+        BilbyJob.objects.bulk_update(changed, ["status", "status_name", "status_time"])
+
+        checked += len(jobs)
+        updated += len(changed)
+
+    return checked, updated
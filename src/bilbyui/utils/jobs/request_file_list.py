@@ -7,6 +7,7 @@ import requests
 from django.conf import settings
 
 from bilbyui.constants import BilbyJobType
+from bilbyui.utils.job_archive import JOB_ARCHIVE_NAME, job_archive_members, job_archive_size
 from bilbyui.utils.jobs.submit_job import _make_job_controller_request
 from bilbyui.utils.misc import check_request_leak
 
@@ -89,6 +90,17 @@ def request_file_list(job, path, recursive, user_id=None):
                         }
                     )
 
+        # Jobs which don't have a stored archive have it generated on the fly when it is downloaded, so list it too
+        archive_path = Path(job_dir, JOB_ARCHIVE_NAME)
+        if dir_path_obj == Path(job_dir) and not archive_path.exists():
+            file_list.append(
+                {
+                    "path": f"/{JOB_ARCHIVE_NAME}",
+                    "isDir": False,
+                    "fileSize": job_archive_size(job_archive_members(job_dir)),
+                }
+            )
+
         return True, file_list
 
     # Make sure that the job was actually submitted (Might be in a draft state?)
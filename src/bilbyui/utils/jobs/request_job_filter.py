@@ -2,7 +2,10 @@ import logging
 
 import requests
 from django.conf import settings
+from django.core.cache import caches
 
+from bilbyui.status import JobStatus
+from bilbyui.utils.derive_job_status import derive_job_status
 from bilbyui.utils.jobs.submit_job import _make_job_controller_request
 from bilbyui.utils.misc import check_request_leak_decorator
 
@@ -43,3 +46,47 @@ def request_job_filter(user_id, ids=None, end_time_gt=None):
             return "UNKNOWN", []
         logger.debug("Successfully retrieved %s jobs for user %s", len(result), user_id)
         return "OK", result
+
+
+def _job_cache_key(job_controller_id):
+    return f"bilbyui:job_controller_job:{job_controller_id}"
+
+
+def request_cached_job_filter(user_id, ids):
+    """
+    Fetches jobs from the job controller by id, serving them from the per process "local" cache where possible
+
+    Jobs that have reached a terminal state never change again, so are cached for JOB_STATUS_CACHE_TERMINAL_TTL seconds
+    (forever by default). Other jobs are cached for JOB_STATUS_CACHE_TTL seconds. Only jobs missing from the cache are
+    requested from the job controller, and no request is made at all if every job is cached.
+
+    :param user_id: The user id to make the request as
+    :param ids: A list of job controller ids to fetch
+    :return: A tuple of (status, result) where status is "OK" on success or "UNKNOWN" if the request for the uncached
+        jobs failed, and result is the list of jobs that were found
+    """
+    cache = caches["local"]
+    ids = list(dict.fromkeys(ids))
+
+    cached = cache.get_many([_job_cache_key(job_id) for job_id in ids])
+    jobs = {job_id: cached[_job_cache_key(job_id)] for job_id in ids if _job_cache_key(job_id) in cached}
+    missing_ids = [job_id for job_id in ids if job_id not in jobs]
+
+    status = "OK"
+    if missing_ids:
+        status, result = request_job_filter(user_id, ids=missing_ids)
+
+        wanted = set(missing_ids)
+        fetched = {job["id"]: job for job in result if isinstance(job, dict) and job.get("id") in wanted}
+        jobs.update(fetched)
+
+        terminal = {}
+        active = {}
+        for job_id, job in fetched.items():
+            state, _, _ = derive_job_status(job.get("history"))
+            (terminal if JobStatus.is_terminal(state) else active)[_job_cache_key(job_id)] = job
+
+        cache.set_many(terminal, settings.JOB_STATUS_CACHE_TERMINAL_TTL)
+        cache.set_many(active, settings.JOB_STATUS_CACHE_TTL)
+
+    return status, [jobs[job_id] for job_id in ids if job_id in jobs]
@@ -1,12 +1,16 @@
 import datetime
 import json
 import logging
+from unittest import mock
 
 import responses
 from django.conf import settings
+from django.core.cache import caches
 from django.test import SimpleTestCase, override_settings
 
-from bilbyui.utils.jobs.request_job_filter import request_job_filter
+from bilbyui.status import JobStatus
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.jobs.request_job_filter import request_cached_job_filter, request_job_filter
 
 
 @override_settings(ALLOW_HTTP_LEAKS=True)
@@ -100,3 +104,81 @@ class TestRequestJobFilter(SimpleTestCase):
         status, result = request_job_filter(123, ids=[1, 2], end_time_gt=end_time)
         self.assertEqual(status, "OK")
         self.assertEqual(result, jobs)
+
+
+def controller_job(job_id, state):
+    return {"id": job_id, "history": [{"state": state, "timestamp": "2020-01-01 00:00:00 UTC"}]}
+
+
+@override_settings(JOB_STATUS_CACHE_TTL=30, JOB_STATUS_CACHE_TERMINAL_TTL=None)
+class TestRequestCachedJobFilter(BilbyTestCase):
+    def setUp(self):
+        caches["local"].clear()
+
+    @mock.patch("bilbyui.utils.jobs.request_job_filter.request_job_filter")
+    def test_only_uncached_jobs_requested(self, request_job_filter_mock):
+        request_job_filter_mock.side_effect = lambda user_id, ids: (
+            "OK",
+            [controller_job(job_id, JobStatus.RUNNING) for job_id in ids],
+        )
+
+        status, result = request_cached_job_filter(1, ids=[10, 20])
+        self.assertEqual(status, "OK")
+        self.assertEqual([job["id"] for job in result], [10, 20])
+        request_job_filter_mock.assert_called_once_with(1, ids=[10, 20])
+
+        request_job_filter_mock.reset_mock()
+        status, result = request_cached_job_filter(2, ids=[20, 30])
+        self.assertEqual(status, "OK")
+        self.assertEqual([job["id"] for job in result], [20, 30])
+        request_job_filter_mock.assert_called_once_with(2, ids=[30])
+
+        request_job_filter_mock.reset_mock()
+        request_cached_job_filter(2, ids=[10, 20, 30])
+        request_job_filter_mock.assert_not_called()
+
+    @mock.patch("bilbyui.utils.jobs.request_job_filter.request_job_filter")
+    def test_ttl_depends_on_state(self, request_job_filter_mock):
+        request_job_filter_mock.return_value = (
+            "OK",
+            [controller_job(1, JobStatus.RUNNING), controller_job(2, JobStatus.COMPLETED), {"id": 3}],
+        )
+
+        with mock.patch.object(caches["local"], "set_many", wraps=caches["local"].set_many) as set_many_mock:
+            request_cached_job_filter(1, ids=[1, 2, 3])
+
+        timeouts = {key: call.args[1] for call in set_many_mock.call_args_list for key in call.args[0]}
+        self.assertEqual(
+            timeouts,
+            {
+                "bilbyui:job_controller_job:1": 30,
+                "bilbyui:job_controller_job:2": None,
+                "bilbyui:job_controller_job:3": 30,
+            },
+        )
+
+    @mock.patch("bilbyui.utils.jobs.request_job_filter.request_job_filter")
+    def test_cache_makes_no_database_queries(self, request_job_filter_mock):
+        request_job_filter_mock.return_value = (
+            "OK",
+            [controller_job(job_id, JobStatus.COMPLETED) for job_id in range(20)],
+        )
+
+        # Caching a page of jobs shouldn't cost a database transaction per job
+        with self.assertNumQueries(0):
+            request_cached_job_filter(1, ids=list(range(20)))
+            request_cached_job_filter(1, ids=list(range(20)))
+
+        request_job_filter_mock.assert_called_once()
+
+    @mock.patch("bilbyui.utils.jobs.request_job_filter.request_job_filter")
+    def test_failed_request_returns_cached_jobs(self, request_job_filter_mock):
+        request_job_filter_mock.return_value = ("OK", [controller_job(1, JobStatus.COMPLETED)])
+        request_cached_job_filter(1, ids=[1])
+
+        request_job_filter_mock.return_value = ("UNKNOWN", [])
+        status, result = request_cached_job_filter(1, ids=[1, 2])
+
+        self.assertEqual(status, "UNKNOWN")
+        self.assertEqual(result, [controller_job(1, JobStatus.COMPLETED)])
+        request_job_filter_mock.assert_called_with(1, ids=[2])
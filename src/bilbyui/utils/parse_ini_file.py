@@ -1,11 +1,54 @@
 import json
 import logging
 
+from bilbyui.utils.embargo import embargo_fields_from_ini_values
 from bilbyui.utils.ini_utils import bilby_ini_string_to_args
 
 logger = logging.getLogger(__name__)
 
 
+def _sync_ini_key_values(klass, job, items):
+    """
+    Brings the stored k/v pairs for a job in line with items, only touching rows that actually changed
+
+    Rows are matched on (processed, index, key), which is stable for a given bilby_pipe version since every argument is
+    always present in the parsed output. Matching rows with a different value are updated, unmatched existing rows are
+    deleted and unmatched new items are inserted.
+
+    :param klass: The IniKeyValue model class to use
+    :param job: The BilbyJob instance the k/v pairs belong to
+    :param items: The full list of unsaved IniKeyValue instances generated from the job's ini file
+    :return: Nothing
+    """
+    existing = {}
+    stale_ids = []
+    for row in klass.objects.filter(job=job):
+        identity = (row.processed, row.index, row.key)
+        if identity in existing:
+            stale_ids.append(row.id)
+        else:
+            existing[identity] = row
+
+    to_create = []
+    to_update = []
+    for item in items:
+        row = existing.pop((item.processed, item.index, item.key), None)
+        if row is None:
+            to_create.append(item)
+        elif row.value != item.value:
+            row.value = item.value
+            to_update.append(row)
+
+    stale_ids.extend(row.id for row in existing.values())
+
+    if stale_ids:
+        klass.objects.filter(id__in=stale_ids).delete()
+    if to_update:
+        klass.objects.bulk_update(to_update, ["value"])
+    if to_create:
+        klass.objects.bulk_create(to_create)
+
+
 def parse_ini_file(job, ini_key_value_klass=None):
     """
     Parses the ini file from a job and generates a full set of ini key/value model instances
@@ -22,9 +65,6 @@ def parse_ini_file(job, ini_key_value_klass=None):
 
     klass = ini_key_value_klass or IniKeyValue
 
-    # Clean up any existing k/v for this job
-    klass.objects.filter(job=job).delete()
-
     # Get the args from the ini
     args = bilby_ini_string_to_args((job.ini_string or "").encode("utf-8"))
 
@@ -57,4 +97,13 @@ def parse_ini_file(job, ini_key_value_klass=None):
     except Exception:
         logger.exception("Error parsing INI file for job %s", job.id)
 
-    klass.objects.bulk_create(items)
+    _sync_ini_key_values(klass, job, items)
+
+    # Keep the denormalised embargo columns in sync with the k/v pairs. Historical models from migrations that predate
+    # these columns don't have them, so skip the update in that case
+    if hasattr(job, "is_simulated"):
+        values = {(item.key, item.processed): item.value for item in items}
+        job.trigger_time, job.is_simulated = embargo_fields_from_ini_values(
+            values.get(("trigger_time", True)), values.get(("n_simulation", False))
+        )
+        type(job).objects.filter(pk=job.pk).update(trigger_time=job.trigger_time, is_simulated=job.is_simulated)
@@ -0,0 +1,39 @@
+import base64
+import binascii
+import json
+
+
+def encode_search_cursor(sort_values):
+    """
+    Encodes the sort values of an elastic search hit as an opaque cursor
+
+    :param sort_values: The "sort" list of the hit
+    :return: A url safe cursor string that decode_search_cursor turns back into the sort values
+    """
+    return base64.urlsafe_b64encode(json.dumps(sort_values, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def decode_search_cursor(cursor, length):
+    """
+    Decodes a cursor created by encode_search_cursor into search_after values for an elastic search query
+
+    :param cursor: The cursor string, or None
+    :param length: The number of sort values the query sorts on
+    :return: The list of sort values, or None if there is no cursor or it is malformed
+    """
+    if not cursor:
+        return None
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+
+    if (
+        not isinstance(values, list)
+        or len(values) != length
+        or not all(isinstance(value, int | float | str) and not isinstance(value, bool) for value in values)
+    ):
+        return None
+
+    return values
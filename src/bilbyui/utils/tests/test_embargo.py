@@ -7,6 +7,7 @@ from bilbyui.models import BilbyJob
 from bilbyui.tests.test_utils import create_test_ini_string
 from bilbyui.tests.testcases import BilbyTestCase
 from bilbyui.utils.embargo import (
+    embargo_fields_from_ini_values,
     embargo_filter,
     should_embargo_job,
     user_subject_to_embargo,
@@ -156,3 +157,16 @@ class TestEmbargoFilter(BilbyTestCase):
 
         self.user.authentication_methods = [AUTHENTICATION_METHODS["LIGO_SHIBBOLETH"]]
         self.assertQuerySetEqual(input_qs, embargo_filter(input_qs, self.user))
+
+
+class TestEmbargoFieldsFromIniValues(BilbyTestCase):
+    def test_values(self):
+        self.assertEqual(embargo_fields_from_ini_values("1126259462.4", "0"), (1126259462.4, False))
+        self.assertEqual(embargo_fields_from_ini_values("1.0", "2"), (1.0, True))
+
+    def test_missing_values(self):
+        self.assertEqual(embargo_fields_from_ini_values(None, None), (None, False))
+        self.assertEqual(embargo_fields_from_ini_values("null", "null"), (None, False))
+
+    def test_malformed_values(self):
+        self.assertEqual(embargo_fields_from_ini_values('"GW150914"', '"lots"'), (None, False))
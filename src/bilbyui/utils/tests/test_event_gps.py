@@ -0,0 +1,87 @@
+from io import StringIO
+from unittest import mock
+
+import requests
+from django.core.management import CommandError, call_command
+
+from bilbyui.models import EventID
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.event_gps import resolve_event_gps, warm_event_gps_cache
+
+ALLEVENTS = {
+    "events": {
+        "GW150914-v3": {"commonName": "GW150914", "GPS": 1126259462.4},
+        "GW170817-v3": {"commonName": "GW170817", "GPS": 1187008882.4},
+        "GW000000-v1": {"commonName": "GW000000"},
+    }
+}
+
+
+class TestResolveEventGps(BilbyTestCase):
+    @mock.patch("gwosc.datasets.event_gps")
+    def test_local_event_id(self, event_gps_mock):
+        EventID.create("GW123456_123456", 12345678.5)
+
+        self.assertEqual(resolve_event_gps("GW123456_123456"), 12345678.5)
+        event_gps_mock.assert_not_called()
+
+    @mock.patch("gwosc.datasets.event_gps")
+    def test_local_nickname(self, event_gps_mock):
+        EventID.create("GW123456_123456", 12345678.5, nickname="GW123456")
+
+        self.assertEqual(resolve_event_gps("GW123456"), 12345678.5)
+        event_gps_mock.assert_not_called()
+
+    @mock.patch("gwosc.datasets.event_gps", return_value=2.0)
+    def test_ambiguous_nickname_looked_up(self, event_gps_mock):
+        EventID.create("GW123456_123456", 1.0, nickname="GW123456")
+        EventID.create("GW123456_654321", 3.0, nickname="GW123456")
+
+        self.assertEqual(resolve_event_gps("GW123456"), 2.0)
+        event_gps_mock.assert_called_once_with("GW123456")
+
+    @mock.patch("gwosc.datasets.event_gps", return_value=1126259462.4)
+    def test_gwosc_lookup_cached(self, event_gps_mock):
+        self.assertEqual(resolve_event_gps("GW150914"), 1126259462.4)
+        self.assertEqual(resolve_event_gps("GW150914"), 1126259462.4)
+
+        event_gps_mock.assert_called_once_with("GW150914")
+
+    @mock.patch("gwosc.datasets.event_gps", side_effect=ValueError("unknown event"))
+    def test_unknown_event_cached(self, event_gps_mock):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                resolve_event_gps("NOT_A_REAL_EVENT")
+
+        event_gps_mock.assert_called_once_with("NOT_A_REAL_EVENT")
+
+    @mock.patch("gwosc.datasets.event_gps", side_effect=requests.ConnectionError("gwosc unavailable"))
+    def test_connection_error_not_cached(self, event_gps_mock):
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                resolve_event_gps("GW150914")
+
+        self.assertEqual(event_gps_mock.call_count, 2)
+
+
+class TestWarmEventGpsCache(BilbyTestCase):
+    @mock.patch("gwosc.api.fetch_allevents_json", return_value=ALLEVENTS)
+    @mock.patch("gwosc.datasets.event_gps")
+    def test_warmed_events_not_looked_up(self, event_gps_mock, fetch_mock):
+        self.assertEqual(warm_event_gps_cache(), 2)
+
+        self.assertEqual(resolve_event_gps("GW150914"), 1126259462.4)
+        self.assertEqual(resolve_event_gps("GW170817"), 1187008882.4)
+        event_gps_mock.assert_not_called()
+
+    @mock.patch("gwosc.api.fetch_allevents_json", return_value=ALLEVENTS)
+    def test_command(self, fetch_mock):
+        out = StringIO()
+        call_command("warm_event_gps_cache", stdout=out)
+
+        self.assertIn("Cached the GPS times of 2 events", out.getvalue())
+
+    @mock.patch("gwosc.api.fetch_allevents_json", side_effect=requests.ConnectionError("gwosc unavailable"))
+    def test_command_connection_error(self, fetch_mock):
+        with self.assertRaises(CommandError):
+            call_command("warm_event_gps_cache", stdout=StringIO())
@@ -1,7 +1,11 @@
 from decimal import Decimal
+from unittest import mock
 
+from bilbyui.models import BilbyJob
+from bilbyui.tests.test_utils import create_test_ini_string
 from bilbyui.tests.testcases import BilbyTestCase
-from bilbyui.utils.gen_parameter_output import to_dec
+from bilbyui.utils import gen_parameter_output
+from bilbyui.utils.gen_parameter_output import generate_parameter_output, to_dec
 
 
 class TestToDec(BilbyTestCase):
@@ -31,3 +35,75 @@ class TestToDec(BilbyTestCase):
         self.assertEqual(to_dec(float("inf")), Decimal("Infinity"))
         self.assertEqual(to_dec(float("-inf")), Decimal("-Infinity"))
         self.assertTrue(to_dec(float("nan")).is_nan())
+
+
+class TestGenerateParameterOutput(BilbyTestCase):
+    def setUp(self):
+        self.user = self.create_user()
+        self.job = BilbyJob.objects.create(
+            user_id=self.user.id,
+            name="Test1",
+            description="first job",
+            private=False,
+            ini_string=create_test_ini_string({"detectors": "['H1']"}),
+        )
+
+    def generate(self):
+        with mock.patch.object(
+            gen_parameter_output,
+            "_generate_parameter_sections",
+            wraps=gen_parameter_output._generate_parameter_sections,
+        ) as parse_mock:
+            output = generate_parameter_output(self.job)
+        return output, parse_mock.call_count
+
+    def test_parameters_cached(self):
+        first, parses = self.generate()
+        self.assertEqual(parses, 1)
+
+        second, parses = self.generate()
+        self.assertEqual(parses, 0)
+
+        self.assertEqual(second.detector.hanford, first.detector.hanford)
+        self.assertEqual(second.detector.duration, first.detector.duration)
+        self.assertEqual(second.sampler.sampler_choice, first.sampler.sampler_choice)
+        self.assertEqual(second.prior.prior_default, first.prior.prior_default)
+
+    def test_changed_ini_parsed_again(self):
+        self.generate()
+
+        self.job.ini_string = create_test_ini_string({"detectors": "['H1', 'L1']"})
+        self.job.save()
+        output, parses = self.generate()
+
+        self.assertEqual(parses, 1)
+        self.assertTrue(output.detector.livingston)
+
+    def test_job_without_ini_hash_cached(self):
+        BilbyJob.objects.filter(id=self.job.id).update(ini_hash="")
+        self.job.refresh_from_db()
+
+        self.generate()
+        output, parses = self.generate()
+
+        self.assertEqual(parses, 0)
+        self.assertTrue(output.detector.hanford)
+
+    def test_cache_version_parsed_again(self):
+        self.generate()
+
+        with mock.patch.object(gen_parameter_output, "PARAMETER_CACHE_VERSION", 2):
+            _, parses = self.generate()
+
+        self.assertEqual(parses, 1)
+
+    def test_details_not_cached(self):
+        self.generate()
+
+        self.job.name = "Renamed"
+        self.job.private = True
+        output, parses = self.generate()
+
+        self.assertEqual(parses, 0)
+        self.assertEqual(output.details.name, "Renamed")
+        self.assertTrue(output.details.private)
@@ -1,6 +1,16 @@
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from unittest import mock
+
+from bilby_pipe.input import Input
+from bilby_pipe.parser import create_parser
+from bilby_pipe.utils import parse_args
+
 from bilbyui.tests.test_utils import create_test_ini_string
 from bilbyui.tests.testcases import BilbyTestCase
-from bilbyui.utils.ini_utils import bilby_args_to_ini_string, bilby_ini_string_to_args
+from bilbyui.utils.ini_utils import bilby_args_to_ini_string, bilby_ini_string_to_args, default_prior_files
+
+REGRESSION_DATA = Path(__file__).resolve().parents[2] / "tests" / "regression_data"
 
 
 def _args_to_dict(args):
@@ -61,3 +71,72 @@ class TestIniUtils(BilbyTestCase):
         self.assertEqual(roundtrip_args.label, "my-custom-label")
         self.assertEqual(roundtrip_args.n_parallel, 4)
         self.assertEqual(roundtrip_args.pn_phase_order, 12345)
+
+
+def _file_ini_string_to_args(ini):
+    # Parses the ini the way bilby_pipe does from the command line, through a real file
+    with NamedTemporaryFile() as f:
+        f.write(ini)
+        f.flush()
+        args, _ = parse_args([f.name], create_parser())
+
+    delattr(args, "ini")
+    delattr(args, "verbose")
+    return args
+
+
+def _file_args_to_ini_string(args):
+    with NamedTemporaryFile() as f:
+        create_parser().write_to_file(f.name, args, overwrite=True)
+        return f.read().decode("utf-8")
+
+
+class TestIniUtilsParity(BilbyTestCase):
+    """
+    The in memory parser and writer should give exactly the same results as bilby_pipe's own file based ones
+    """
+
+    def corpus(self):
+        inis = [path.read_bytes() for path in sorted(REGRESSION_DATA.glob("*.ini"))]
+        inis += [
+            create_test_ini_string().encode("utf-8"),
+            create_test_ini_string({"label": "complete"}, complete=True).encode("utf-8"),
+            create_test_ini_string({"detectors": "['H1']", "n-simulation": 0, "sampler": "dynesty"}).encode("utf-8"),
+        ]
+        # Windows line endings are translated when reading a file, so must be when parsing in memory too
+        inis.append(inis[0].replace(b"\n", b"\r\n"))
+        return inis
+
+    def test_parse_parity(self):
+        for ini in self.corpus():
+            self.assertEqual(vars(bilby_ini_string_to_args(ini)), vars(_file_ini_string_to_args(ini)))
+
+    def test_write_parity(self):
+        for ini in self.corpus():
+            args = _file_ini_string_to_args(ini)
+            self.assertEqual(bilby_args_to_ini_string(args), _file_args_to_ini_string(args))
+
+    def test_accepts_str(self):
+        ini = create_test_ini_string({"label": "str-ini"})
+        self.assertEqual(vars(bilby_ini_string_to_args(ini)), vars(bilby_ini_string_to_args(ini.encode("utf-8"))))
+
+    def test_parsed_comments_not_written(self):
+        # Parsing stores the ini comments on the parser, they must not leak into inis written afterwards
+        ini = create_test_ini_string({"detectors": "['H1']"}) + "\nlabel=commented  # comment\n"
+        args = bilby_ini_string_to_args(ini.encode("utf-8"))
+
+        self.assertNotIn("# comment", bilby_args_to_ini_string(args))
+
+
+class TestDefaultPriorFiles(BilbyTestCase):
+    def test_matches_bilby_pipe(self):
+        self.assertEqual(default_prior_files(), frozenset(Input([], []).default_prior_files))
+        self.assertIn("4s", default_prior_files())
+
+    def test_looked_up_once(self):
+        default_prior_files()
+
+        with mock.patch.object(Input, "get_default_prior_files") as lookup_mock:
+            default_prior_files()
+
+        lookup_mock.assert_not_called()
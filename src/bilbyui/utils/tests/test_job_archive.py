@@ -0,0 +1,98 @@
+import io
+import tarfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.job_archive import job_archive_etag, job_archive_members, job_archive_size, stream_job_archive
+
+
+class TestJobArchive(BilbyTestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.job_dir = Path(self.temp_dir.name)
+
+        (self.job_dir / "data").mkdir()
+        (self.job_dir / "data" / "data.txt").write_bytes(b"d" * 1000)
+        (self.job_dir / "result").mkdir()
+        (self.job_dir / "result" / ("r" * 150 + ".hdf5")).write_bytes(b"r" * 513)
+        (self.job_dir / "results_page").mkdir()
+        (self.job_dir / "myjob_config_complete.ini").write_text("ini")
+        (self.job_dir / "data_link").symlink_to("data")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_archive(self, data):
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            return {member.name: tar.extractfile(member).read() if member.isfile() else member.type for member in tar}
+
+    def test_archive(self):
+        members = job_archive_members(self.job_dir)
+        data = b"".join(stream_job_archive(members))
+
+        self.assertEqual(len(data), job_archive_size(members))
+        self.assertEqual(len(data) % tarfile.RECORDSIZE, 0)
+
+        self.assertDictEqual(
+            self.read_archive(data),
+            {
+                ".": tarfile.DIRTYPE,
+                "./data_link": tarfile.SYMTYPE,
+                "./myjob_config_complete.ini": b"ini",
+                "./data": tarfile.DIRTYPE,
+                "./data/data.txt": b"d" * 1000,
+                "./result": tarfile.DIRTYPE,
+                f"./result/{'r' * 150}.hdf5": b"r" * 513,
+                "./results_page": tarfile.DIRTYPE,
+            },
+        )
+
+    def test_archive_is_deterministic(self):
+        first = b"".join(stream_job_archive(job_archive_members(self.job_dir)))
+        second = b"".join(stream_job_archive(job_archive_members(self.job_dir)))
+
+        self.assertEqual(first, second)
+
+    def test_stored_archive_skipped(self):
+        (self.job_dir / "archive.tar.gz").write_bytes(b"archive")
+        (self.job_dir / "data" / "archive.tar.gz").write_bytes(b"not the archive")
+
+        names = self.read_archive(b"".join(stream_job_archive(job_archive_members(self.job_dir))))
+
+        self.assertNotIn("./archive.tar.gz", names)
+        self.assertIn("./data/archive.tar.gz", names)
+
+    def test_changed_file_keeps_size(self):
+        members = job_archive_members(self.job_dir)
+
+        (self.job_dir / "data" / "data.txt").write_bytes(b"d" * 10)
+        (self.job_dir / "myjob_config_complete.ini").write_text("a much longer ini")
+
+        data = b"".join(stream_job_archive(members))
+
+        self.assertEqual(len(data), job_archive_size(members))
+
+        files = self.read_archive(data)
+        self.assertEqual(files["./data/data.txt"], b"d" * 10 + b"\0" * 990)
+        self.assertEqual(files["./myjob_config_complete.ini"], b"a m")
+
+    def test_subtree(self):
+        names = self.read_archive(b"".join(stream_job_archive(job_archive_members(self.job_dir, "data"))))
+
+        self.assertDictEqual(names, {"./data": tarfile.DIRTYPE, "./data/data.txt": b"d" * 1000})
+
+    def test_ranges(self):
+        members = job_archive_members(self.job_dir)
+        data = b"".join(stream_job_archive(members))
+
+        # Ranges starting and stopping in headers, file contents, padding and the end of the archive
+        for start, stop in [(0, 1), (100, 600), (512, 1536), (1500, 2600), (3000, len(data)), (len(data) - 1, None)]:
+            self.assertEqual(b"".join(stream_job_archive(members, start, stop)), data[start:stop])
+
+    def test_etag(self):
+        etag = job_archive_etag(job_archive_members(self.job_dir))
+        self.assertEqual(etag, job_archive_etag(job_archive_members(self.job_dir)))
+
+        (self.job_dir / "results_page" / "index.html").write_text("html")
+        self.assertNotEqual(etag, job_archive_etag(job_archive_members(self.job_dir)))
@@ -66,3 +66,18 @@ label=my-awesome-job"""
         self.assertEqual(
             IniKeyValue.objects.filter(job=self.job, key="label", value='"my-awesome-job"', processed=True).count(), 1
         )
+
+    def test_embargo_fields(self):
+        self.job.ini_string = create_test_ini_string({"detectors": "['H1']", "trigger-time": 12.5, "n-simulation": 0})
+        self.job.save()
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.trigger_time, 12.5)
+        self.assertFalse(self.job.is_simulated)
+
+        self.job.ini_string = create_test_ini_string({"detectors": "['H1']", "n-simulation": 1})
+        self.job.save()
+
+        self.job.refresh_from_db()
+        self.assertIsNone(self.job.trigger_time)
+        self.assertTrue(self.job.is_simulated)
@@ -4,7 +4,7 @@ from django.test import override_settings
 from bilbyui.models import BilbyJob, IniKeyValue
 from bilbyui.tests.test_utils import create_test_ini_string
 from bilbyui.tests.testcases import BilbyTestCase
-from bilbyui.utils.embargo import qs_embargo_filter
+from bilbyui.utils.embargo import job_passes_embargo_filter, qs_embargo_filter
 
 User = get_user_model()
 
@@ -146,3 +146,28 @@ class TestQsEmbargoFilter(BilbyTestCase):
 
         self.assertEqual(result.count(), 1)
         self.assertEqual(result.first().name, "processed trigger")
+
+    @override_settings(EMBARGO_START_TIME=5.0)
+    def test_filter_does_not_query_ini_key_values(self):
+        """The filter should use the denormalised BilbyJob columns rather than subqueries over IniKeyValue."""
+        self._create_job("early job", trigger_time=3.0, n_simulation=0)
+
+        sql = str(qs_embargo_filter(BilbyJob.objects.all()).query)
+
+        self.assertNotIn(IniKeyValue._meta.db_table, sql)
+
+    @override_settings(EMBARGO_START_TIME=5.0)
+    def test_job_passes_embargo_filter_matches_qs_embargo_filter(self):
+        """The in memory check should include exactly the jobs the queryset filter does."""
+        self._create_job("early real", trigger_time=1.0, n_simulation=0)
+        self._create_job("late real", trigger_time=10.0, n_simulation=0)
+        self._create_job("boundary real", trigger_time=5.0, n_simulation=0)
+        self._create_job("late sim", trigger_time=10.0, n_simulation=1)
+        self._create_job("sim no trigger", n_simulation=1)
+        self._create_job("real no trigger")
+
+        qs = BilbyJob.objects.all()
+        expected = set(qs_embargo_filter(qs).values_list("name", flat=True))
+
+        self.assertEqual({job.name for job in qs if job_passes_embargo_filter(job)}, expected)
+        self.assertEqual(expected, {"early real", "late sim", "sim no trigger"})
@@ -0,0 +1,29 @@
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.search_cursor import decode_search_cursor, encode_search_cursor
+
+
+class TestSearchCursor(BilbyTestCase):
+    def test_round_trip(self):
+        for values in [[1700000000000, 42], ["2024-01-01T00:00:00", 42], [1.5, "abc"]]:
+            self.assertEqual(decode_search_cursor(encode_search_cursor(values), 2), values)
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_search_cursor(["??>>??", 1])
+        self.assertRegex(cursor, r"^[A-Za-z0-9_=-]+$")
+
+    def test_no_cursor(self):
+        self.assertIsNone(decode_search_cursor(None, 2))
+        self.assertIsNone(decode_search_cursor("", 2))
+
+    def test_malformed_cursor(self):
+        self.assertIsNone(decode_search_cursor("not-a-valid-cursor", 2))
+        self.assertIsNone(decode_search_cursor("YXJyYXljb25uZWN0aW9uOjk5", 2))
+        self.assertIsNone(decode_search_cursor("é", 2))
+
+    def test_wrong_number_of_values(self):
+        self.assertIsNone(decode_search_cursor(encode_search_cursor([1]), 2))
+        self.assertIsNone(decode_search_cursor(encode_search_cursor([1, 2, 3]), 2))
+
+    def test_non_scalar_values(self):
+        for values in [{"a": 1}, [[1], 2], [None, 2], [True, 2]]:
+            self.assertIsNone(decode_search_cursor(encode_search_cursor(values), 2))
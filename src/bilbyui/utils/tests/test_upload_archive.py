@@ -0,0 +1,75 @@
+import io
+import tarfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.test import override_settings
+
+from bilbyui.tests.testcases import BilbyTestCase
+from bilbyui.utils.upload_archive import extract_upload_archive
+
+
+def create_archive(files):
+    """
+    Creates a tar.gz archive in memory from a dict of member name to content
+    """
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+    return data.getvalue()
+
+
+def chunk(data, size=7):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestExtractUploadArchive(BilbyTestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.destination = Path(self.temp_dir.name) / "job"
+        self.destination.mkdir()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_extract(self):
+        data = create_archive({"./data/test.txt": b"data", "result/test.txt": b"result", "test.ini": b"ini"})
+
+        self.assertEqual(extract_upload_archive(chunk(data), self.destination), 3)
+
+        self.assertEqual((self.destination / "data" / "test.txt").read_bytes(), b"data")
+        self.assertEqual((self.destination / "result" / "test.txt").read_bytes(), b"result")
+        self.assertEqual((self.destination / "test.ini").read_bytes(), b"ini")
+
+    def test_corrupt(self):
+        for data in [b"1234567abcdefg", create_archive({"test.ini": b"ini" * 1000})[:-100], b""]:
+            with self.assertRaisesMessage(ValueError, "Invalid or corrupt tar.gz file"):
+                extract_upload_archive(chunk(data), self.destination)
+
+    def test_path_traversal(self):
+        data = create_archive({"../outside.txt": b"outside"})
+
+        with self.assertRaisesMessage(ValueError, "Invalid or corrupt tar.gz file"):
+            extract_upload_archive(chunk(data), self.destination)
+
+        self.assertFalse((Path(self.temp_dir.name) / "outside.txt").exists())
+
+    @override_settings(JOB_UPLOAD_MAX_MEMBERS=2)
+    def test_max_members(self):
+        data = create_archive({"a": b"a", "b": b"b", "c": b"c"})
+
+        with self.assertRaisesMessage(ValueError, "Job upload should contain at most 2 files"):
+            extract_upload_archive(chunk(data), self.destination)
+
+    @override_settings(JOB_UPLOAD_MAX_UNPACKED_SIZE=10)
+    def test_max_unpacked_size(self):
+        data = create_archive({"a": b"a" * 6, "b": b"b" * 6})
+
+        with self.assertRaisesMessage(ValueError, "Job upload should be at most 10 bytes unpacked"):
+            extract_upload_archive(chunk(data), self.destination)
+
+        self.assertFalse((self.destination / "b").exists())
@@ -0,0 +1,66 @@
+import tarfile
+
+from django.conf import settings
+
+
+class _ChunkReader:
+    """
+    A minimal readable file object over an iterable of byte chunks
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+
+            self._buffer += chunk
+
+        if size < 0:
+            size = len(self._buffer)
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+def extract_upload_archive(chunks, destination):
+    """
+    Unpacks an uploaded tar.gz archive as it is read
+
+    The upload is never written to disk itself, only its unpacked contents. Members are extracted with tarfile's "data"
+    filter, which refuses absolute paths, paths or links that leave destination and special files. Uploads with more
+    than JOB_UPLOAD_MAX_MEMBERS members or more than JOB_UPLOAD_MAX_UNPACKED_SIZE bytes of content are refused.
+
+    :param chunks: An iterable of the byte chunks of the upload, such as UploadedFile.chunks()
+    :param destination: The directory to unpack the archive in to
+    :return: The number of members that were extracted
+    :raises ValueError: If the upload is not a valid tar.gz file, or exceeds the limits
+    """
+    members = 0
+    unpacked_size = 0
+
+    try:
+        with tarfile.open(fileobj=_ChunkReader(chunks), mode="r|gz") as tar:
+            for member in tar:
+                members += 1
+                unpacked_size += member.size
+
+                if members > settings.JOB_UPLOAD_MAX_MEMBERS:
+                    msg = f"Job upload should contain at most {settings.JOB_UPLOAD_MAX_MEMBERS} files"
+                    raise ValueError(msg)
+
+                if unpacked_size > settings.JOB_UPLOAD_MAX_UNPACKED_SIZE:
+                    msg = f"Job upload should be at most {settings.JOB_UPLOAD_MAX_UNPACKED_SIZE} bytes unpacked"
+                    raise ValueError(msg)
+
+                tar.extract(member, destination, filter="data")
+    except (tarfile.TarError, EOFError) as e:
+        msg = "Invalid or corrupt tar.gz file"
+        raise ValueError(msg) from e
+
+    return members
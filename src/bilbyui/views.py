@@ -2,35 +2,32 @@ import hashlib
 import json
 import logging
 import shutil
-import subprocess
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
+from urllib.parse import quote
 
-import bilby_pipe
 import requests
 from adacs_sso_plugin.models import APISessionToken
-from bilby_pipe.data_generation import DataGenerationInput
-from bilby_pipe.parser import create_parser
-from bilby_pipe.utils import convert_string_to_dict
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.files.uploadedfile import UploadedFile
 from django.db import IntegrityError, transaction
 from django.db.models import Count, Q
-from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.template.loader import render_to_string
 from django.template.response import TemplateResponse
 from django.urls import reverse
+from django.utils.http import content_disposition_header
 from django.views.decorators.http import require_GET, require_POST
 from graphql import GraphQLError
 from graphql_relay.node.node import from_global_id, to_global_id
-from gwosc.datasets import event_gps
 
 from .constants import BilbyJobType
 from .models import (
     BilbyJob,
+    BilbyPermissionError,
     EventID,
     ExternalBilbyJob,
     FileDownloadToken,
@@ -41,22 +38,45 @@ from .models import (
 )
 from .services.api_tokens import create_token, list_tokens, revoke_token, serialize_token
 from .services.event_ids import get_event_id, list_event_ids_for_user
-from .services.gwflow import list_gwflow_jobs
-from .services.jobs import _fetch_job_controller_jobs, get_job, list_public_jobs, list_user_jobs, update_job
+from .services.file_downloads import JOB_FILE, SUPPORTING_FILE, resolve_download_token
+from .services.gwflow import GWFLOW_JOBS_SORT, list_gwflow_jobs
+from .services.jobs import (
+    PUBLIC_JOBS_SORT,
+    _fetch_job_controller_jobs,
+    get_job,
+    list_public_jobs,
+    list_user_jobs,
+    update_job,
+)
 from .status import JobStatus
 from .types import GWFlowPendingFile
 from .utils.derive_job_status import derive_job_status
 from .utils.embargo import should_embargo_job
+from .utils.event_gps import resolve_event_gps
 from .utils.gen_parameter_output import generate_parameter_output
 from .utils.gwflow_es import gwflow_elastic_search_update
 from .utils.gwflow_es import update_child_job_ids as update_gwflow_child_job_ids
 from .utils.gwflow_portal import get_superevent, get_version, get_versions
-from .utils.ini_utils import bilby_args_to_ini_string, bilby_ini_string_to_args, prepare_args_for_data_input
+from .utils.ini_utils import (
+    bilby_args_to_ini_string,
+    bilby_ini_string_to_args,
+    default_prior_files,
+    prepare_args_for_data_input,
+)
+from .utils.job_archive import (
+    JOB_ARCHIVE_NAME,
+    job_archive_etag,
+    job_archive_members,
+    job_archive_size,
+    stream_job_archive,
+)
 from .utils.job_ref import resolve_job_ref_view
 from .utils.job_validation import validate_job_name
 from .utils.jobs.request_file_download_id import request_file_download_ids
-from .utils.jobs.request_job_filter import request_job_filter
+from .utils.jobs.request_job_filter import request_cached_job_filter
 from .utils.misc import es_section_dict, is_ligo_user
+from .utils.search_cursor import decode_search_cursor
+from .utils.upload_archive import extract_upload_archive
 
 logger = logging.getLogger(__name__)
 
@@ -103,8 +123,8 @@ def check_job_embargo_status(user, args):
         trigger_time = float(args.trigger_time)
     except ValueError:  # If trigger time is not able to be converted to a float
         try:
-            trigger_time = event_gps(args.trigger_time)  # Try to resolve event name to GPS time
-        except (ValueError, requests.RequestException):  # If event_gps cannot resolve the event or gwosc is unreachable
+            trigger_time = resolve_event_gps(args.trigger_time)  # Try to resolve event name to GPS time
+        except (ValueError, requests.RequestException):  # If the event cannot be resolved or gwosc is unreachable
             trigger_time = None
     except TypeError:
         trigger_time = None
@@ -130,7 +150,7 @@ def _parse_and_validate_ini(ini_content):
     return args
 
 
-def _create_bilby_job_record(user, details, args, job_type, ini_string=None):
+def _create_bilby_job_record(user, details, args, job_type, ini_string=None, event_id=None):
     """Create a BilbyJob record with common logic."""
     if ini_string is None:
         ini_string = bilby_args_to_ini_string(args)
@@ -149,6 +169,7 @@ def _create_bilby_job_record(user, details, args, job_type, ini_string=None):
         ini_string=ini_string,
         job_type=job_type,
         is_ligo_job=is_ligo_job,
+        event_id=event_id,
     )
 
     # Set official label for GWOSC ingest user
@@ -305,6 +326,9 @@ def create_bilby_job(user, params):
         "frequency-domain-source-model": frequency_domain_source_model,
     }
 
+    # bilby_pipe pulls in the scientific stack, so is only imported by the views that need it
+    from bilby_pipe.parser import create_parser
+
     # Create an argument parser
     parser = create_parser()
 
@@ -379,6 +403,8 @@ def parse_supporting_files(parser, args, prior_file, gps_file, timeslide_file, i
             if not psd_dict:
                 continue
 
+            from bilby_pipe.utils import convert_string_to_dict
+
             config = convert_string_to_dict(psd_dict, "psd-dict")
         elif config_name == "distance_marginalization_lookup_table":
             # Bilby pipe has a weird way to deal with default distance marginalisation tables. If the distance
@@ -433,6 +459,8 @@ def parse_supporting_files(parser, args, prior_file, gps_file, timeslide_file, i
 
 
 def bilby_ini_args_to_data_input(args):
+    from bilby_pipe.data_generation import DataGenerationInput
+
     # Strip the prior, gps, timeslide, and injection file
     # as DataGenerationInput has trouble without the actual file existing
     # Don't change the prior file if it's one of the defaults
@@ -443,7 +471,7 @@ def bilby_ini_args_to_data_input(args):
 
     prepare_args_for_data_input(args)
 
-    if args.prior_file not in bilby_pipe.main.Input([], []).default_prior_files:
+    if args.prior_file not in default_prior_files():
         args.prior_file = None
 
     return DataGenerationInput(args, [], create_data=False)
@@ -470,7 +498,7 @@ def create_bilby_job_from_ini_string(user, params):
 
     # Get the files for any supporting files if they exist
     prior_file = None
-    if args.prior_file not in bilby_pipe.main.Input([], []).default_prior_files:
+    if args.prior_file not in default_prior_files():
         prior_file = args.prior_file
 
     gps_file = args.gps_file
@@ -525,33 +553,14 @@ def upload_bilby_job(user, upload_token, details, job_file):
     # Check that the job upload directory exists
     Path(settings.JOB_UPLOAD_STAGING_DIR).mkdir(parents=True, exist_ok=True)
 
-    # Write out the uploaded job to disk and unpack the archive to a temporary staging directory
+    # Unpack the uploaded job to a temporary staging directory as it is read
     with (
         TemporaryDirectory(dir=settings.JOB_UPLOAD_STAGING_DIR) as job_staging_dir,
-        NamedTemporaryFile(dir=settings.JOB_UPLOAD_STAGING_DIR, suffix=".tar.gz") as job_upload_file,
         UploadedFile(job_file) as django_job_file,
     ):
-        # Write the uploaded file to the temporary file
-        for c in django_job_file.chunks():
-            job_upload_file.write(c)
-        job_upload_file.flush()
-
-        # Unpack the archive to the temporary directory
-        p = subprocess.Popen(
-            ["tar", "--no-same-owner", "-xvf", job_upload_file.name, "."],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=job_staging_dir,
-        )
-        out, err = p.communicate()
-
-        logger.info("Unpacking uploaded job archive %s had return code %s", job_file.name, p.returncode)
-        logger.debug("stdout: %s", out)
-        logger.debug("stderr: %s", err)
+        members = extract_upload_archive(django_job_file.chunks(), job_staging_dir)
 
-        if p.returncode != 0:
-            msg = "Invalid or corrupt tar.gz file"
-            raise ValueError(msg)
+        logger.info("Unpacked %s files from uploaded job archive %s", members, job_file.name)
 
         # Validate the directory structure, this should include 'data', 'result', and 'results_page' at minimum
         for directory in ["data", "result", "results_page"]:
@@ -593,7 +602,7 @@ def upload_bilby_job(user, upload_token, details, job_file):
 
         # Don't change the prior file if it's one of the defaults
         prior_file = None
-        if args.prior_file not in bilby_pipe.main.Input([], []).default_prior_files:
+        if args.prior_file not in default_prior_files():
             prior_file = args.prior_file
             args.prior_file = None
 
@@ -609,6 +618,8 @@ def upload_bilby_job(user, upload_token, details, job_file):
         psd_dict = args.psd_dict
         args.psd_dict = None
 
+        from bilby_pipe.data_generation import DataGenerationInput
+
         parser = DataGenerationInput(args, [], create_data=False)
 
         # Parse any supporting files
@@ -623,7 +634,6 @@ def upload_bilby_job(user, upload_token, details, job_file):
             # This is in an atomic block in case:-
             # * The ini file somehow ends up broken
             # * The final move of the staging directory to the job directory raises an exception (Disk full etc)
-            # * The generation of the archive.tar.gz file fails (Disk full etc)
 
             # Create the bilby job record
             bilby_job = _create_bilby_job_record(user, details, args, BilbyJobType.UPLOADED, ini_string)
@@ -655,34 +665,17 @@ def upload_bilby_job(user, upload_token, details, job_file):
                 supporting_file_instance = supporting_file_instances[supporting_file["download_token"]]
                 shutil.copyfile(source_file, supporting_file_dir / str(supporting_file_instance.id))
 
-            # Now we have the bilby job id, we can move the staging directory to the actual job directory
+            # Now we have the bilby job id, we can move the staging directory to the actual job directory. No
+            # archive.tar.gz file is stored, it is streamed from the job directory when it's downloaded
             job_dir = bilby_job.get_upload_directory()
             shutil.move(job_staging_dir, job_dir)
 
-            # Finally generate the archive.tar.gz file
-            p = subprocess.Popen(
-                ["tar", "-cvf", "archive.tar.gz", "."],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=job_dir,
-            )
-            out, err = p.communicate()
-
-            logger.info("Packing uploaded job archive for %s had return code %s", job_file.name, p.returncode)
-            logger.debug("stdout: %s", out)
-            logger.debug("stderr: %s", err)
-
-            if p.returncode != 0:
-                logger.error("Failed to repack uploaded job for user %s", user.id)
-                msg = "Unable to repack the uploaded job"
-                raise RuntimeError(msg)
-
         # Job is validated and uploaded, return the job
         logger.info("Successfully uploaded and created job %s for user %s", bilby_job.id, user.id)
         return bilby_job
 
 
-def upload_external_bilby_job(user, details, ini_file, result_url):
+def upload_external_bilby_job(user, details, ini_file, result_url, event_id=None):
     logger.info("User %s uploading external Bilby job: %s from %s", user.id, details.name, result_url)
 
     # Parse and validate the INI file
@@ -703,7 +696,7 @@ def upload_external_bilby_job(user, details, ini_file, result_url):
     prepare_args_for_data_input(args)
 
     # Don't change the prior file if it's one of the defaults
-    if args.prior_file not in bilby_pipe.main.Input([], []).default_prior_files:
+    if args.prior_file not in default_prior_files():
         args.prior_file = None
 
     args.gps_file = None
@@ -712,7 +705,7 @@ def upload_external_bilby_job(user, details, ini_file, result_url):
     args.psd_dict = None
 
     # Create the bilby job record
-    bilby_job = _create_bilby_job_record(user, details, args, BilbyJobType.EXTERNAL)
+    bilby_job = _create_bilby_job_record(user, details, args, BilbyJobType.EXTERNAL, event_id=event_id)
 
     # Create the relevant External Bilby Job record as well
     ExternalBilbyJob.objects.create(job=bilby_job, url=result_url)
@@ -721,6 +714,48 @@ def upload_external_bilby_job(user, details, ini_file, result_url):
     return bilby_job
 
 
+def upload_external_bilby_jobs(user, jobs):
+    """
+    Upload a batch of external bilby jobs in a single call.
+
+    Each job is created in its own savepoint so that a failure only affects that job. If a job
+    specifies an event_id it is attached when the job is created rather than with a later update.
+
+    Args:
+        user: The user uploading the jobs
+        jobs: An iterable of inputs with details, ini_file, result_url and an optional event_id
+
+    Returns:
+        list: A (bilby_job, error) tuple for each input job, in input order. Exactly one of the pair is None.
+    """
+    logger.info("User %s uploading %d external Bilby jobs", user.id, len(jobs))
+
+    results = []
+    for job in jobs:
+        try:
+            with transaction.atomic():
+                event_id = EventID.get_by_event_id(job.event_id, user) if job.event_id else None
+                bilby_job = upload_external_bilby_job(user, job.details, job.ini_file, job.result_url, event_id)
+        except EventID.DoesNotExist:
+            logger.warning("User %s uploading external job with unknown event id %s", user.id, job.event_id)
+            results.append((None, f"Event ID '{job.event_id}' not found."))
+        except BilbyPermissionError:
+            logger.warning("User %s uploading external job with LIGO event id %s", user.id, job.event_id)
+            results.append((None, f"You do not have permission to use event ID '{job.event_id}'."))
+        except (PermissionError, ValueError) as e:
+            # Validation and permission errors are raised with messages meant for the user
+            results.append((None, str(e)))
+        except Exception:
+            # Report the failure for this job and carry on with the rest of the batch. The details of unexpected errors
+            # are only logged, so that internal errors aren't sent to the client
+            logger.exception("Failed to upload external job %s for user %s", job.details.name, user.id)
+            results.append((None, "Failed to upload job"))
+        else:
+            results.append((bilby_job, None))
+
+    return results
+
+
 def upload_hdf5_bilby_job(user, upload_token, details, hdf5_file, ini_file):
     """
     Upload a bilby job with HDF5 result file and INI configuration file.
@@ -791,7 +826,7 @@ def upload_hdf5_bilby_job(user, upload_token, details, hdf5_file, ini_file):
         # For HDF5 uploads, these files don't actually exist as physical files
 
         # Don't change the prior file if it's one of the defaults
-        if args.prior_file not in bilby_pipe.main.Input([], []).default_prior_files:
+        if args.prior_file not in default_prior_files():
             args.prior_file = None
 
         args.gps_file = None
@@ -813,27 +848,11 @@ def upload_hdf5_bilby_job(user, upload_token, details, hdf5_file, ini_file):
             bilby_job.user = upload_token.user
             bilby_job.save()
 
-            # Move the staging directory to the actual job directory
+            # Move the staging directory to the actual job directory. No archive.tar.gz file is generated, it is
+            # streamed from the job directory when it's downloaded so that the result file is only written once
             job_dir = bilby_job.get_upload_directory()
             shutil.move(job_staging_dir, job_dir)
 
-            # Generate the archive.tar.gz file
-            p = subprocess.Popen(
-                ["tar", "-cvf", "archive.tar.gz", "."],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=job_dir,
-            )
-            out, err = p.communicate()
-
-            logger.info("Packing uploaded HDF5 job archive for %s had return code %s", job_name, p.returncode)
-            logger.info("stdout: %s", out)
-            logger.info("stderr: %s", err)
-
-            if p.returncode != 0:
-                msg = "Unable to repack the uploaded HDF5 job"
-                raise RuntimeError(msg)
-
         # Job is validated and uploaded, return the job
         return bilby_job
 
@@ -853,20 +872,129 @@ def file_download_job_file(request, fdl):
         raise Http404
 
     if not file_path.exists():
+        # Jobs which don't have a stored archive have it generated on the fly instead
+        if file_path == Path(job_dir) / JOB_ARCHIVE_NAME and Path(job_dir).is_dir():
+            return _job_archive_response(request, job_dir, "", JOB_ARCHIVE_NAME)
+
         raise Http404
 
+    return _file_download_response(request, file_path, file_path.name)
+
+
+def _file_download_response(request, file_path, filename):
+    """
+    Sends a file back to the client. If FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION is set, and the file is on external
+    storage, nginx is told to send the file with an X-Accel-Redirect so that a worker isn't tied up for the whole
+    download. Otherwise the file is streamed back by django
+
+    :param request: The request for the file, which has already been checked
+    :param file_path: The path to the file
+    :param filename: The filename of the file to send to the client
+    :return: The response
+    """
+    as_attachment = "forceDownload" in request.GET
+
+    if settings.FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION:
+        real_path = Path(file_path).resolve()
+        storage_path = Path(settings.EXTERNAL_STORAGE_PATH).resolve()
+
+        if real_path.is_relative_to(storage_path):
+            location = settings.FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION.rstrip("/")
+
+            response = HttpResponse(content_type="application/octet-stream")
+            response.headers["X-Accel-Redirect"] = f"{location}/{quote(real_path.relative_to(storage_path).as_posix())}"
+            response.headers["Content-Disposition"] = content_disposition_header(as_attachment, filename)
+            return response
+
+        logger.warning("Unable to offload download of %s, it is not on external storage", file_path)
+
     # Use a django file response object to stream the file back to the client
     return FileResponse(
-        file_path.open("rb"),
-        as_attachment="forceDownload" in request.GET,
-        filename=file_path.name,
+        Path(file_path).open("rb"),
+        as_attachment=as_attachment,
+        filename=filename,
         content_type="application/octet-stream",
     )
 
 
+def _parse_byte_range(range_header, size):
+    """
+    Parses a Range header for a single range of bytes. Any other Range header is ignored, and the whole file is sent
+
+    :param range_header: The value of the Range header
+    :param size: The size of the file in bytes
+    :return: A (start, stop) tuple of the range of bytes, or None if the header is ignored
+    :raises ValueError: If the range can't be satisfied
+    """
+    unit, _, byte_range = range_header.partition("=")
+    first, separator, last = byte_range.strip().partition("-")
+    if unit.strip() != "bytes" or not separator or not (first.isdigit() or last.isdigit()):
+        return None
+
+    if first.isdigit():
+        if last and (not last.isdigit() or int(last) < int(first)):
+            return None
+
+        start = int(first)
+        stop = min(int(last) + 1, size) if last else size
+    else:
+        # A suffix range, of the last bytes of the file
+        start = max(size - int(last), 0)
+        stop = size
+
+    if start >= stop:
+        msg = f"Unable to satisfy range {range_header} of {size} bytes"
+        raise ValueError(msg)
+
+    return start, stop
+
+
+def _job_archive_response(request, job_dir, path, filename):
+    """
+    Streams a tar archive of the files in a job directory, or a directory in it, without writing the archive to disk.
+    The archive is always generated the same way, so single byte ranges of it can be requested to resume a download
+
+    :param request: The request for the archive
+    :param job_dir: The job directory
+    :param path: A normalised path relative to the job directory, to only archive the files under that directory
+    :param filename: The filename of the archive to send to the client
+    :return: The response
+    """
+    members = job_archive_members(job_dir, path)
+    size = job_archive_size(members)
+    etag = f'"{job_archive_etag(members)}"'
+
+    start, stop, status = 0, size, 200
+
+    # Ranges are ignored if the client's copy of the archive is out of date, so that the whole archive is sent
+    range_header = request.headers.get("Range")
+    if range_header and request.headers.get("If-Range", etag) == etag:
+        try:
+            byte_range = _parse_byte_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+
+        if byte_range is not None:
+            (start, stop), status = byte_range, 206
+
+    response = StreamingHttpResponse(
+        stream_job_archive(members, start, stop), status=status, content_type="application/octet-stream"
+    )
+    response.headers["Content-Length"] = stop - start
+    response.headers["Accept-Ranges"] = "bytes"
+    response.headers["ETag"] = etag
+    response.headers["Content-Disposition"] = content_disposition_header("forceDownload" in request.GET, filename)
+    if status == 206:
+        response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+
+    return response
+
+
 def file_download_supporting_file(request, supporting_file):
     # Get the supporting file path
-    job_dir = Path(settings.SUPPORTING_FILE_UPLOAD_DIR) / str(supporting_file.job.id)
+    job_dir = Path(settings.SUPPORTING_FILE_UPLOAD_DIR) / str(supporting_file.job_id)
 
     # Make sure that there is no leading slash on the file path
     file_path = job_dir / str(supporting_file.id)
@@ -874,13 +1002,7 @@ def file_download_supporting_file(request, supporting_file):
     if not file_path.exists():
         raise Http404
 
-    # Use a django file response object to stream the file back to the client
-    return FileResponse(
-        file_path.open("rb"),
-        as_attachment="forceDownload" in request.GET,
-        filename=supporting_file.file_name,
-        content_type="application/octet-stream",
-    )
+    return _file_download_response(request, file_path, supporting_file.file_name)
 
 
 def file_download_gwflow_file(request, gwflow_file):
@@ -896,12 +1018,7 @@ def file_download_gwflow_file(request, gwflow_file):
     if not file_path.exists():
         raise Http404
 
-    return FileResponse(
-        file_path.open("rb"),
-        as_attachment="forceDownload" in request.GET,
-        filename=gwflow_file.file_name,
-        content_type="application/octet-stream",
-    )
+    return _file_download_response(request, file_path, gwflow_file.file_name)
 
 
 def file_download(request):
@@ -911,31 +1028,24 @@ def file_download(request):
         raise Http404
 
     try:
-        # First try the token as a file download token
-        fdl = FileDownloadToken.get_by_token(token)
-
-        # Was a file found with this token?
-        if fdl:
-            return file_download_job_file(request, fdl)
-
-        # Next try the token as a supporting file token
-        supporting_file = SupportingFile.get_by_download_token(token)
+        # Find the job file, supporting file or gwflow file this token is for
+        resolved = resolve_download_token(token)
+    except ValidationError as e:
+        logger.warning("ValidationError in file_download for token: %s", token)
+        raise Http404 from e
 
-        # Was a file found with this token?
-        if supporting_file:
-            return file_download_supporting_file(request, supporting_file)
+    # Was a file found with this token?
+    if resolved is None:
+        raise Http404
 
-        # Next try the token as a gwflow file token
-        gwflow_file = GWFlowFile.get_by_download_token(token)
+    kind, instance = resolved
+    if kind == JOB_FILE:
+        return file_download_job_file(request, instance)
 
-        # Was a file found with this token?
-        if gwflow_file:
-            return file_download_gwflow_file(request, gwflow_file)
+    if kind == SUPPORTING_FILE:
+        return file_download_supporting_file(request, instance)
 
-        raise Http404
-    except ValidationError as e:
-        logger.warning("ValidationError in file_download for token: %s", token)
-        raise Http404 from e
+    return file_download_gwflow_file(request, instance)
 
 
 def create_event_id(_user, event_id, gps_time, trigger_id=None, nickname=None, is_ligo_event=False):
@@ -1008,9 +1118,12 @@ def _event_id_display_values(event_id):
 
 def _job_status_name(bilby_job, job_controller_jobs):
     if bilby_job.job_type == BilbyJobType.NORMAL:
+        if bilby_job.has_terminal_status:
+            return bilby_job.status_name
+
         job_controller_job = job_controller_jobs.get(bilby_job.id)
         if job_controller_job is None or not job_controller_job.get("history"):
-            return "Unknown"
+            return bilby_job.status_name or "Unknown"
         _, status_name, _ = derive_job_status(job_controller_job["history"])
         return status_name
     elif bilby_job.job_type in (BilbyJobType.UPLOADED, BilbyJobType.EXTERNAL):
@@ -1141,11 +1254,13 @@ def public_jobs_view(request):
     search = request.GET.get("search", "")
     time_range = _normalize_time_range(request.GET.get("time_range", "all"))
 
+    # Infinite scroll pages on with the cursor of the last job on the previous page where there is one
     public_jobs_result = list_public_jobs(
         request.user,
         search=search,
         time_range=time_range,
         page=page,
+        search_after=decode_search_cursor(request.GET.get("cursor"), len(PUBLIC_JOBS_SORT)),
     )
 
     context = {
@@ -1155,6 +1270,7 @@ def public_jobs_view(request):
         "page": page,
         "has_next": public_jobs_result["has_next"],
         "next_page": page + 1,
+        "next_cursor": public_jobs_result.get("next_cursor"),
         "user": request.user,
         "jobs_list_url_name": "bilbyui:public_jobs",
     }
@@ -1175,6 +1291,7 @@ def gwflow_jobs_view(request):
         search=search,
         time_range=time_range,
         page=page,
+        search_after=decode_search_cursor(request.GET.get("cursor"), len(GWFLOW_JOBS_SORT)),
     )
 
     context = {
@@ -1184,6 +1301,7 @@ def gwflow_jobs_view(request):
         "page": page,
         "has_next": result["has_next"],
         "next_page": page + 1,
+        "next_cursor": result.get("next_cursor"),
         "user": request.user,
         "jobs_list_url_name": "bilbyui:gwflow_jobs",
         "list_target_id": "gwflow-job-list",
@@ -1340,8 +1458,11 @@ def _get_job_status_context(job, user):
     if job.job_type in (BilbyJobType.UPLOADED, BilbyJobType.EXTERNAL):
         status_name = JobStatus.display_name(JobStatus.COMPLETED)
         status_date = job.last_updated
+    elif job.has_terminal_status:
+        status_name = job.status_name
+        status_date = job.status_time.strftime("%Y-%m-%d %H:%M:%S UTC") if job.status_time else job.last_updated
     elif job.job_controller_id:
-        status, job_controller_jobs = request_job_filter(user.id, ids=[job.job_controller_id])
+        status, job_controller_jobs = request_cached_job_filter(user.id, ids=[job.job_controller_id])
         if status == "OK" and job_controller_jobs:
             controller_jobs = [record for record in job_controller_jobs if isinstance(record, dict)]
             if controller_jobs:
@@ -1730,6 +1851,29 @@ def file_download_redirect(request, job_id, token):
     return HttpResponseRedirect(f"{settings.GWCLOUD_JOB_CONTROLLER_API_URL}/file/?fileId={result[0]}")
 
 
+@login_required
+@resolve_job_ref_view
+@require_GET
+def job_archive_download(request, job_id):
+    job = _get_view_job_or_404(job_id, request.user)
+
+    # Only uploaded jobs have their files stored here, other jobs are downloaded from the job controller
+    if job.job_type != BilbyJobType.UPLOADED:
+        raise Http404
+
+    job_dir = Path(job.get_upload_directory()).resolve()
+
+    # An optional directory in the job to only download the files under, for example "result"
+    path = (job_dir / request.GET.get("path", "").lstrip("/")).resolve()
+    if not path.is_relative_to(job_dir) or not path.is_dir():
+        raise Http404
+
+    path = path.relative_to(job_dir)
+    filename = "_".join([job.name, *path.parts]) + ".tar"
+
+    return _job_archive_response(request, job_dir, path, filename)
+
+
 @login_required
 @require_GET
 def api_token_view(request):
@@ -1923,8 +2067,8 @@ def upsert_gwflow_job(user, params):
         # Reconcile GWFlowFile rows against the current manifest.
         removed = _reconcile_gwflow_files(job, getattr(params, "files", None))
 
-    # ES update runs outside the transaction so a connection error does not
-    # roll back the DB write.
+    # ES update is queued outside the transaction so invalid metadata JSON does
+    # not roll back the DB write.
     metadata_param = getattr(params, "metadata", None)
     if metadata_param:
         try:
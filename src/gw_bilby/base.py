@@ -183,12 +183,21 @@ UPLOAD_SUPPORTING_FILE_EXPIRY = 60 * 60 * 24
 # The expiry of FileDownloadTokens (in seconds)
 FILE_DOWNLOAD_TOKEN_EXPIRY = 60 * 60 * 24
 
+# The number of seconds between the prune_file_download_tokens command deleting expired FileDownloadTokens
+FILE_DOWNLOAD_TOKEN_PRUNE_INTERVAL = 60 * 60
+
 # The path to where external storage is mounted
 EXTERNAL_STORAGE_PATH = Path("/job_data")
 
 # Where uploaded jobs are staged (unpacked) for checking validity of uploaded jobs
 JOB_UPLOAD_STAGING_DIR = EXTERNAL_STORAGE_PATH / "staging"
 
+# The most members an uploaded job archive may contain (see bilbyui.utils.upload_archive.extract_upload_archive)
+JOB_UPLOAD_MAX_MEMBERS = 100000
+
+# The most bytes an uploaded job archive may unpack to (see bilbyui.utils.upload_archive.extract_upload_archive)
+JOB_UPLOAD_MAX_UNPACKED_SIZE = 100 * 1024**3
+
 # Where valid jobs are permanently stored
 JOB_UPLOAD_DIR = EXTERNAL_STORAGE_PATH / "jobs"
 
@@ -201,6 +210,11 @@ SUPPORTING_FILE_UPLOAD_DIR = EXTERNAL_STORAGE_PATH / "supporting_files"
 # Where mirrored gwflow files are permanently stored
 GWFLOW_FILE_UPLOAD_DIR = EXTERNAL_STORAGE_PATH / "gwflow"
 
+# The internal nginx location that serves EXTERNAL_STORAGE_PATH (see nginx/nginx.conf). When set, file_download
+# checks the download token and then has nginx send the file with an X-Accel-Redirect, rather than streaming it
+# through django (see bilbyui.views._file_download_response)
+FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION = None
+
 # Which clusters are able to be submitted to
 CLUSTERS = ["ozstar"]
 
@@ -213,6 +227,56 @@ ELASTIC_SEARCH_GWFLOW_INDEX = "gwcloud-gwflowjob"
 ELASTIC_SEARCH_HOST = "http://localhost:9200"
 ELASTIC_SEARCH_API_KEY = "very secure key"
 
+# Connection pool and retry behaviour of the shared elasticsearch client (see bilbyui.utils.es_client). Timeouts are in
+# seconds
+ELASTIC_SEARCH_CONNECTIONS_PER_NODE = 10
+ELASTIC_SEARCH_REQUEST_TIMEOUT = 10
+ELASTIC_SEARCH_MAX_RETRIES = 2
+ELASTIC_SEARCH_RETRY_ON_TIMEOUT = True
+
+# Optional dotted path to a callable(operation, index, duration, error) called with the latency of each elasticsearch
+# request, for example to feed a metrics backend
+ELASTIC_SEARCH_LATENCY_HOOK = None
+
+# Elasticsearch writes are queued in the ElasticSearchOutbox table and applied by the process_es_outbox command. The
+# maximum number of queued writes applied per bulk request, how many times elasticsearch can reject a write before it
+# is marked as dead, how long the worker sleeps when the outbox is empty, and the longest it backs off for when nothing
+# can be applied (in seconds)
+ELASTIC_SEARCH_OUTBOX_BATCH_SIZE = 500
+ELASTIC_SEARCH_OUTBOX_MAX_ATTEMPTS = 10
+ELASTIC_SEARCH_OUTBOX_POLL_INTERVAL = 5
+ELASTIC_SEARCH_OUTBOX_MAX_BACKOFF = 300
+# How long (in seconds) applied writes are kept in the outbox. es_ingest --reindex uses them to catch up on writes
+# made while it was running, so this must be longer than a reindex takes
+ELASTIC_SEARCH_OUTBOX_RETENTION = 7 * 24 * 60 * 60
+
+# User details from the auth service are cached by bilbyui.utils.auth.lookup_users.get_users. The number of users
+# requested from the auth service at a time, and how long (in seconds) found and unknown users are cached for
+USER_LOOKUP_BATCH_SIZE = 200
+USER_LOOKUP_CACHE_TTL = 60 * 60
+USER_LOOKUP_NEGATIVE_CACHE_TTL = 60 * 5
+
+# Jobs fetched from the job controller are cached by bilbyui.utils.jobs.request_job_filter.request_cached_job_filter.
+# How long (in seconds) jobs that are still in progress are cached for, and how long jobs that have reached a terminal
+# state are cached for (None caches them forever)
+JOB_STATUS_CACHE_TTL = 30
+JOB_STATUS_CACHE_TERMINAL_TTL = None
+
+# The parameters parsed from a job's ini are cached by bilbyui.utils.gen_parameter_output.generate_parameter_output.
+# How long (in seconds) they are cached for. Changing the ini changes the cache key, so this only limits how long
+# entries for old inis are kept
+JOB_PARAMETERS_CACHE_TTL = 60 * 60 * 24 * 7
+
+# The GPS times of events looked up from GWOSC are cached by bilbyui.utils.event_gps.resolve_event_gps. How long (in
+# seconds) found and unknown events are cached for. The warm_event_gps_cache command caches every GWOSC event at once
+EVENT_GPS_CACHE_TTL = 60 * 60 * 24 * 7
+EVENT_GPS_NEGATIVE_CACHE_TTL = 60 * 60
+
+# The refresh_job_status command updates the status stored on unfinished jobs from the job controller. The number of
+# jobs requested from the job controller at a time, and the number of seconds between sweeps
+JOB_STATUS_REFRESH_BATCH_SIZE = 200
+JOB_STATUS_REFRESH_INTERVAL = 60
+
 # cbcflow-portal API access (runtime on-demand metadata/history fetches; the
 # same service token the gwflow cron uses)
 CBCFLOW_PORTAL_URL = None
@@ -224,7 +288,15 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.db.DatabaseCache",
         "LOCATION": "gwflow_portal_cache",
         "TIMEOUT": 60 * 10,
-    }
+    },
+    # Per process cache for the user and job controller status lookups, which are read and written for every listing
+    # page. The database cache writes each key in its own transaction, which costs much of what these lookups save
+    "local": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "bilbyui-local",
+        "TIMEOUT": 60 * 10,
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    },
 }
 
 # Google Analytics tracking ID (gtag.js). Set in prod.py; None disables tracking.
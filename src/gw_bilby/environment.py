@@ -24,6 +24,8 @@ CLUSTERS = json.loads(os.getenv("CLUSTERS"))
 
 ADACS_SSO_CLIENT_SECRET = os.getenv("ADACS_SSO_CLIENT_SECRET")
 
+FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION = os.getenv("FILE_DOWNLOAD_ACCEL_REDIRECT_LOCATION") or None
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.mysql",